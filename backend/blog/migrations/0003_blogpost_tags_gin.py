@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from core.db.operations import AddJSONPathIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_auto_20261019_1620'),
+    ]
+
+    operations = [
+        AddJSONPathIndex(model_name='blogpost', field='tags', name='blogpost_tags_gin'),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from django.utils.text import slugify
+from core import slugs
 from django.utils import timezone
 import uuid
 
@@ -41,16 +41,18 @@ class BlogPost(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Blog Post'
         verbose_name_plural = 'Blog Posts'
+        indexes = [
+            # Posts by status (published, featured), newest first.
+            models.Index(fields=['status', '-created_at'], name='blogpost_status_recent_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
         if not self.authorName and self.author:
             self.authorName = f"{self.author.first_name} {self.author.last_name}".strip()
-        super().save(*args, **kwargs)
+        slugs.save_with_slug(self, self.title, super().save, *args, **kwargs)
 
 class BlogComment(models.Model):
     id = models.AutoField(primary_key=True)
@@ -66,6 +68,10 @@ class BlogComment(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Blog Comment'
         verbose_name_plural = 'Blog Comments'
+        indexes = [
+            # A post's comments, newest first.
+            models.Index(fields=['post', '-created_at'], name='blogcomment_post_recent_idx'),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author.username} on {self.post.title}"
@@ -1,7 +1,6 @@
 from rest_framework import serializers
 from .models import BlogPost, BlogComment, SavedPost
 from django.contrib.auth import get_user_model
-from django.utils.text import slugify
 from django.utils import timezone
 
 User = get_user_model()
@@ -38,10 +37,6 @@ class BlogPostSerializer(serializers.ModelSerializer):
             'readTime': {'required': False, 'default': 5}
         }
 
-    def create(self, validated_data):
-        validated_data['slug'] = slugify(validated_data['title'])
-        return super().create(validated_data)
-
 class BlogCommentSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
     
@@ -13,15 +13,27 @@ from .serializers import (
 from django.utils.text import slugify
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from core.batch import BatchRetrieveMixin
+from core.conditional import ConditionalGetMixin
+from core.listing import SparseFieldsMixin
 
-class BlogPostViewSet(viewsets.ModelViewSet):
+class BlogPostViewSet(BatchRetrieveMixin, ConditionalGetMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = BlogPost.objects.all()
     serializer_class = BlogPostSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    # Models nested in the responses, for the ETags.
+    conditional_dependencies = ['users.User', 'users.UserProfile']
+    # ?view=card
+    card_fields = ['id', 'title', 'slug', 'excerpt', 'imageUrl', 'tags', 'authorName', 'readTime', 'featured', 'created_at']
+    # The author and avatar of each post in a batch.
+    batch_select_related = ['author__profile']
 
     @swagger_auto_schema(
         tags=['Blog'],
-        operation_description="List all blog posts"
+        operation_description="List all blog posts",
+        manual_parameters=[
+            openapi.Parameter('tag', openapi.IN_QUERY, description="Only posts with this tag", type=openapi.TYPE_STRING),
+        ]
     )
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
@@ -91,6 +103,7 @@ class BlogPostViewSet(viewsets.ModelViewSet):
         status_param = self.request.query_params.get('status', None)
         featured_param = self.request.query_params.get('featured', None)
         search_param = self.request.query_params.get('search', None)
+        tag_param = self.request.query_params.get('tag', None)
         
         if status_param:
             queryset = queryset.filter(status=status_param)
@@ -102,8 +115,11 @@ class BlogPostViewSet(viewsets.ModelViewSet):
                 Q(title__icontains=search_param) |
                 Q(content__icontains=search_param) |
                 Q(excerpt__icontains=search_param) |
-                Q(tags__contains=[search_param])
+                Q(tags__array_contains=search_param)
             ).distinct()
+        if tag_param:
+            # Unlike search, served by the tags GIN index on PostgreSQL.
+            queryset = queryset.filter(tags__array_contains=tag_param)
         return queryset
 
     def perform_create(self, serializer):
@@ -168,7 +184,7 @@ class BlogPostViewSet(viewsets.ModelViewSet):
         post.save()
         return Response({'featured': post.featured})
 
-class BlogCommentViewSet(viewsets.ModelViewSet):
+class BlogCommentViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = BlogCommentSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
@@ -302,7 +318,7 @@ class BlogCommentViewSet(viewsets.ModelViewSet):
         comment.save()
         return Response({'message': 'Comment reported successfully'})
 
-class SavedPostViewSet(viewsets.ModelViewSet):
+class SavedPostViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = SavedPostSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -29,9 +29,10 @@ class BookingCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Booking
         fields = [
-            'event', 'business', 'package', 'number_of_people',
+            'id', 'event', 'business', 'package', 'number_of_people',
             'special_requests', 'status'
         ]
+        read_only_fields = ['id']
 
     def validate(self, data):
         if ('event' in data and 'business' in data) or ('event' in data and 'package' in data) or ('business' in data and 'package' in data):
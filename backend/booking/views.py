@@ -12,8 +12,10 @@ from .serializers import (
 from .permissions import IsBookingOwner, IsPaymentOwner, IsReviewOwner
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from core.listing import SparseFieldsMixin
+from core.renderers import StreamingJSONResponse
 
-class BookingViewSet(viewsets.ModelViewSet):
+class BookingViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = BookingListSerializer
     permission_classes = [IsAuthenticated]
 
@@ -144,7 +146,7 @@ class BookingViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
-class PaymentViewSet(viewsets.ModelViewSet):
+class PaymentViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = PaymentSerializer
     permission_classes = [IsAuthenticated]
 
@@ -154,7 +156,7 @@ class PaymentViewSet(viewsets.ModelViewSet):
         return Payment.objects.filter(booking__user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(booking__user=self.request.user)
+        serializer.save()
 
     @swagger_auto_schema(
         tags=['Booking'],
@@ -187,11 +189,17 @@ class PaymentViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'])
     def history(self, request):
-        queryset = self.get_queryset().order_by('-created_at')
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # Every payment, unpaginated: streamed rather than built in memory.
+        queryset = self.get_queryset().select_related(
+            'booking__user', 'booking__event', 'booking__business', 'booking__package__organizer',
+        ).order_by('-created_at')
+        serializer = self.get_serializer()
+        return StreamingJSONResponse(
+            (serializer.to_representation(payment) for payment in queryset.iterator(chunk_size=500)),
+            request=request,
+        )
 
-class BookingReviewViewSet(viewsets.ModelViewSet):
+class BookingReviewViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = BookingReviewSerializer
     permission_classes = [IsAuthenticated]
 
@@ -201,7 +209,7 @@ class BookingReviewViewSet(viewsets.ModelViewSet):
         return BookingReview.objects.filter(booking__user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(booking__user=self.request.user)
+        serializer.save()
 
     @swagger_auto_schema(
         tags=['Booking'],
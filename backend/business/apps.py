@@ -6,4 +6,4 @@ class BusinessConfig(AppConfig):
     verbose_name = 'Business Directory'
 
     def ready(self):
-        import business.signals  # noqa 
\ No newline at end of file
+        import business.signals  # noqa
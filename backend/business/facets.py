@@ -0,0 +1,8 @@
+from core.facets import Facets, FieldFacet
+
+BUSINESS_FACETS = Facets(
+    'business.Business',
+    FieldFacet('business_type'),
+    FieldFacet('region'),
+    FieldFacet('city'),
+)
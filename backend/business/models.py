@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from django.utils.text import slugify
+from core import slugs
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 import json
@@ -73,20 +73,13 @@ class Business(models.Model):
         ]
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-            original_slug = self.slug
-            counter = 1
-            while Business.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
         # Cast longitude and latitude to 6 decimal places if they are not None
         if self.latitude is not None:
             self.latitude = round(float(self.latitude), 6)
         if self.longitude is not None:
             self.longitude = round(float(self.longitude), 6)
         
-        super().save(*args, **kwargs)
+        slugs.save_with_slug(self, self.name, super().save, *args, **kwargs)
 
     def __str__(self):
         return self.name
@@ -23,6 +23,7 @@ urlpatterns = [
     
     # Business actions
     path('businesses/featured/', BusinessViewSet.as_view({'get': 'featured'}), name='business-featured'),
+    path('businesses/facets/', BusinessViewSet.as_view({'get': 'facets'}), name='business-facets'),
     path('businesses/my-businesses/', BusinessViewSet.as_view({'get': 'my_businesses'}), name='my-businesses'),
     path('businesses/<int:pk>/toggle-featured/', BusinessViewSet.as_view({'post': 'toggle_featured'}), name='business-toggle-featured'),
     path('businesses/<int:pk>/verify/', BusinessViewSet.as_view({'post': 'verify'}), name='business-verify'),
@@ -59,6 +60,7 @@ urlpatterns = [
 # PATCH /api/business/businesses/{id}/ - Partially update a specific business
 # DELETE /api/business/businesses/{id}/ - Delete a specific business
 # GET /api/business/businesses/featured/ - List featured businesses
+# GET /api/business/businesses/facets/ - Counts per type, region and city for the list's filters
 # GET /api/business/businesses/my_businesses/ - List user's businesses
 # POST /api/business/businesses/{id}/toggle_featured/ - Toggle featured status (admin only)
 # POST /api/business/businesses/{id}/verify/ - Verify a business (admin only)
@@ -12,10 +12,24 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.utils import timezone
 from .permissions import IsBusinessOwnerOrReadOnly, IsReviewOwnerOrReadOnly
+from .facets import BUSINESS_FACETS
+from core.facets import response_schema
+from core.batch import BatchRetrieveMixin
+from core.conditional import ConditionalGetMixin
+from core.listing import SparseFieldsMixin, ValuesListMixin
 
-class BusinessViewSet(viewsets.ModelViewSet):
+class BusinessViewSet(BatchRetrieveMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Business.objects.all()
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsBusinessOwnerOrReadOnly]
+    filterset_fields = ['status', 'business_type', 'region', 'city']
+    search_fields = ['name', 'description']
+    # Models nested in the responses, for the ETags.
+    conditional_dependencies = ['business.BusinessReview', 'users.User']
+    # ?view=card
+    card_fields = [
+        'id', 'name', 'slug', 'business_type', 'region', 'city', 'main_image', 'average_rating',
+        'total_reviews', 'is_verified', 'is_featured',
+    ]
 
     def get_permissions(self):
         if self.action in ['verify', 'toggle_featured']:
@@ -121,6 +135,16 @@ class BusinessViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(featured_businesses, many=True)
         return Response(serializer.data)
 
+    @swagger_auto_schema(
+        tags=['Business'],
+        operation_description="Counts of businesses per type, region and city, for the same filters as the list",
+        responses={200: response_schema(BUSINESS_FACETS)}
+    )
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(BUSINESS_FACETS.for_request(queryset, request))
+
     @swagger_auto_schema(
         tags=['Businessmetal'],
         operation_description="List user's businesses",
@@ -187,7 +211,7 @@ class BusinessViewSet(viewsets.ModelViewSet):
             'verification_date': business.verification_date
         })
 
-class BusinessReviewViewSet(viewsets.ModelViewSet):
+class BusinessReviewViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = BusinessReviewSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsReviewOwnerOrReadOnly]
 
@@ -277,7 +301,7 @@ class BusinessReviewViewSet(viewsets.ModelViewSet):
         review.save()
         return Response({'helpful_votes': review.helpful_votes})
 
-class SavedBusinessViewSet(viewsets.ModelViewSet):
+class SavedBusinessViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = SavedBusinessSerializer
     permission_classes = [permissions.IsAuthenticated]
 
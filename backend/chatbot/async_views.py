@@ -0,0 +1,39 @@
+"""Async versions of chatbot endpoints, routed in when ASYNC_VIEWS is on."""
+import logging
+
+from asgiref.sync import sync_to_async
+from rest_framework import status
+
+from core.asyncviews import async_action, respond
+from . import gemini
+from .models import Message
+from .serializers import ChatMessageSerializer
+from .views import ChatbotViewSet, open_conversation, save_reply
+
+logger = logging.getLogger(__name__)
+
+
+def _start(user, message, session_id):
+    conversation = open_conversation(user, session_id)
+    Message.objects.create(conversation=conversation, content=message, sender='user')
+    logger.debug(f"Saved user message: {message[:50]}")
+    return conversation, gemini.build_history(conversation, message)
+
+
+@async_action(ChatbotViewSet, 'message')
+async def message(view, request):
+    """ChatbotViewSet.message, awaiting Gemini instead of blocking a thread."""
+    serializer = ChatMessageSerializer(data=request.data)
+    if not serializer.is_valid():
+        logger.warning(f"Invalid request data: {serializer.errors}")
+        return await respond(view, {'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    conversation, history = await sync_to_async(_start)(
+        request.user, serializer.validated_data['message'], serializer.validated_data.get('session_id')
+    )
+    try:
+        bot_response = await gemini.generate_async(history)
+        logger.info("Successfully generated Gemini response")
+    except Exception as e:
+        bot_response = gemini.error_reply(e)
+    return await respond(view, await sync_to_async(save_reply)(conversation, bot_response))
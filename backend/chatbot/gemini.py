@@ -0,0 +1,124 @@
+"""
+The Gemini SDK, imported and configured on first use.
+
+Importing google.generativeai takes about half a second and pulls in much of
+IPython, so it is kept out of URLconf loading and worker start-up.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+MODEL = 'gemini-1.5-flash'
+SYSTEM_PROMPT = """You are an AI travel assistant specializing in Ethiopian tourism. 
+                        Provide helpful and accurate information about Ethiopia, focusing on:
+                        - Tourist attractions and destinations
+                        - Cultural experiences
+                        - Travel tips and recommendations
+                        - Local customs and traditions"""
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.95,
+    "top_k": 40,
+    "max_output_tokens": 1024,
+}
+
+_lock = threading.Lock()
+_genai = None
+
+
+def client():
+    """The configured google.generativeai module."""
+    global _genai
+    if _genai is None:
+        with _lock:
+            if _genai is None:
+                import google.generativeai as genai
+
+                # GEMINI_API_ENDPOINT redirects calls elsewhere over REST, e.g.
+                # to the local fake used by the load tests (loadtest/fake_gemini.py).
+                options = {}
+                if settings.GEMINI_API_ENDPOINT:
+                    options = {
+                        'transport': 'rest',
+                        'client_options': {'api_endpoint': settings.GEMINI_API_ENDPOINT},
+                    }
+                genai.configure(api_key=settings.GEMINI_API_KEY, **options)
+                logger.info("Gemini API configured successfully")
+                _genai = genai
+    return _genai
+
+
+def build_history(conversation, message):
+    """The prompt: system instruction, the conversation so far, then message."""
+    history = [{"role": "model", "parts": [SYSTEM_PROMPT]}] + [
+        {"role": "user" if msg.sender == "user" else "model", "parts": [msg.content]}
+        for msg in conversation.messages.all().order_by('created_at')
+    ]
+    history.append({"role": "user", "parts": [message]})
+    return history
+
+
+class _timed:
+    """Record the call in CHATBOT_UPSTREAM_LATENCY, labelled by outcome."""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb):
+        outcome = 'error' if exc_type else 'success'
+        metrics.CHATBOT_UPSTREAM_LATENCY.labels(outcome).observe(time.perf_counter() - self.start)
+
+
+def generate(history):
+    model = client().GenerativeModel(MODEL)
+    with _timed():
+        response = model.generate_content(history, generation_config=GENERATION_CONFIG)
+    return response.text
+
+
+async def generate_async(history):
+    from core.asyncviews import run_blocking
+
+    # The first call imports the SDK; keep that off the event loop.
+    genai = _genai or await run_blocking(client)
+    model = genai.GenerativeModel(MODEL)
+    with _timed():
+        if settings.GEMINI_API_ENDPOINT:
+            # The SDK's async client only speaks gRPC; the REST transport
+            # used for custom endpoints blocks, so it waits on a thread.
+            response = await run_blocking(model.generate_content, history, generation_config=GENERATION_CONFIG)
+        else:
+            response = await model.generate_content_async(history, generation_config=GENERATION_CONFIG)
+    return response.text
+
+
+def error_reply(exc):
+    """The reply shown in place of an answer when the call failed."""
+    if isinstance(exc, api_errors()):
+        logger.error(f"Gemini API error: {str(exc)}")
+        return f"Error with the chatbot service: {str(exc)}. Please try again later."
+    logger.error(f"Unexpected error: {str(exc)}")
+    return f"Sorry, I encountered an error: {str(exc)}. Please try again later."
+
+
+def api_errors():
+    """Exception classes raised by the Gemini API client."""
+    from google.api_core import exceptions
+
+    return exceptions.GoogleAPIError
+
+
+@receiver(setting_changed)
+def _reconfigure(setting, **kwargs):
+    global _genai
+    if setting in ('GEMINI_API_KEY', 'GEMINI_API_ENDPOINT'):
+        with _lock:
+            _genai = None
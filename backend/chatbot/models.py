@@ -29,6 +29,10 @@ class Message(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # A conversation's messages in order, for the history and the prompt.
+            models.Index(fields=['conversation', 'created_at'], name='message_conversation_time_idx'),
+        ]
 
     def __str__(self):
         return f"{self.sender}: {self.content[:50]}"
\ No newline at end of file
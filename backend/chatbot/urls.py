@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import ChatbotViewSet
@@ -9,4 +10,9 @@ router.register('', ChatbotViewSet, basename='chatbot')
 
 urlpatterns = [
     path('', include(router.urls)),
-] 
\ No newline at end of file
+]
+
+if settings.ASYNC_VIEWS:
+    from . import async_views
+
+    urlpatterns.insert(0, path('message/', async_views.message, name='chatbot-message')) 
\ No newline at end of file
@@ -1,26 +1,67 @@
 import logging
 import uuid
-import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
-from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from . import gemini
 from .models import Conversation, Message
 from .serializers import ConversationSerializer, MessageSerializer, ChatMessageSerializer
 
 logger = logging.getLogger(__name__)
 
-# Configure Gemini API
-try:
-    genai.configure(api_key=settings.GEMINI_API_KEY)
-    logger.info("Gemini API configured successfully")
-except Exception as e:
-    logger.error(f"Error configuring Gemini API: {str(e)}")
-    raise ValueError("Failed to configure Gemini API. Check GEMINI_API_KEY.")
+
+def open_conversation(user, session_id):
+    """The user's conversation for session_id, or a new one."""
+    if session_id:
+        try:
+            conversation = Conversation.objects.get(session_id=session_id)
+            if conversation.user != user:
+                logger.warning(f"Attempted access to session_id {session_id} owned by another user")
+                # Create new conversation with new UUID
+                session_id = str(uuid.uuid4())
+                conversation = Conversation.objects.create(
+                    session_id=session_id,
+                    user=user
+                )
+                logger.info(f"Created new conversation with session_id: {session_id}")
+            else:
+                logger.info(f"Continuing existing conversation with session_id: {session_id}")
+        except Conversation.DoesNotExist:
+            # Create new conversation with provided session_id
+            conversation = Conversation.objects.create(
+                session_id=session_id,
+                user=user
+            )
+            logger.info(f"Created new conversation with provided session_id: {session_id}")
+    else:
+        # Create new conversation with random session_id
+        session_id = str(uuid.uuid4())
+        conversation = Conversation.objects.create(
+            session_id=session_id,
+            user=user
+        )
+        logger.info(f"Created new conversation with generated session_id: {session_id}")
+    return conversation
+
+
+def save_reply(conversation, bot_response):
+    """Store the bot's reply; returns the response body."""
+    bot_message = Message.objects.create(
+        conversation=conversation,
+        content=bot_response,
+        sender='bot'
+    )
+    logger.debug(f"Saved bot response: {bot_response[:50]}")
+    return {
+        'session_id': conversation.session_id,
+        'response': {
+            'content': bot_response,
+            'timestamp': bot_message.created_at
+        }
+    }
 
 class ChatbotViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
@@ -73,36 +114,7 @@ class ChatbotViewSet(viewsets.ViewSet):
         message = serializer.validated_data['message']
         session_id = serializer.validated_data.get('session_id')
 
-        # Handle conversation
-        if session_id:
-            try:
-                conversation = Conversation.objects.get(session_id=session_id)
-                if conversation.user != request.user:
-                    logger.warning(f"Attempted access to session_id {session_id} owned by another user")
-                    # Create new conversation with new UUID
-                    session_id = str(uuid.uuid4())
-                    conversation = Conversation.objects.create(
-                        session_id=session_id,
-                        user=request.user
-                    )
-                    logger.info(f"Created new conversation with session_id: {session_id}")
-                else:
-                    logger.info(f"Continuing existing conversation with session_id: {session_id}")
-            except Conversation.DoesNotExist:
-                # Create new conversation with provided session_id
-                conversation = Conversation.objects.create(
-                    session_id=session_id,
-                    user=request.user
-                )
-                logger.info(f"Created new conversation with provided session_id: {session_id}")
-        else:
-            # Create new conversation with random session_id
-            session_id = str(uuid.uuid4())
-            conversation = Conversation.objects.create(
-                session_id=session_id,
-                user=request.user
-            )
-            logger.info(f"Created new conversation with generated session_id: {session_id}")
+        conversation = open_conversation(request.user, session_id)
 
         # Save user message
         user_message = Message.objects.create(
@@ -114,20 +126,7 @@ class ChatbotViewSet(viewsets.ViewSet):
 
         # Get bot response
         bot_response = self.get_gemini_response(conversation, message)
-        bot_message = Message.objects.create(
-            conversation=conversation,
-            content=bot_response,
-            sender='bot'
-        )
-        logger.debug(f"Saved bot response: {bot_response[:50]}")
-
-        return Response({
-            'session_id': conversation.session_id,
-            'response': {
-                'content': bot_response,
-                'timestamp': bot_message.created_at
-            }
-        })
+        return Response(save_reply(conversation, bot_response))
 
     @swagger_auto_schema(
         tags=['Chatbot'],
@@ -190,41 +189,8 @@ class ChatbotViewSet(viewsets.ViewSet):
 
     def get_gemini_response(self, conversation, message):
         try:
-            model = genai.GenerativeModel('gemini-1.5-flash')
-            # Build conversation history with system instruction as first message
-            history = [
-                {
-                    "role": "model",
-                    "parts": [
-                        """You are an AI travel assistant specializing in Ethiopian tourism. 
-                        Provide helpful and accurate information about Ethiopia, focusing on:
-                        - Tourist attractions and destinations
-                        - Cultural experiences
-                        - Travel tips and recommendations
-                        - Local customs and traditions"""
-                    ]
-                }
-            ] + [
-                {"role": "user" if msg.sender == "user" else "model", "parts": [msg.content]}
-                for msg in conversation.messages.all().order_by('created_at')
-            ]
-            # Add current user message
-            history.append({"role": "user", "parts": [message]})
-            response = model.generate_content(
-                history,
-                generation_config={
-                    "temperature": 0.7,
-                    "top_p": 0.95,
-                    "top_k": 40,
-                    "max_output_tokens": 1024,
-                }
-            )
+            bot_response = gemini.generate(gemini.build_history(conversation, message))
             logger.info("Successfully generated Gemini response")
-            return response.text
-
-        except google_exceptions.GoogleAPIError as e:
-            logger.error(f"Gemini API error: {str(e)}")
-            return f"Error with the chatbot service: {str(e)}. Please try again later."
+            return bot_response
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            return f"Sorry, I encountered an error: {str(e)}. Please try again later."
\ No newline at end of file
+            return gemini.error_reply(e)
@@ -0,0 +1,577 @@
+"""
+The document served at the API root ("/").
+
+API_ROOT describes endpoints by route name. Paths and path parameters are
+looked up in the URL resolver once per process, and the rendered JSON is
+cached per scheme and host, so the root view serves it straight from memory.
+"""
+import json
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.dispatch import receiver
+from django.core.signals import setting_changed
+from django.urls import get_resolver, get_script_prefix
+from django.urls.converters import IntConverter, UUIDConverter
+
+# Rendered documents kept per "scheme://host"; ALLOWED_HOSTS is open, so
+# the Host header is client-controlled and the cache must stay bounded.
+MAX_CACHED_HOSTS = 32
+
+PARAM_TYPES = {IntConverter: 'integer', UUIDConverter: 'uuid'}
+
+_lock = threading.Lock()
+_document = None
+_rendered = {}
+
+
+API_ROOT = {
+    'authentication': {
+        'register': {
+            'route': 'users:user-register',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Register a new user',
+            'body': {
+                'username': 'string',
+                'email': 'string',
+                'password': 'string',
+                'password2': 'string',
+                'first_name': 'string',
+                'last_name': 'string',
+                'role': 'string (user, business_owner, admin)'
+            }
+        },
+        'login': {
+            'route': 'token_obtain_pair',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Get JWT access token',
+            'body': {
+                'email': 'string',
+                'password': 'string'
+            }
+        },
+        'refresh': {
+            'route': 'token_refresh',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Refresh JWT access token',
+            'body': {
+                'refresh': 'string (JWT refresh token)'
+            },
+            'response': {
+                'access': 'string (new JWT token)'
+            }
+        }
+    },
+    'chatbot': {
+        'message': {
+            'route': 'chatbot:chatbot-message',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Send a message to the chatbot and get a response',
+            'body': {
+                'message': 'string',
+                'session_id': 'string (optional)'
+            },
+            'response': {
+                'session_id': 'string',
+                'response': {
+                    'content': 'string',
+                    'timestamp': 'string (date-time)'
+                }
+            }
+        },
+        'history': {
+            'route': 'chatbot:chatbot-history',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'Get conversation history for a session',
+            'query_params': {
+                'session_id': 'string'
+            }
+        }
+    },
+    'email_verification': {
+        'verify': {
+            'route': 'users:user-verify-email',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Verify user email with verification code',
+            'body': {
+                'email': 'string',
+                'code': 'string (6-digit code)'
+            },
+            'response': {
+                'status': 'string (success/error)',
+                'message': 'string'
+            }
+        },
+        'resend': {
+            'route': 'users:user-resend-verification',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Resend verification code to email',
+            'body': {
+                'email': 'string'
+            },
+            'response': {
+                'status': 'string (success/error)',
+                'message': 'string'
+            }
+        }
+    },
+    'password_management': {
+        'forgot': {
+            'route': 'users:user-forgot-password',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Request password reset link',
+            'body': {
+                'email': 'string'
+            },
+            'response': {
+                'status': 'string (success/error)',
+                'message': 'string'
+            }
+        },
+        'reset': {
+            'route': 'users:user-reset-password',
+            'method': 'POST',
+            'auth_required': False,
+            'description': 'Reset password using reset token',
+            'body': {
+                'new_password': 'string (min length: 8)',
+                'new_password2': 'string (must match new_password)'
+            },
+            'response': {
+                'status': 'string (success/error)',
+                'message': 'string'
+            }
+        },
+        'change': {
+            'route': 'users:user-change-password',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Change password while logged in',
+            'body': {
+                'current_password': 'string',
+                'new_password': 'string (min length: 8)',
+                'new_password2': 'string (must match new_password)'
+            },
+            'response': {
+                'status': 'string (success/error)',
+                'message': 'string'
+            }
+        }
+    },
+    'profile_management': {
+        'me': {
+            'route': 'users:user-me',
+            'method': 'GET',
+            'auth_required': True,
+            'description': 'Get current user profile details',
+            'response': {
+                'username': 'string',
+                'email': 'string',
+                'first_name': 'string',
+                'last_name': 'string',
+                'role': 'string',
+                'status': 'string',
+                'email_verified': 'boolean',
+                'image': 'string (url)'
+            }
+        },
+        'change_email': {
+            'route': 'users:user-change-email',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Change email address (requires verification)',
+            'body': {
+                'email': 'string',
+                'password': 'string'
+            },
+            'response': {
+                'status': 'string (success/error)',
+                'message': 'string'
+            }
+        },
+        'saved': {
+            'route': 'me-saved',
+            'method': 'GET',
+            'auth_required': True,
+            'description': 'Everything the user saved, newest first',
+            'query_params': {
+                'cursor': 'string',
+                'page_size': 'integer'
+            }
+        },
+        'saved_bulk': {
+            'route': 'me-saved-bulk',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Save and unsave many objects of a type at once',
+            'body': {
+                'type': 'string (destination, package, event, business, post)',
+                'save': 'array of ids',
+                'unsave': 'array of ids'
+            },
+            'response': {
+                'type': 'string',
+                'saved': 'array of ids',
+                'unsaved': 'array of ids',
+                'missing': 'array of ids'
+            }
+        },
+        'logout': {
+            'route': 'users:user-logout',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Logout and invalidate refresh token',
+            'body': {
+                'refresh_token': 'string'
+            },
+            'response': {
+                'status': 'string (success/error)',
+                'message': 'string'
+            }
+        }
+    },
+    'admin': {
+        'users': {
+            'list': {
+                'route': 'users:user-list',
+                'method': 'GET',
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'List all users',
+                'query_params': {
+                    'page': 'integer',
+                    'page_size': 'integer',
+                    'search': 'string'
+                }
+            },
+            'detail': {
+                'route': 'users:user-detail',
+                'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'Manage individual user'
+            },
+            'toggle_active': {
+                'route': 'users:user-toggle-active',
+                'method': 'POST',
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'Toggle user active status'
+            },
+            'toggle_staff': {
+                'route': 'users:user-toggle-staff',
+                'method': 'POST',
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'Toggle user staff status'
+            }
+        },
+        'profiles': {
+            'list': {
+                'route': 'users:profile-list',
+                'method': 'GET',
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'List all user profiles',
+                'query_params': {
+                    'page': 'integer',
+                    'page_size': 'integer'
+                }
+            },
+            'detail': {
+                'route': 'users:profile-detail',
+                'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'Manage individual profile'
+            }
+        },
+        'business_profiles': {
+            'list': {
+                'route': 'users:business-profile-list',
+                'method': 'GET',
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'List all business profiles',
+                'query_params': {
+                    'page': 'integer',
+                    'page_size': 'integer'
+                }
+            },
+            'detail': {
+                'route': 'users:business-profile-detail',
+                'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
+                'auth_required': True,
+                'admin_required': True,
+                'description': 'Manage individual business profile'
+            }
+        }
+    },
+    'destinations': {
+        'list': {
+            'route': 'destinations:destination-list',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'List all destinations',
+            'query_params': {
+                'page': 'integer',
+                'page_size': 'integer',
+                'search': 'string'
+            }
+        }
+    },
+    'events': {
+        'list': {
+            'route': 'events:event-list',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'List all events',
+            'query_params': {
+                'page': 'integer',
+                'page_size': 'integer',
+                'search': 'string'
+            }
+        }
+    },
+    'packages': {
+        'list': {
+            'route': 'packages:package-list',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'List all travel packages',
+            'query_params': {
+                'page': 'integer',
+                'page_size': 'integer',
+                'search': 'string'
+            }
+        }
+    },
+    'business': {
+        'list': {
+            'route': 'business:business-list',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'List all businesses',
+            'query_params': {
+                'page': 'integer',
+                'page_size': 'integer',
+                'search': 'string',
+                'business_type': 'string',
+                'region': 'string',
+                'city': 'string'
+            }
+        },
+        'create': {
+            'route': 'business:business-list',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Create a new business',
+            'body': {
+                'business_name': 'string (required)',
+                'business_type': 'string (required)',
+                'description': 'string (required)',
+                'short_description': 'string (required)',
+                'region': 'string (required)',
+                'city': 'string (required)',
+                'address': 'string (required)',
+                'phone': 'string (required)',
+                'email': 'string (required)',
+                'website': 'string (optional)',
+                'image': 'string (optional)',
+                'gallery_images': 'array (optional)',
+                'opening_hours': 'array (optional)',
+                'facilities': 'array (optional)',
+                'services': 'array (optional)',
+                'team': 'array (optional)',
+                'facebook': 'string (optional)',
+                'instagram': 'string (optional)',
+                'coordinates': 'array (optional)'
+            }
+        },
+        'detail': {
+            'route': 'business:business-detail',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'Get business details'
+        },
+        'reviews': {
+            'route': 'business:business-review-list',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'List business reviews'
+        },
+        'add_review': {
+            'route': 'business:business-review-list',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Add a review to a business',
+            'body': {
+                'rating': 'number (1-5)',
+                'comment': 'string'
+            }
+        },
+        'my_businesses': {
+            'route': 'business:my-businesses',
+            'method': 'GET',
+            'auth_required': True,
+            'description': 'List businesses owned by the current user'
+        },
+        'featured': {
+            'route': 'business:business-featured',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'List featured businesses'
+        }
+    },
+    'blog': {
+        'list': {
+            'route': 'blog:post-list',
+            'method': 'GET',
+            'auth_required': False,
+            'description': 'List all blog posts',
+            'query_params': {
+                'page': 'integer',
+                'page_size': 'integer',
+                'search': 'string',
+                'status': 'string (published/draft)',
+                'featured': 'boolean'
+            }
+        },
+        'create': {
+            'route': 'blog:post-list',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Create a new blog post',
+            'body': {
+                'title': 'string',
+                'content': 'string',
+                'excerpt': 'string (optional)',
+                'featured_image': 'file (optional)',
+                'tags': 'array of strings',
+                'status': 'string (draft/published)'
+            }
+        }
+    },
+    'booking': {
+        'list': {
+            'route': 'booking:booking-list',
+            'method': 'GET',
+            'auth_required': True,
+            'description': 'List user bookings',
+            'query_params': {
+                'page': 'integer',
+                'page_size': 'integer',
+                'status': 'string'
+            }
+        },
+        'create': {
+            'route': 'booking:booking-list',
+            'method': 'POST',
+            'auth_required': True,
+            'description': 'Create new booking'
+        }
+    }
+}
+
+def route_path(view_name):
+    """
+    Return (path, {param: type}) for a route name such as
+    'business:business-detail' -> ('/api/business/businesses/{pk}/', {'pk': 'integer'}).
+    """
+    resolver = get_resolver()
+    *namespaces, name = view_name.split(':')
+    prefix = ''
+    try:
+        for namespace in namespaces:
+            ns_prefix, resolver = resolver.namespace_dict[namespace]
+            prefix += ns_prefix
+    except KeyError:
+        raise ImproperlyConfigured(f'API root references unknown namespace in {view_name!r}')
+    for possibility, pattern, defaults, converters in resolver.reverse_dict.getlist(name):
+        for template, params in possibility:
+            # Skip DRF's ".json"-style format suffix variants.
+            if 'format' in params:
+                continue
+            path = get_script_prefix() + prefix + template % {p: '{%s}' % p for p in params}
+            types = {p: PARAM_TYPES.get(type(converters.get(p)), 'string') for p in params}
+            return path, types
+    raise ImproperlyConfigured(f'API root references unknown route {view_name!r}')
+
+
+def _build(node):
+    if not isinstance(node, dict):
+        return node
+    built = {}
+    path_params = None
+    for key, value in node.items():
+        if key == 'route':
+            built['url'], path_params = route_path(value)
+        else:
+            built[key] = _build(value)
+    if path_params:
+        built['path_params'] = path_params
+    return built
+
+
+def document():
+    """API_ROOT with route names resolved to relative URLs. Built once."""
+    global _document
+    if _document is None:
+        with _lock:
+            if _document is None:
+                _document = _build(API_ROOT)
+    return _document
+
+
+def _absolute(node, base):
+    if not isinstance(node, dict):
+        return node
+    return {
+        key: base + value if key == 'url' else _absolute(value, base)
+        for key, value in node.items()
+    }
+
+
+def _base(request):
+    return f'{request.scheme}://{request.get_host()}'
+
+
+def as_dict(request):
+    """The document with absolute URLs for this request's scheme and host."""
+    return _absolute(document(), _base(request))
+
+
+def render_json(request):
+    """The document as JSON bytes (DRF's compact format), cached per host."""
+    base = _base(request)
+    body = _rendered.get(base)
+    if body is None:
+        body = json.dumps(
+            _absolute(document(), base), ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+        with _lock:
+            if len(_rendered) >= MAX_CACHED_HOSTS:
+                _rendered.clear()
+            _rendered[base] = body
+    return body
+
+
+def reset():
+    global _document
+    with _lock:
+        _document = None
+        _rendered.clear()
+
+
+@receiver(setting_changed)
+def _reset_on_urlconf_change(setting, **kwargs):
+    if setting in ('ROOT_URLCONF', 'FORCE_SCRIPT_NAME'):
+        reset()
@@ -3,4 +3,10 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'core' 
\ No newline at end of file
+    name = 'core'
+
+    def ready(self):
+        import core.db.lookups  # noqa
+        from . import versions
+
+        versions.track_project_models()
@@ -0,0 +1,83 @@
+"""
+Native async views for endpoints that spend most of their time waiting on
+other services (Gemini, SMTP). They are routed in when ASYNC_VIEWS is on,
+which ethiotravel/asgi.py does, so that one uvicorn worker can hold many such
+requests open at once instead of tying up a WSGI thread each.
+
+DRF 3.14 has no async views, so ``async_action`` borrows the viewset the view
+replaces: authentication, permissions, throttling and content negotiation
+run exactly as for that viewset action (in a worker thread, like the ORM,
+which is sync-only in Django 3.2). Blocking network calls without an async
+client go to ``run_blocking``'s thread pool, sized for waiting rather than
+for CPU work.
+"""
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+_executor = None
+
+
+def run_blocking(func, *args, **kwargs):
+    """Await a blocking network call (e.g. SMTP) on the I/O thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(settings.ASYNC_IO_THREADS, thread_name_prefix='async-io')
+    return sync_to_async(func, thread_sensitive=False, executor=_executor)(*args, **kwargs)
+
+
+def _initial(viewset, action, request, args, kwargs):
+    view = viewset()
+    view.action_map = {request.method.lower(): action}
+    view.args = args
+    view.kwargs = kwargs
+    view.request = view.initialize_request(request, *args, **kwargs)
+    view.headers = view.default_response_headers
+    try:
+        view.initial(view.request, *args, **kwargs)
+    except Exception as exc:
+        return view, _finalize(view, view.handle_exception(exc))
+    # Authenticate now, while on a thread that may use the ORM.
+    view.request.user
+    return view, None
+
+
+def _finalize(view, response):
+    response = view.finalize_response(view.request, response, *view.args, **view.kwargs)
+    return response.render()
+
+
+async def respond(view, data, status=200):
+    """Render data the way the viewset's Response would be rendered."""
+    response = Response(data, status=status)
+    if isinstance(view.request.accepted_renderer, JSONRenderer):
+        return _finalize(view, response)
+    # The browsable API renders forms, which may query the database.
+    return await sync_to_async(_finalize)(view, response)
+
+
+def async_action(viewset, action):
+    """
+    Turn ``async def func(view, request, *args, **kwargs)`` into an async view
+    that answers like ``viewset``'s ``action``. ``request`` is the DRF request;
+    ``func`` returns ``await respond(view, data, status)``.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def view(request, *args, **kwargs):
+            drf_view, error = await sync_to_async(_initial)(viewset, action, request, args, kwargs)
+            if error is not None:
+                return error
+            try:
+                return await func(drf_view, drf_view.request, *args, **kwargs)
+            except Exception as exc:
+                return await sync_to_async(_finalize)(drf_view, drf_view.handle_exception(exc))
+
+        # DRF enforces CSRF itself, for session-authenticated requests only.
+        view.csrf_exempt = True
+        return view
+    return decorator
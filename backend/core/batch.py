@@ -0,0 +1,152 @@
+"""
+POST .../batch/ on the catalogue endpoints: many objects by id or slug in
+one request, instead of a GET of the detail URL per object (saved items,
+booking targets, map markers).
+
+    class PackageViewSet(BatchRetrieveMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
+        ...
+
+    POST /api/packages/packages/batch/    {"ids": ["7c0d...", "simien-mountains-trek"]}
+    200 {"results": [{...}, {...}], "missing": []}
+
+Items are in the view's list representation (get_serializer_class() for the
+'batch' action), in the order of the request, each once; ids and slugs
+matching nothing are listed in "missing". Query-string filters don't apply:
+this is a retrieve of each id, and like retrieve it is open to anyone.
+
+Each item is cached for RESPONSE_CACHE_SECONDS under its id and its slug,
+in a key made from the versions (core.versions) of the model and of the
+view's conditional_dependencies: items already in the cache are served
+without touching the database, the others are read with one query, through
+the serializer's FieldMap (core.listing) when it has one.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_slug
+from django.db.models import Q
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import permissions, serializers
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from . import versions
+from .listing import represent
+
+MAX_IDS = 100
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.CharField(max_length=200), allow_empty=False, max_length=MAX_IDS,
+        help_text=f'Ids or slugs, at most {MAX_IDS}',
+    )
+
+
+class BatchRetrieveMixin:
+    # The model field besides the primary key that ids may name, or None.
+    batch_slug_field = 'slug'
+    # select_related() for a list serializer the FieldMap can't handle.
+    batch_select_related = ()
+
+    def get_permissions(self):
+        if self.action == 'batch':
+            return [permissions.AllowAny()]
+        return super().get_permissions()
+
+    @swagger_auto_schema(
+        request_body=BatchRequestSerializer,
+        responses={200: 'The objects in request order, and the ids matching none', 400: 'Bad Request'},
+    )
+    @action(detail=False, methods=['post'])
+    def batch(self, request, *args, **kwargs):
+        serializer = BatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        identifiers = list(dict.fromkeys(serializer.validated_data['ids']))
+        lookups = {identifier: self._lookup_keys(identifier) for identifier in identifiers}
+
+        serializer_class = self.get_serializer_class()
+        prefix = self._batch_cache_prefix(serializer_class)
+        items = {}
+        if prefix is not None:
+            cached = cache.get_many([f'{prefix}:{key}' for keys in lookups.values() for key in keys])
+            items = {key[len(prefix) + 1:]: item for key, item in cached.items()}
+
+        misses = {
+            identifier: keys for identifier, keys in lookups.items() if not any(key in items for key in keys)
+        }
+        if misses:
+            read = self._read_items(serializer_class, misses)
+            items.update(read)
+            if prefix is not None and read:
+                cache.set_many({f'{prefix}:{key}': item for key, item in read.items()},
+                               settings.RESPONSE_CACHE_SECONDS)
+
+        results, missing = [], []
+        for identifier, keys in lookups.items():
+            item = next((items[key] for key in keys if key in items), None)
+            if item is None:
+                missing.append(identifier)
+            else:
+                results.append(item)
+        return Response({'results': results, 'missing': missing})
+
+    def _lookup_keys(self, identifier):
+        """The cache keys an id or slug may be found under, the primary key's first."""
+        keys = []
+        pk = self.queryset.model._meta.pk
+        try:
+            value = pk.to_python(identifier)
+            pk.run_validators(value)
+        except DjangoValidationError:
+            pass
+        else:
+            keys.append(f'pk={value}')
+        if self.batch_slug_field:
+            try:
+                validate_slug(identifier)
+            except DjangoValidationError:
+                pass
+            else:
+                keys.append(f'{self.batch_slug_field}={identifier}')
+        return keys
+
+    def _batch_cache_prefix(self, serializer_class):
+        if not settings.RESPONSE_CACHE_SECONDS:
+            return None
+        labels = [self.queryset.model._meta.label, *getattr(self, 'conditional_dependencies', ())]
+        digest = hashlib.sha256(repr([
+            settings.RELEASE_VERSION, self.request.build_absolute_uri('/'),
+            f'{serializer_class.__module__}.{serializer_class.__qualname__}',
+            sorted(versions.get_many(labels).items()),
+        ]).encode()).hexdigest()[:32]
+        return f'batch:{digest}'
+
+    def _read_items(self, serializer_class, lookups):
+        """{key: item} for the objects named in lookups ({id or slug: keys}), in one query."""
+        pk = self.queryset.model._meta.pk
+        values = {}
+        for keys in lookups.values():
+            for key in keys:
+                name, _, value = key.partition('=')
+                values.setdefault(name, []).append(value)
+        if not values:
+            return {}
+        names = ['pk', *([self.batch_slug_field] if self.batch_slug_field else [])]
+        condition = Q()
+        for name, in_values in values.items():
+            condition |= Q(**{f'{name}__in': in_values})
+        queryset = self.get_queryset().filter(condition).order_by()
+        rows = represent(
+            serializer_class, queryset, names, self.get_serializer_context(), self.batch_select_related,
+        )
+
+        read = {}
+        for found, item in rows:
+            for name, value in zip(names, found):
+                if name == 'pk':
+                    value = pk.to_python(value)
+                read[f'{name}={value}'] = item
+        return read
@@ -0,0 +1,96 @@
+"""
+gzip and Brotli for API responses (core.middleware.CompressionMiddleware);
+WhiteNoise only compresses static files.
+
+    encoding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    body = compress(response.content, encoding, key='response:...')
+
+Brotli is used when the brotli package is installed and the client prefers
+it or accepts both; gzip otherwise. Only JSON and YAML bodies are compressed:
+HTML pages of the browsable API carry the CSRF token, which compression would
+expose to BREACH.
+
+With a key, the compressed body is kept in the cache under the key and the
+encoding for RESPONSE_CACHE_SECONDS, so a response cached by core.conditional
+is compressed once per encoding rather than once per request.
+"""
+import gzip
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.text import compress_sequence
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only
+    brotli = None
+
+GZIP_LEVEL = 6
+# Brotli's default quality (11) is far too slow to run per response; 5 is
+# about as fast as gzip's level 6 and still compresses JSON better.
+BROTLI_QUALITY = 5
+COMPRESSIBLE_TYPES = ('application/json', 'application/openapi+json', 'application/yaml')
+
+_QVALUE = re.compile(r'(?:^|;)\s*q\s*=\s*([0-9.]+)')
+
+
+def encodings():
+    """The content codings this process can produce, preferred first."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate(accept_encoding):
+    """The coding to use for an Accept-Encoding header value, or None."""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        match = _QVALUE.search(params)
+        try:
+            q = float(match.group(1)) if match else 1.0
+        except ValueError:
+            q = 0.0
+        accepted[coding.strip().lower()] = q
+    best, best_q = None, 0.0
+    for coding in encodings():
+        q = accepted.get(coding, accepted.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compressible(response):
+    content_type = response.get('Content-Type', '').partition(';')[0].strip().lower()
+    return content_type in COMPRESSIBLE_TYPES and not response.has_header('Content-Encoding')
+
+
+def _compress(content, encoding):
+    if encoding == 'br':
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    # mtime=0 keeps the output the same for the same content.
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress(content, encoding, key=None):
+    """content compressed with encoding, kept in the cache under key if given."""
+    if key is None or not settings.RESPONSE_CACHE_SECONDS:
+        return _compress(content, encoding)
+    key = f'{key}:{encoding}'
+    compressed = cache.get(key)
+    if compressed is None:
+        compressed = _compress(content, encoding)
+        cache.set(key, compressed, settings.RESPONSE_CACHE_SECONDS)
+    return compressed
+
+
+def compress_stream(chunks, encoding):
+    """Compressed chunks of a streamed body, flushed chunk by chunk."""
+    if encoding == 'gzip':
+        yield from compress_sequence(chunks)
+        return
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in chunks:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
@@ -0,0 +1,114 @@
+"""
+Conditional GET for list and retrieve: responses carry an ETag and a
+Last-Modified, and a request that sends them back (If-None-Match,
+If-Modified-Since) gets a 304 Not Modified, decided before anything is
+serialized.
+
+    class DestinationViewSet(ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
+        conditional_dependencies = ['destinations.DestinationReview', 'users.User']
+
+A detail response is validated by the row's id and updated_at, read with a
+one-row query; a list response by MAX(updated_at) and COUNT(*) over the
+filtered queryset, one aggregate query. Other models whose rows appear in
+the responses (nested reviews, their authors, the organizer's name) are listed in
+conditional_dependencies: their versions (core.versions) are part of every
+validator. Last-Modified also covers the version of the view's own model, so
+it moves forward when the newest row is deleted. The ETag also covers the release, the absolute URL with its query
+string and the negotiated media type, so hosts, pages, filters, ?fields= and
+the browsable API each have their own.
+
+Responses are sent with Cache-Control: no-cache, so browsers revalidate
+instead of guessing a freshness lifetime from Last-Modified.
+
+Rendered JSON responses are also cached by their ETag for
+RESPONSE_CACHE_SECONDS: a client without the ETag gets the same bytes
+without serializing again, and core.middleware.CompressionMiddleware keeps
+their compressed bodies next to them.
+"""
+import hashlib
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from . import versions
+
+UPDATED = 'updated_at'
+
+
+def _store(key, response):
+    cache.set(key, (response['Content-Type'], response.content), settings.RESPONSE_CACHE_SECONDS)
+
+
+class ConditionalGetMixin:
+    # Other models shown in this view's responses: a save or delete of any of
+    # their rows changes every ETag of the view.
+    conditional_dependencies = ()
+
+    def list(self, request, *args, **kwargs):
+        latest = self.filter_queryset(self.get_queryset()).order_by().aggregate(
+            latest=Max(UPDATED), count=Count('pk'),
+        )
+        return self.conditional_response(
+            request, [latest['count']], latest['latest'], super().list, *args, **kwargs,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None)
+        try:
+            obj = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).only(UPDATED).first()
+        except (TypeError, ValueError, ValidationError):
+            obj = None
+        if obj is None:
+            # The usual 404.
+            return super().retrieve(request, *args, **kwargs)
+        self.check_object_permissions(request, obj)
+        return self.conditional_response(
+            request, [obj.pk], getattr(obj, UPDATED), super().retrieve, *args, **kwargs,
+        )
+
+    def conditional_response(self, request, validators, updated, respond, *args, **kwargs):
+        """
+        A 304 if the client's copy matches validators, updated (a datetime or
+        None) and the dependencies' versions, else the cached response for
+        them or respond(request, ...).
+        """
+        label = self.queryset.model._meta.label
+        dependencies = versions.get_many([label, *self.conditional_dependencies])
+        # Only in Last-Modified, which must move forward when a row is deleted.
+        own = dependencies.pop(label)
+        digest = hashlib.sha256(repr([
+            settings.RELEASE_VERSION, request.build_absolute_uri(), request.accepted_media_type,
+            validators, updated and updated.isoformat(), sorted(dependencies.items()),
+        ]).encode()).hexdigest()[:32]
+        etag = f'W/"{digest}"'
+        stamps = [own, *dependencies.values(), *([updated.timestamp()] if updated else [])]
+        last_modified = int(max(stamps))
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            # Only JSON: the browsable API's pages show the user and a CSRF token.
+            key = None
+            if settings.RESPONSE_CACHE_SECONDS and request.accepted_renderer.format == 'json':
+                key = f'response:{digest}'
+            cached = cache.get(key) if key else None
+            if cached is not None:
+                content_type, content = cached
+                response = HttpResponse(content, content_type=content_type)
+            else:
+                response = respond(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                if key:
+                    response.add_post_render_callback(partial(_store, key))
+            response.response_cache_key = key
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, no_cache=True)
+        return response
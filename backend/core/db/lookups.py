@@ -0,0 +1,38 @@
+"""
+Containment lookups for JSON list fields (Package.category, BlogPost.tags, ...).
+
+    Package.objects.filter(category__array_contains='Adventure')
+    Package.objects.filter(category__array_contains=['Adventure', 'Culture'])
+
+match the rows whose list holds every given element. On PostgreSQL this is
+`category @> '["Adventure"]'`, which the jsonb_path_ops GIN indexes (see
+core.db.operations) serve. Django's own `contains` raises NotSupportedError on
+SQLite; there the elements are looked up with json_each instead.
+"""
+from django.db.models import JSONField
+from django.db.models.fields.json import DataContains
+
+
+@JSONField.register_lookup
+class ArrayContains(DataContains):
+    lookup_name = 'array_contains'
+
+    def get_prep_lookup(self):
+        # Always compare against a list: a bare string would only match a
+        # string, not a list holding it, on backends other than PostgreSQL.
+        if not isinstance(self.rhs, (list, tuple)):
+            self.rhs = [self.rhs]
+        self.elements = list(self.rhs)
+        return super().get_prep_lookup()
+
+    def as_sqlite(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        if not self.elements:
+            return '1 = 1', ()
+        sql = ' AND '.join(
+            f'EXISTS (SELECT 1 FROM json_each({lhs}) WHERE json_each.value = %s)' for _ in self.elements
+        )
+        params = []
+        for element in self.elements:
+            params.extend((*lhs_params, element))
+        return f'({sql})', tuple(params)
@@ -0,0 +1,59 @@
+"""
+Migration operations for PostgreSQL-only indexes.
+
+A GinIndex in Meta.indexes would be created on SQLite as well, where
+`USING gin` is a syntax error (also whenever SQLite rebuilds the table), so
+these indexes are created by migrations only and do nothing elsewhere.
+"""
+from django.db.migrations.operations.base import Operation
+
+
+class AddJSONPathIndex(Operation):
+    """
+    A jsonb_path_ops GIN index on a JSONField, for `@>` containment queries
+    (the array_contains lookup in core.db.lookups). Smaller and faster than
+    the default jsonb_ops, but serves only `@>`, not key-existence tests.
+    """
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name, field, name):
+        self.model_name = model_name
+        self.field = field
+        self.name = name
+
+    def deconstruct(self):
+        return self.__class__.__qualname__, [], {
+            'model_name': self.model_name, 'field': self.field, 'name': self.name,
+        }
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if schema_editor.connection.vendor != 'postgresql' or not self.allow_migrate_model(
+            schema_editor.connection.alias, model
+        ):
+            return
+        column = model._meta.get_field(self.field).column
+        schema_editor.execute('CREATE INDEX %s ON %s USING gin (%s jsonb_path_ops)' % (
+            schema_editor.quote_name(self.name),
+            schema_editor.quote_name(model._meta.db_table),
+            schema_editor.quote_name(column),
+        ))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if schema_editor.connection.vendor != 'postgresql' or not self.allow_migrate_model(
+            schema_editor.connection.alias, model
+        ):
+            return
+        schema_editor.execute('DROP INDEX IF EXISTS %s' % schema_editor.quote_name(self.name))
+
+    def describe(self):
+        return f'Create jsonb_path_ops index {self.name} on {self.model_name}.{self.field} (PostgreSQL only)'
+
+    @property
+    def migration_name_fragment(self):
+        return self.name.lower()
@@ -0,0 +1,48 @@
+"""
+PostgreSQL backend with persistent-connection health checks.
+
+Django 3.2 reuses a connection for CONN_MAX_AGE seconds without checking it,
+so after a database restart or failover every worker's first query on its
+old connection fails. With CONN_HEALTH_CHECKS (the setting Django 4.1 adds
+for the same purpose) a reused connection is pinged once per request, before
+its first query, and replaced if it is gone. Remove this backend when
+upgrading to Django 4.1+, which does the same natively.
+"""
+from django.db.backends.postgresql import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, settings_dict, alias='default'):
+        super().__init__(settings_dict, alias)
+        self.health_check_enabled = settings_dict.get('CONN_HEALTH_CHECKS', False)
+        self.health_check_done = False
+
+    def connect(self):
+        # A new connection is healthy.
+        self.health_check_done = True
+        super().connect()
+
+    def close_if_health_check_failed(self):
+        """Close the connection if it no longer works; checked once per request."""
+        if self.connection is None or not self.health_check_enabled or self.health_check_done:
+            return
+        if not self.is_usable():
+            self.close()
+        self.health_check_done = True
+
+    def close_if_unusable_or_obsolete(self):
+        # Runs when a request starts and finishes: check again in the next one.
+        if self.connection is not None:
+            self.health_check_done = False
+        super().close_if_unusable_or_obsolete()
+
+    def _cursor(self, name=None):
+        self.close_if_health_check_failed()
+        return super()._cursor(name)
+
+    def set_autocommit(self, autocommit, force_begin_transaction_with_broken_autocommit=False):
+        # Starting a transaction (atomic) is the other way to first touch the
+        # connection in a request.
+        self.validate_no_atomic_block()
+        self.close_if_health_check_failed()
+        super().set_autocommit(autocommit, force_begin_transaction_with_broken_autocommit)
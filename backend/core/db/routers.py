@@ -0,0 +1,98 @@
+"""
+Read-replica routing for the catalogue.
+
+Replicas are listed in DATABASE_REPLICAS (aliases built from
+DATABASE_REPLICA_URLS). ReplicaRoutingMiddleware marks the requests whose reads
+may be served by one: safe methods on REPLICA_APPS views, from clients that
+haven't written anything in the last READ_YOUR_WRITES_SECONDS. During such a
+request ReplicaRouter sends reads of REPLICA_APPS models to a random replica.
+Everything else, and every write, goes to 'default'.
+"""
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_replica_reads = ContextVar('replica_reads', default=None)
+
+
+class ReplicaReads:
+    """Whether the current request may read from a replica; set by the middleware."""
+
+    def __init__(self):
+        self.allowed = False
+
+
+def current():
+    """The ReplicaReads of the request being handled, or None."""
+    return _replica_reads.get()
+
+
+@contextmanager
+def request_routing():
+    state = ReplicaReads()
+    token = _replica_reads.set(state)
+    try:
+        yield state
+    finally:
+        _replica_reads.reset(token)
+
+
+def _pin_key(request):
+    authorization = request.META.get('HTTP_AUTHORIZATION')
+    if not authorization:
+        return None
+    return 'replica-pin:' + hashlib.sha256(authorization.encode()).hexdigest()[:32]
+
+
+def pin_to_primary(request, response):
+    """After a write, read from 'default' for a while so the client sees it."""
+    seconds = settings.READ_YOUR_WRITES_SECONDS
+    response.set_cookie(
+        settings.READ_YOUR_WRITES_COOKIE, '1', max_age=seconds, httponly=True, samesite='Lax',
+    )
+    # Token clients may not keep cookies; remember them by token as well.
+    key = _pin_key(request)
+    if key is not None:
+        cache.set(key, True, seconds)
+
+
+def is_pinned(request):
+    if settings.READ_YOUR_WRITES_COOKIE in request.COOKIES:
+        return True
+    key = _pin_key(request)
+    return key is not None and bool(cache.get(key))
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _replica_reads.get()
+        if state is None or not state.allowed or not settings.DATABASE_REPLICAS:
+            return None
+        if model._meta.app_label not in settings.REPLICA_APPS:
+            return None
+        # A transaction on 'default' must see its own uncommitted rows.
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        # Also for instances read from a replica, which would otherwise be
+        # written back to where they came from.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema through replication.
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,173 @@
+"""
+Facet counts for the catalogue list endpoints: how many of the rows matching
+the current filters have each category, region, price range, ... so that the
+browse pages can show "Hiking (42)" without a list call per option.
+
+    PACKAGE_FACETS = Facets(
+        'packages.Package',
+        ListFacet('category'), FieldFacet('region'), RangeFacet('price', [1000, 5000]),
+    )
+    PACKAGE_FACETS.counts(queryset)
+    # {'count': 120, 'facets': {'category': [{'value': 'hiking', 'count': 42}, ...],
+    #                           'price': [{'value': '0-1000', 'count': 3}, ...], ...}}
+    PACKAGE_FACETS.counts(queryset, only=['region'])
+    # {'count': 120, 'facets': {'region': [...]}}
+
+All facets are counted in one statement: the filtered rows go into a CTE and
+each facet is a GROUP BY over it, UNION ALL'd together. Facets.for_request()
+caches the result per query string, keyed by the model's version
+(core.versions): saving or deleting a row of the model invalidates every
+cached count for it. Rows changed without signals, by bulk_create() or
+update(), show up once the entry expires (FACETS_CACHE_SECONDS).
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from . import versions
+
+# Query parameters that don't change which rows match.
+IGNORED_PARAMS = {'page', 'page_size', 'ordering', 'format'}
+
+
+class FieldFacet:
+    """Counts per distinct value of a field."""
+
+    def __init__(self, field, name=None):
+        self.field = field
+        self.name = name or field
+
+    def select(self, column, connection):
+        """SQL for (facet, value, count) over the rows in `filtered`, and its params."""
+        return (
+            f'SELECT %s, CAST({column} AS TEXT), COUNT(*) FROM filtered '
+            f'WHERE {column} IS NOT NULL GROUP BY 2'
+        ), [self.name]
+
+    def values(self, counts):
+        """[{'value', 'count'}], largest first."""
+        return [
+            {'value': value, 'count': count}
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+
+class ListFacet(FieldFacet):
+    """Counts per element of a JSON list field; a row counts once per element."""
+
+    def select(self, column, connection):
+        if connection.vendor == 'postgresql':
+            elements = (
+                f"jsonb_array_elements_text(CASE WHEN jsonb_typeof({column}) = 'array' "
+                f"THEN {column} ELSE '[]' END) AS element(value)"
+            )
+        else:
+            elements = (
+                f"json_each(CASE WHEN json_type({column}) = 'array' THEN {column} ELSE '[]' END) AS element"
+            )
+        return (
+            f'SELECT %s, CAST(element.value AS TEXT), COUNT(DISTINCT filtered.pk) '
+            f'FROM filtered, {elements} WHERE element.value IS NOT NULL GROUP BY 2'
+        ), [self.name]
+
+
+class RangeFacet(FieldFacet):
+    """
+    Counts per range of a numeric field, split at `edges`: [1000, 5000] gives
+    '0-1000', '1000-5000' and '5000+' (lower bound included). Every range is
+    listed, in order, including empty ones.
+    """
+
+    def __init__(self, field, edges, name=None):
+        super().__init__(field, name)
+        self.edges = sorted(edges)
+        bounds = [0, *self.edges]
+        self.labels = [f'{low}-{high}' for low, high in zip(bounds, self.edges)] + [f'{self.edges[-1]}+']
+
+    def select(self, column, connection):
+        cases = ' '.join(f'WHEN {column} < %s THEN %s' for _ in self.edges)
+        params = [self.name]
+        for edge, label in zip(self.edges, self.labels):
+            params += [edge, label]
+        return (
+            f'SELECT %s, CASE {cases} ELSE %s END, COUNT(*) FROM filtered '
+            f'WHERE {column} IS NOT NULL GROUP BY 2'
+        ), params + [self.labels[-1]]
+
+    def values(self, counts):
+        return [{'value': label, 'count': counts.get(label, 0)} for label in self.labels]
+
+
+class Facets:
+    def __init__(self, model, *facets):
+        self.model_label = model
+        self.facets = facets
+
+    def counts(self, queryset, only=None):
+        """
+        {'count': rows matching, 'facets': {name: values}} for queryset, of
+        the facets named in only (all by default).
+        """
+        facets = [facet for facet in self.facets if only is None or facet.name in only]
+        connection = connections[queryset.db]
+        fields = list(dict.fromkeys(['pk', *(facet.field for facet in facets)]))
+        columns = {field: f'c{i}' for i, field in enumerate(fields)}
+        columns['pk'] = 'pk'
+        inner, params = queryset.order_by().values_list(*fields).query.sql_with_params()
+        parts = ["SELECT '', NULL, COUNT(*) FROM filtered"]
+        params = list(params)
+        for facet in facets:
+            sql, facet_params = facet.select(columns[facet.field], connection)
+            parts.append(sql)
+            params += facet_params
+        sql = (
+            f"WITH filtered ({', '.join(columns.values())}) AS ({inner}) "
+            + ' UNION ALL '.join(parts)
+        )
+        grouped = {facet.name: {} for facet in facets}
+        total = 0
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for name, value, count in cursor.fetchall():
+                if name == '':
+                    total = count
+                else:
+                    grouped[name][value] = count
+        return {
+            'count': total,
+            'facets': {facet.name: facet.values(grouped[facet.name]) for facet in facets},
+        }
+
+    def for_request(self, queryset, request, only=None):
+        """counts(queryset, only), cached per path and query string of request."""
+        params = [request.path, only and sorted(only)] + sorted(
+            (key, value) for key, values in request.query_params.lists() if key not in IGNORED_PARAMS
+            for value in values
+        )
+        digest = hashlib.sha256(repr(params).encode()).hexdigest()[:32]
+        key = f'facets:{self.model_label}:{versions.get(self.model_label)}:{digest}'
+        result = cache.get(key)
+        if result is None:
+            result = self.counts(queryset, only)
+            cache.set(key, result, settings.FACETS_CACHE_SECONDS)
+        return result
+
+
+def response_schema(facets):
+    """The OpenAPI schema of a Facets.counts() response, for swagger_auto_schema."""
+    from drf_yasg import openapi
+
+    values = openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(
+        type=openapi.TYPE_OBJECT, properties={
+            'value': openapi.Schema(type=openapi.TYPE_STRING),
+            'count': openapi.Schema(type=openapi.TYPE_INTEGER),
+        },
+    ))
+    return openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+        'count': openapi.Schema(type=openapi.TYPE_INTEGER),
+        'facets': openapi.Schema(
+            type=openapi.TYPE_OBJECT, properties={facet.name: values for facet in facets.facets},
+        ),
+    })
@@ -0,0 +1,270 @@
+"""
+A faster list() for the catalogue endpoints: rows are read with
+values_list() and turned into the serializer's output by a field map
+compiled once per serializer class, instead of building a model instance
+per row and walking the serializer's fields for each of them.
+
+    class PackageViewSet(ValuesListMixin, viewsets.ModelViewSet):
+        ...
+
+The response is the same, byte for byte: every value goes through the
+serializer field's own to_representation(), except where that would hand
+back the database value unchanged (text, integers, booleans, JSON, related
+primary keys), which is used as it is. A nested serializer for a foreign key
+(PackageListSerializer.organizer) becomes columns of the same query, joined,
+rather than a query per row.
+
+Serializers the field map can't reproduce, with a SerializerMethodField, a
+dotted or '*' source, a property, a file or many-to-many field or their own
+to_representation(), are left to the regular ListModelMixin.list().
+
+SparseFieldsMixin (which ValuesListMixin includes) lets list and retrieve
+requests ask for fewer fields, leaving the rest out of both the response and
+the SQL:
+
+    ?fields=id,title,price      only these
+    ?exclude=description        all but these
+    ?view=card                  the view's card_fields, a compact item for grids
+
+?fields= takes precedence over ?view=; ?exclude= applies to either.
+"""
+import functools
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+SPARSE_ACTIONS = ('list', 'retrieve')
+
+TEXT_TYPES = {'CharField', 'TextField', 'SlugField', 'EmailField', 'URLField'}
+INTEGER_TYPES = {
+    'AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField', 'BigIntegerField', 'SmallIntegerField',
+    'PositiveIntegerField', 'PositiveBigIntegerField', 'PositiveSmallIntegerField',
+}
+# Serializer fields whose to_representation() returns a database value of
+# these model field types unchanged.
+PASS_THROUGH = {
+    serializers.CharField: TEXT_TYPES,
+    serializers.SlugField: TEXT_TYPES,
+    serializers.EmailField: TEXT_TYPES,
+    serializers.URLField: TEXT_TYPES,
+    serializers.ChoiceField: TEXT_TYPES,
+    serializers.IntegerField: INTEGER_TYPES,
+    serializers.BooleanField: {'BooleanField'},
+}
+
+
+class Unsupported(Exception):
+    pass
+
+
+class FieldMap:
+    """
+    How to read a serializer's output from values_list(*columns) rows:
+    (name, index, convert, nested) per field, in the serializer's order.
+    """
+
+    def __init__(self, entries, columns):
+        self.entries = entries
+        self.columns = columns
+
+    def represent(self, row):
+        data = {}
+        for name, index, convert, nested in self.entries:
+            value = row[index]
+            if value is None:
+                data[name] = None
+            elif nested is not None:
+                data[name] = nested.represent(row)
+            elif convert is None:
+                data[name] = value
+            else:
+                data[name] = convert(value)
+        return data
+
+    def rows(self, queryset):
+        """queryset as values_list() rows for represent()."""
+        return queryset.values_list(*self.columns)
+
+    def data(self, rows):
+        return [self.represent(row) for row in rows]
+
+
+def _compile(serializer, model, prefix, columns):
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        raise Unsupported(f'{type(serializer).__name__}.to_representation')
+    entries = []
+    for field in serializer._readable_fields:
+        source = field.source
+        if source == '*' or '.' in source:
+            raise Unsupported(f'{field.field_name}: source {source!r}')
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise Unsupported(f'{field.field_name}: not a model field')
+        if not model_field.concrete or model_field.many_to_many or isinstance(model_field, models.FileField):
+            raise Unsupported(f'{field.field_name}: {type(model_field).__name__}')
+        columns.append(prefix + source)
+        index = len(columns) - 1
+        if isinstance(field, serializers.BaseSerializer):
+            if isinstance(field, serializers.ListSerializer) or not model_field.is_relation:
+                raise Unsupported(f'{field.field_name}: nested {type(field).__name__}')
+            nested = _compile(field, model_field.related_model, f'{prefix}{source}__', columns)
+            entries.append((field.field_name, index, None, nested))
+        elif model_field.is_relation:
+            # The related primary key, as PrimaryKeyRelatedField gives it.
+            if type(field) is not serializers.PrimaryKeyRelatedField or field.pk_field is not None:
+                raise Unsupported(f'{field.field_name}: {type(field).__name__}')
+            entries.append((field.field_name, index, None, None))
+        elif model_field.get_internal_type() in PASS_THROUGH.get(type(field), ()) or (
+            type(field) is serializers.JSONField and not field.binary
+        ):
+            entries.append((field.field_name, index, None, None))
+        else:
+            entries.append((field.field_name, index, field.to_representation, None))
+    return FieldMap(entries, columns)
+
+
+@functools.lru_cache(maxsize=None)
+def _serializer(serializer_class):
+    """An unbound instance of serializer_class, to read its fields from."""
+    return serializer_class()
+
+
+@functools.lru_cache(maxsize=512)
+def field_map(serializer_class, names=None):
+    """
+    The FieldMap of a ModelSerializer class, narrowed to the fields in names
+    if given, or None if it has none.
+    """
+    if not issubclass(serializer_class, serializers.ModelSerializer):
+        return None
+    serializer = serializer_class()
+    if names is not None:
+        for name in list(serializer.fields):
+            if name not in names:
+                serializer.fields.pop(name)
+    try:
+        return _compile(serializer, serializer_class.Meta.model, '', [])
+    except Unsupported:
+        return None
+
+
+def represent(serializer_class, queryset, keys=('pk',), context=None, select_related=()):
+    """
+    [(values of keys, item)] for the rows of queryset, each item in
+    serializer_class's representation, read with one query: through the
+    serializer's FieldMap when it has one, else from instances fetched with
+    select_related.
+    """
+    fields = field_map(serializer_class)
+    if fields is not None:
+        count = len(fields.columns)
+        return [(row[count:], fields.represent(row)) for row in queryset.values_list(*fields.columns, *keys)]
+    objs = list(queryset.select_related(*select_related))
+    data = serializer_class(objs, many=True, context=context or {}).data
+    return [(tuple(getattr(obj, key) for key in keys), item) for obj, item in zip(objs, data)]
+
+
+def model_columns(serializer_class, names):
+    """
+    The model fields to only() for the serializer fields in names, or None
+    if one of them may read any column (a '*' source or a property).
+    """
+    serializer = _serializer(serializer_class)
+    model = serializer_class.Meta.model
+    columns = []
+    for name in names:
+        source = serializer.fields[name].source
+        if source == '*':
+            return None
+        try:
+            model_field = model._meta.get_field(source.split('.')[0])
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        columns.append(model_field.name)
+    return columns
+
+
+class SparseFieldsMixin:
+    """?fields=, ?exclude= and ?view=card on list and retrieve."""
+    # Fields of the compact ?view=card representation.
+    card_fields = None
+
+    def _param(self, name):
+        return [
+            value.strip() for values in self.request.query_params.getlist(name)
+            for value in values.split(',') if value.strip()
+        ]
+
+    def sparse_fields(self):
+        """
+        The names of the serializer fields the request asks for, as a
+        frozenset, or None for all of them.
+        """
+        if not hasattr(self, '_sparse_fields'):
+            self._sparse_fields = self._select_fields()
+        return self._sparse_fields
+
+    def _select_fields(self):
+        if getattr(self, 'action', None) not in SPARSE_ACTIONS or getattr(self, 'swagger_fake_view', False):
+            return None
+        fields, exclude = self._param('fields'), self._param('exclude')
+        view = self.request.query_params.get('view')
+        if not fields and not exclude and not view:
+            return None
+        available = list(_serializer(self.get_serializer_class()).fields)
+        if fields:
+            names = fields
+        elif view == 'card' and self.card_fields:
+            # The detail serializers may lack some of them.
+            names = [name for name in self.card_fields if name in available]
+        elif view:
+            raise ValidationError({'view': [f'Unknown view {view!r}.']})
+        else:
+            names = available
+        unknown = [name for name in [*names, *exclude] if name not in available]
+        if unknown:
+            raise ValidationError({'fields': [
+                f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(available)}."
+            ]})
+        return frozenset(names) - frozenset(exclude)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        names = self.sparse_fields()
+        if names is not None:
+            fields = getattr(serializer, 'child', serializer).fields
+            for name in list(fields):
+                if name not in names:
+                    fields.pop(name)
+        return serializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        names = self.sparse_fields()
+        if names is not None:
+            columns = model_columns(self.get_serializer_class(), names)
+            related = queryset.query.select_related
+            if columns is not None and related is not True:
+                # Fields followed by select_related() can't be deferred.
+                queryset = queryset.only(*columns, *(related or ()))
+        return queryset
+
+
+class ValuesListMixin(SparseFieldsMixin):
+    """list() through the serializer's FieldMap when it has one."""
+
+    def list(self, request, *args, **kwargs):
+        fields = field_map(self.get_serializer_class(), self.sparse_fields())
+        if fields is None:
+            return super().list(request, *args, **kwargs)
+        rows = fields.rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(fields.data(page))
+        return Response(fields.data(rows))
@@ -0,0 +1,25 @@
+import time
+
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+
+from . import metrics
+
+
+class EmailBackend(SMTPEmailBackend):
+    """SMTP backend that reports in-flight sends, outcomes and latency to Prometheus."""
+
+    def send_messages(self, email_messages):
+        metrics.EMAILS_IN_FLIGHT.inc(len(email_messages or ()))
+        start = time.perf_counter()
+        try:
+            sent = super().send_messages(email_messages)
+        except Exception:
+            metrics.EMAILS_SENT.labels('failed').inc(len(email_messages or ()))
+            raise
+        finally:
+            metrics.EMAILS_IN_FLIGHT.dec(len(email_messages or ()))
+            metrics.EMAIL_LATENCY.observe(time.perf_counter() - start)
+        metrics.EMAILS_SENT.labels('sent').inc(sent or 0)
+        if email_messages and (sent or 0) < len(email_messages):
+            metrics.EMAILS_SENT.labels('failed').inc(len(email_messages) - (sent or 0))
+        return sent
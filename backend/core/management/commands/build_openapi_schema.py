@@ -0,0 +1,55 @@
+import glob
+import gzip
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core import openapi
+
+try:
+    import brotli
+except ImportError:  # optional; WhiteNoise falls back to the .gz file
+    brotli = None
+
+
+class Command(BaseCommand):
+    help = (
+        'Render the OpenAPI schema into STATIC_ROOT for WhiteNoise to serve. '
+        'Run at deploy time, after collectstatic.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep-old', action='store_true',
+            help="Don't delete schema files built for other releases",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            body, _ = openapi.get('.json')
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        path = openapi.static_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        outputs = {path: body, path + '.gz': gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            outputs[path + '.br'] = brotli.compress(body)
+        for name, data in outputs.items():
+            # Write then rename, so a running server never sees half a file.
+            with open(name + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(name + '.tmp', name)
+
+        if not options['keep_old']:
+            for name in glob.glob(os.path.join(os.path.dirname(path), 'schema-*.json*')):
+                if name not in outputs:
+                    os.remove(name)
+        openapi.reset()
+
+        sizes = ', '.join(f'{os.path.basename(name)} {len(data)} bytes' for name, data in outputs.items())
+        self.stdout.write(self.style.SUCCESS(
+            f'OpenAPI schema for release {openapi.version()} written: {sizes}'
+        ))
+        self.stdout.write(f'Served at {settings.STATIC_URL}{openapi.static_name()}')
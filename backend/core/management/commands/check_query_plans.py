@@ -0,0 +1,190 @@
+import json
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+# The endpoints whose queries are checked, by traffic. {names} are filled in
+# with sample objects from the database (see samples()).
+ENDPOINTS = (
+    '/api/destinations/destinations/',
+    '/api/destinations/destinations/?featured=true',
+    '/api/destinations/destinations/{destination}/',
+    '/api/destinations/destinations/{destination}/reviews/',
+    '/api/events/events/',
+    '/api/events/events/upcoming/',
+    '/api/events/events/featured/',
+    '/api/events/events/calendar/?year={year}&month={month}',
+    '/api/events/events/{event}/reviews/',
+    '/api/packages/packages/',
+    '/api/packages/packages/?featured=true',
+    '/api/packages/packages/featured/',
+    '/api/packages/packages/{package}/',
+    '/api/business/businesses/',
+    '/api/business/businesses/featured/',
+    '/api/business/businesses/{business}/reviews/',
+    '/api/blog/posts/?status=published',
+    '/api/blog/posts/featured/',
+    '/api/blog/posts/{post}/comments/',
+    '/api/booking/bookings/',
+    '/api/booking/reviews/',
+    '/api/chatbot/message/history/?session_id={session}',
+)
+
+SQLITE_SEQ_SCAN = re.compile(r'^SCAN (\S+)$')
+# A sort the query's ORDER BY couldn't get from an index.
+SQLITE_SORT = re.compile(r'^USE TEMP B-TREE FOR (?:RIGHT PART OF )?ORDER BY')
+
+
+def plan_nodes(node, parent=None):
+    """(node, parent) for every node of a PostgreSQL JSON plan."""
+    yield node, parent
+    for child in node.get('Plans', ()):
+        yield from plan_nodes(child, node)
+
+
+def samples():
+    """Objects to fill ENDPOINTS with, and the user to make the requests as."""
+    from blog.models import BlogPost
+    from business.models import Business
+    from chatbot.models import Conversation
+    from destinations.models import Destination
+    from events.models import Event
+    from packages.models import Package
+    from users.models import User
+
+    # Someone with bookings and chatbot conversations, for the per-user lists.
+    users = User.objects.filter(booking__isnull=False).order_by('pk')
+    user = users.filter(conversation__isnull=False).first() or users.first()
+    conversation = Conversation.objects.filter(user=user).first() if user else None
+    event = Event.objects.filter(status='published').order_by('start_date').last()
+    return user, {
+        'destination': Destination.objects.values_list('pk', flat=True).first(),
+        'event': event.pk if event else None,
+        'year': event.start_date.year if event else 2025,
+        'month': event.start_date.month if event else 1,
+        'package': Package.objects.values_list('pk', flat=True).first(),
+        'business': Business.objects.values_list('pk', flat=True).first(),
+        'post': BlogPost.objects.values_list('pk', flat=True).first(),
+        'session': conversation.session_id if conversation else None,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Request the hot API endpoints, EXPLAIN every query they run and flag '
+        'sequential scans. Run against a database with realistic data '
+        '(generate_load_data); nothing is changed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--endpoint', action='append', dest='endpoints',
+            help='Check this path instead of the built-in list (repeatable)',
+        )
+        parser.add_argument(
+            '--planner-defaults', action='store_true',
+            help="PostgreSQL: keep enable_seqscan on. By default it is turned off, so a "
+                 "sequential scan means no index can serve the query at all, however "
+                 "small the tables are.",
+        )
+        parser.add_argument(
+            '--sort-rows', type=int, default=1000,
+            help='PostgreSQL: report sorts of more rows than this (estimated). Small sorts '
+                 'are often cheaper than an ordered index scan and are left alone.',
+        )
+        parser.add_argument('--plans', action='store_true', help='Print every plan')
+        parser.add_argument(
+            '--strict', action='store_true', help='Exit with an error if anything is flagged',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            raise CommandError(f'Unsupported database: {connection.vendor}')
+        user, names = samples()
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+
+        flagged = sorted_ = checked = 0
+        # Roll back anything a request may write.
+        with transaction.atomic():
+            for template in options['endpoints'] or ENDPOINTS:
+                try:
+                    path = template.format(**names)
+                except KeyError as exc:
+                    raise CommandError(f'Unknown placeholder {exc} in {template}')
+                if 'None' in path:
+                    self.stdout.write(self.style.WARNING(f'GET {template}: skipped, no sample data'))
+                    continue
+                with CaptureQueriesContext(connection) as queries:
+                    response = client.get(path)
+                selects = list(dict.fromkeys(
+                    query['sql'] for query in queries.captured_queries
+                    if query['sql'].lstrip().upper().startswith('SELECT')
+                ))
+                self.stdout.write(f'GET {path}: {response.status_code}, {len(selects)} queries')
+                for sql in selects:
+                    checked += 1
+                    plan = self.explain(sql, options['planner_defaults'])
+                    scans = self.seq_scans(plan)
+                    if scans:
+                        flagged += 1
+                        self.stdout.write(self.style.ERROR(
+                            f"  seq scan on {', '.join(scans)}: {sql[:160]}"
+                        ))
+                    elif self.sorts(plan, options['sort_rows']):
+                        sorted_ += 1
+                        self.stdout.write(self.style.WARNING(f'  sort: {sql[:160]}'))
+                    if options['plans'] or (scans and options['verbosity'] > 1):
+                        text = self.explain(sql, options['planner_defaults'], text=True)
+                        self.stdout.write('    ' + '\n    '.join(text))
+            transaction.set_rollback(True)
+
+        summary = (
+            f'{checked} queries checked, {flagged} with sequential scans, '
+            f'{sorted_} more with large sorts'
+        )
+        if flagged and options['strict']:
+            raise CommandError(summary)
+        self.stdout.write((self.style.WARNING if flagged else self.style.SUCCESS)(summary))
+
+    def explain(self, sql, planner_defaults, text=False):
+        """The plan: PostgreSQL's as JSON (or text lines), SQLite's as lines."""
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                if not planner_defaults:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute(('EXPLAIN ' if text else 'EXPLAIN (FORMAT JSON) ') + sql)
+                rows = cursor.fetchall()
+                cursor.execute('RESET enable_seqscan')
+                if text:
+                    return [row[0] for row in rows]
+                plan = rows[0][0]
+                return (json.loads(plan) if isinstance(plan, str) else plan)[0]['Plan']
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def sorts(self, plan, min_rows):
+        if connection.vendor == 'postgresql':
+            return any(
+                node['Node Type'] in ('Sort', 'Incremental Sort') and node['Plan Rows'] > min_rows
+                for node, _ in plan_nodes(plan)
+            )
+        return any(SQLITE_SORT.search(line) for line in plan)
+
+    def seq_scans(self, plan):
+        tables = []
+        if connection.vendor == 'postgresql':
+            for node, parent in plan_nodes(plan):
+                if node['Node Type'] != 'Seq Scan':
+                    continue
+                # Reading the first rows of an unfiltered, unordered table is fine.
+                if parent is not None and parent['Node Type'] == 'Limit' and 'Filter' not in node:
+                    continue
+                tables.append(node['Relation Name'])
+        else:
+            tables = [match.group(1) for match in map(SQLITE_SEQ_SCAN.search, plan) if match]
+        return list(dict.fromkeys(tables))
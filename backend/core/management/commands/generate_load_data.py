@@ -0,0 +1,541 @@
+import argparse
+import random
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from blog.models import BlogComment, BlogPost
+from booking.models import Booking, Payment
+from business.models import Business
+from chatbot.models import Conversation, Message
+from destinations.models import Destination, DestinationReview
+from events.models import Event, EventRegistration
+from packages.models import Departure, Package
+from users.models import User, UserProfile
+
+# Default row counts at --scale 1 (about 21k rows). --scale 50 gives ~1M.
+VOLUMES = {
+    'users': 1000,
+    'destinations': 200,
+    'reviews_per_destination': 10,
+    'events': 200,
+    'registrations_per_event': 20,
+    'packages': 200,
+    'departures_per_package': 5,
+    'businesses': 200,
+    'bookings': 2000,
+    'posts': 200,
+    'comments_per_post': 10,
+    'conversations': 500,
+    'messages_per_conversation': 10,
+}
+PER_PARENT = {key for key in VOLUMES if '_per_' in key}
+# Generated dates are relative to this one, so a seed always gives the same rows.
+ANCHOR_DATE = '2027-01-01'
+
+CITIES = [
+    ('Addis Ababa', 'addis_ababa', 9.0054, 38.7636),
+    ('Gondar', 'amhara', 12.6030, 37.4521),
+    ('Lalibela', 'amhara', 12.0317, 39.0476),
+    ('Bahir Dar', 'amhara', 11.5742, 37.3614),
+    ('Axum', 'amhara', 14.1211, 38.7233),
+    ('Harar', 'harari', 9.3126, 42.1227),
+    ('Dire Dawa', 'diredawa', 9.6009, 41.8501),
+    ('Hawassa', 'sidama', 7.0621, 38.4764),
+    ('Arba Minch', 'southern', 6.0333, 37.5500),
+    ('Jimma', 'oromia', 7.6733, 36.8344),
+    ('Bishoftu', 'oromia', 8.7525, 38.9785),
+    ('Semera', 'afar', 11.7922, 41.0064),
+    ('Gambela', 'gambela', 8.2500, 34.5833),
+    ('Jijiga', 'somali', 9.3500, 42.8000),
+]
+FIRST_NAMES = [
+    'Abebe', 'Almaz', 'Bekele', 'Chaltu', 'Dawit', 'Eleni', 'Fikru', 'Genet',
+    'Hana', 'Kebede', 'Liya', 'Meron', 'Nardos', 'Selam', 'Tesfaye', 'Yonas',
+]
+LAST_NAMES = [
+    'Alemu', 'Bekele', 'Girma', 'Haile', 'Kassa', 'Mekonnen', 'Negash',
+    'Tadesse', 'Tefera', 'Wolde', 'Worku', 'Yilma',
+]
+ADJECTIVES = [
+    'Ancient', 'Hidden', 'Sacred', 'Majestic', 'Scenic', 'Historic', 'Vibrant',
+    'Remote', 'Royal', 'Colourful', 'Wild', 'Peaceful',
+]
+NOUNS = [
+    'Churches', 'Highlands', 'Falls', 'Lake', 'Castle', 'Market', 'Monastery',
+    'Valley', 'Crater', 'Trail', 'Festival', 'Coffee Route', 'Rift', 'Gorge',
+]
+INTERESTS = ['hiking', 'history', 'culture', 'food', 'wildlife', 'photography', 'religion', 'music']
+WORDS = (
+    'ethiopia travel journey coffee injera highlands culture history church '
+    'rock hewn lake market festival guide tour mountain village river valley '
+    'ancient monastery wildlife trek view sunrise local food music dance'
+).split()
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def anchor_date(value):
+    """--anchor-date: YYYY-MM-DD, or 'today'."""
+    if value == 'today':
+        return timezone.localdate()
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a YYYY-MM-DD date or 'today': {value!r}")
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate deterministic synthetic data across all apps for load testing. '
+        'Rows are inserted with bulk_create in batches, bypassing model save() '
+        'and signals. Running twice with the same --seed collides on unique '
+        'fields; use a different seed or flush the database first.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+        parser.add_argument(
+            '--scale', type=float, default=1.0,
+            help='Multiply every default volume by this factor (default: 1, ~21k rows)'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=2000,
+            help='Rows per bulk_create call (default: 2000)'
+        )
+        parser.add_argument(
+            '--anchor-date', type=anchor_date, default=ANCHOR_DATE,
+            help=f"Date event and departure dates are spread around, YYYY-MM-DD or 'today' "
+                 f"for realistic \"upcoming\" filters (default: {ANCHOR_DATE})"
+        )
+        for key in VOLUMES:
+            parser.add_argument(
+                f"--{key.replace('_', '-')}", type=int, dest=key,
+                help=f'Override the scaled volume for {key} (default: {VOLUMES[key]})'
+            )
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.seed = options['seed']
+        self.batch_size = options['batch_size']
+        if self.batch_size < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        # Per-parent averages stay fixed; only top-level counts scale.
+        self.volumes = {
+            key: options[key] if options[key] is not None
+            else default if key in PER_PARENT
+            else int(default * options['scale'])
+            for key, default in VOLUMES.items()
+        }
+        self.anchor = options['anchor_date']
+        self.password = make_password('loadtest123')
+        self.counts = {}
+
+        steps = [
+            self.generate_users,
+            self.generate_destinations,
+            self.generate_events,
+            self.generate_packages,
+            self.generate_businesses,
+            self.generate_bookings,
+            self.generate_posts,
+            self.generate_conversations,
+        ]
+        start = time.perf_counter()
+        try:
+            for step in steps:
+                step()
+        except IntegrityError as e:
+            raise CommandError(
+                f'Insert failed ({e}). Data for seed {self.seed} probably exists '
+                'already; pick another --seed or flush the database.'
+            )
+        self.reset_sequences()
+
+        elapsed = time.perf_counter() - start
+        total = sum(self.counts.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {total:,} rows in {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} rows/s)"
+        ))
+
+    # Helpers
+
+    def uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def words(self, low, high):
+        return ' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(low, high)))
+
+    def paragraph(self, sentences=3):
+        return ' '.join(self.words(6, 14).capitalize() + '.' for _ in range(sentences))
+
+    def title(self):
+        return f'{self.rng.choice(ADJECTIVES)} {self.rng.choice(NOUNS)} of {self.rng.choice(CITIES)[0]}'
+
+    def image(self, kind, i):
+        return f'https://picsum.photos/seed/{kind}-{self.seed}-{i}/800/600'
+
+    def place(self):
+        city, region, lat, lng = self.rng.choice(CITIES)
+        jitter = lambda: Decimal(self.rng.uniform(-0.05, 0.05)).quantize(Decimal('0.000001'))
+        return city, region, Decimal(str(lat)) + jitter(), Decimal(str(lng)) + jitter()
+
+    def amount(self, low, high):
+        return Decimal(self.rng.randrange(low * 100, high * 100, 50)) / 100
+
+    def children(self, key):
+        average = self.volumes[key]
+        return self.rng.randint(average // 2, average + average // 2) if average else 0
+
+    def aware(self, day, hour=0):
+        return timezone.make_aware(datetime.combine(day, dt_time(hour)))
+
+    def next_id(self, model):
+        """
+        First free integer primary key. Autoincrement models get explicit ids
+        so children can reference parents without reading them back (SQLite
+        does not return ids from bulk_create); sequences are reset at the end.
+        """
+        return (model.objects.aggregate(m=Max('pk'))['m'] or 0) + 1
+
+    def insert(self, model, objs):
+        """bulk_create `objs` in batches, one transaction per batch."""
+        count = 0
+        start = time.perf_counter()
+        for chunk in _chunks(objs, self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(chunk)
+            count += len(chunk)
+        elapsed = time.perf_counter() - start
+        name = model._meta.label
+        self.counts[name] = self.counts.get(name, 0) + count
+        self.stdout.write(
+            f"{name}: {count:,} rows ({count / elapsed if elapsed else 0:,.0f} rows/s)"
+        )
+
+    def reset_sequences(self):
+        models = [Event, Package, Business, BlogPost, Conversation]
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+
+    # Generators
+
+    def generate_users(self):
+        users, profiles = [], []
+        for i in range(self.volumes['users']):
+            first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            city, _, _, _ = self.place()
+            user = User(
+                id=self.uuid(),
+                username=f'lt{self.seed}_{i}'[:20],
+                email=f'lt{self.seed}_{i}@loadtest.example.com',
+                password=self.password,
+                first_name=first,
+                last_name=last,
+                role='business_owner' if self.rng.random() < 0.1 else 'user',
+                status='active',
+                email_verified=True,
+                interests=self.rng.sample(INTERESTS, self.rng.randint(0, 3)),
+            )
+            users.append(user)
+            profiles.append(UserProfile(
+                id=self.uuid(),
+                user_id=user.id,
+                bio=self.paragraph(1),
+                country='Ethiopia',
+                city=city,
+                travel_interests=user.interests,
+                budget_range=self.rng.choice(['Budget', 'Mid-range', 'Luxury']),
+            ))
+        self.insert(User, users)
+        self.insert(UserProfile, profiles)
+        self.user_ids = [user.id for user in users]
+        self.owner_ids = [user.id for user in users if user.role == 'business_owner'] or self.user_ids
+
+    def generate_destinations(self):
+        categories = [c for c, _ in Destination.CATEGORY_CHOICES]
+        destinations, reviews = [], []
+        for i in range(self.volumes['destinations']):
+            city, region, lat, lng = self.place()
+            destination = Destination(
+                id=self.uuid(),
+                user_id=self.rng.choice(self.user_ids),
+                title=self.title(),
+                slug=f'destination-{self.seed}-{i}',
+                description=self.paragraph(4),
+                category=self.rng.choice(categories),
+                region=region,
+                city=city,
+                address=f'{city}, Ethiopia',
+                latitude=lat,
+                longitude=lng,
+                featured=self.rng.random() < 0.1,
+                status='active' if self.rng.random() < 0.9 else 'draft',
+                images=[self.image('destination', i)],
+                gallery_images=[self.image(f'destination-{i}', n) for n in range(3)],
+            )
+            ratings = []
+            for _ in range(self.children('reviews_per_destination')):
+                rating = self.rng.choices(range(1, 6), weights=[1, 1, 3, 5, 5])[0]
+                ratings.append(rating)
+                reviews.append(DestinationReview(
+                    id=self.uuid(),
+                    destination_id=destination.id,
+                    user_id=self.rng.choice(self.user_ids),
+                    rating=rating,
+                    title=self.words(2, 5).capitalize(),
+                    content=self.paragraph(2),
+                    helpful=self.rng.randint(0, 20),
+                ))
+            # Keep the denormalised counters consistent with the reviews.
+            destination.review_count = len(ratings)
+            destination.rating = (
+                Decimal(sum(ratings) / len(ratings)).quantize(Decimal('0.01')) if ratings else 0
+            )
+            destinations.append(destination)
+        self.insert(Destination, destinations)
+        self.insert(DestinationReview, reviews)
+
+    def generate_events(self):
+        categories = [c for c, _ in Event.CATEGORY_CHOICES]
+        events, registrations = [], []
+        first_id = self.next_id(Event)
+        for i in range(self.volumes['events']):
+            city, _, lat, lng = self.place()
+            start = self.anchor + timedelta(days=self.rng.randint(-90, 180))
+            attendees = self.rng.sample(
+                self.user_ids, min(self.children('registrations_per_event'), len(self.user_ids))
+            )
+            event = Event(
+                id=first_id + i,
+                title=self.title(),
+                slug=f'event-{self.seed}-{i}',
+                description=self.paragraph(4),
+                category=self.rng.choice(categories),
+                start_date=self.aware(start, self.rng.randint(8, 18)),
+                end_date=self.aware(start + timedelta(days=self.rng.randint(0, 3)), 22),
+                location=city,
+                address=f'{city}, Ethiopia',
+                latitude=lat,
+                longitude=lng,
+                featured=self.rng.random() < 0.1,
+                status='published' if self.rng.random() < 0.85 else 'draft',
+                organizer_id=self.rng.choice(self.user_ids),
+                price=self.amount(0, 2000),
+                capacity=len(attendees) + self.rng.randint(10, 200),
+                current_attendees=len(attendees),
+                images=[self.image('event', i)],
+            )
+            events.append(event)
+            for user_id in attendees:
+                registrations.append(EventRegistration(
+                    event_id=event.id,
+                    user_id=user_id,
+                    status=self.rng.choices(
+                        ['confirmed', 'pending', 'cancelled', 'attended'], weights=[6, 2, 1, 1]
+                    )[0],
+                ))
+        self.insert(Event, events)
+        self.insert(EventRegistration, registrations)
+        self.event_ids = [event.id for event in events]
+
+    def generate_packages(self):
+        packages, departures = [], []
+        first_id = self.next_id(Package)
+        for i in range(self.volumes['packages']):
+            city, region, lat, lng = self.place()
+            days = self.rng.randint(1, 14)
+            price = self.amount(1000, 50000)
+            package = Package(
+                id=first_id + i,
+                organizer_id=self.rng.choice(self.owner_ids),
+                title=self.title(),
+                slug=f'package-{self.seed}-{i}',
+                description=self.paragraph(4),
+                short_description=self.words(8, 16).capitalize(),
+                location=city,
+                region=region,
+                price=price,
+                discounted_price=price * Decimal('0.9') if self.rng.random() < 0.3 else None,
+                duration=f'{days} days',
+                duration_in_days=days,
+                image=self.image('package', i),
+                gallery_images=[self.image(f'package-{i}', n) for n in range(3)],
+                category=self.rng.sample(INTERESTS, self.rng.randint(1, 3)),
+                included=['Transport', 'Guide', 'Accommodation'][:self.rng.randint(1, 3)],
+                not_included=['Flights', 'Tips'],
+                itinerary=[
+                    {'day': d + 1, 'title': self.words(2, 4).capitalize(), 'description': self.paragraph(1)}
+                    for d in range(days)
+                ],
+                departure=city,
+                departure_time=dt_time(self.rng.randint(5, 10)),
+                return_time=dt_time(self.rng.randint(16, 21)),
+                max_group_size=self.rng.randint(4, 30),
+                min_age=self.rng.choice([0, 6, 12, 18]),
+                difficulty=self.rng.choice(['Easy', 'Moderate', 'Challenging']),
+                tour_guide=f'{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}',
+                languages=self.rng.sample(['English', 'Amharic', 'French', 'German'], self.rng.randint(1, 3)),
+                rating=Decimal(self.rng.uniform(3, 5)).quantize(Decimal('0.01')),
+                coordinates=[float(lat), float(lng)],
+                status='active' if self.rng.random() < 0.9 else 'draft',
+                featured=self.rng.random() < 0.1,
+            )
+            packages.append(package)
+            for _ in range(self.children('departures_per_package')):
+                start = self.anchor + timedelta(days=self.rng.randint(1, 365))
+                departures.append(Departure(
+                    package_id=package.id,
+                    start_date=start,
+                    end_date=start + timedelta(days=days),
+                    price=price,
+                    available_slots=self.rng.randint(0, package.max_group_size),
+                    is_guaranteed=self.rng.random() < 0.3,
+                ))
+        self.insert(Package, packages)
+        self.insert(Departure, departures)
+        self.packages = [(package.id, package.price) for package in packages]
+
+    def generate_businesses(self):
+        types = ['hotel', 'restaurant', 'tour_operator', 'cafe', 'lodge', 'travel_agency']
+        businesses = []
+        first_id = self.next_id(Business)
+        for i in range(self.volumes['businesses']):
+            city, region, lat, lng = self.place()
+            name = f'{self.rng.choice(ADJECTIVES)} {city} {self.rng.choice(types).replace("_", " ").title()}'
+            businesses.append(Business(
+                id=first_id + i,
+                name=name,
+                slug=f'business-{self.seed}-{i}',
+                business_type=self.rng.choice(types),
+                description=self.paragraph(3),
+                contact_email=f'contact{i}@business-{self.seed}.example.com',
+                contact_phone=f'+2519{self.rng.randint(10000000, 99999999)}',
+                website=f'https://business-{self.seed}-{i}.example.com',
+                region=region,
+                city=city,
+                address=f'{city}, Ethiopia',
+                latitude=lat,
+                longitude=lng,
+                main_image=self.image('business', i),
+                gallery_images=[self.image(f'business-{i}', n) for n in range(3)],
+                opening_hours={'mon-fri': '08:00-20:00', 'sat-sun': '09:00-18:00'},
+                facilities=self.rng.sample(['wifi', 'parking', 'pool', 'restaurant', 'spa'], 2),
+                services=self.rng.sample(['tours', 'catering', 'transfers', 'rooms'], 2),
+                status=self.rng.choices(['approved', 'pending', 'rejected'], weights=[8, 2, 1])[0],
+                is_verified=self.rng.random() < 0.7,
+                is_featured=self.rng.random() < 0.1,
+                owner_id=self.rng.choice(self.owner_ids),
+            ))
+        self.insert(Business, businesses)
+        self.business_ids = [business.id for business in businesses]
+
+    def generate_bookings(self):
+        targets = (
+            [('event_id', pk, None) for pk in self.event_ids] +
+            [('package_id', pk, price) for pk, price in self.packages] +
+            [('business_id', pk, None) for pk in self.business_ids]
+        )
+        if not targets:
+            return
+        payment_status = {
+            'confirmed': 'completed', 'completed': 'completed',
+            'pending': 'pending', 'cancelled': 'refunded',
+        }
+        bookings, payments = [], []
+        for _ in range(self.volumes['bookings']):
+            field, target_id, price = self.rng.choice(targets)
+            people = self.rng.randint(1, 6)
+            status = self.rng.choices(
+                ['confirmed', 'pending', 'completed', 'cancelled'], weights=[5, 2, 2, 1]
+            )[0]
+            booking = Booking(
+                id=self.uuid(),
+                user_id=self.rng.choice(self.user_ids),
+                status=status,
+                number_of_people=people,
+                special_requests=self.words(4, 10) if self.rng.random() < 0.2 else None,
+                **{field: target_id}
+            )
+            bookings.append(booking)
+            payments.append(Payment(
+                id=self.uuid(),
+                booking_id=booking.id,
+                amount=(price or self.amount(200, 5000)) * people,
+                payment_method=self.rng.choice(['chapa', 'stripe', 'cash']),
+                status=payment_status[status],
+                transaction_id=f'tx-{self.seed}-{self.rng.getrandbits(48):012x}',
+            ))
+        self.insert(Booking, bookings)
+        self.insert(Payment, payments)
+
+    def generate_posts(self):
+        posts, comments = [], []
+        first_id = self.next_id(BlogPost)
+        for i in range(self.volumes['posts']):
+            author_id = self.rng.choice(self.user_ids)
+            content = '\n\n'.join(self.paragraph(5) for _ in range(self.rng.randint(3, 8)))
+            post = BlogPost(
+                id=first_id + i,
+                title=self.title(),
+                slug=f'post-{self.seed}-{i}',
+                excerpt=self.paragraph(1),
+                content=content,
+                tags=self.rng.sample(INTERESTS, self.rng.randint(1, 4)),
+                imageUrl=self.image('post', i),
+                author_id=author_id,
+                authorName=f'{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}',
+                status='published' if self.rng.random() < 0.85 else 'draft',
+                views=self.rng.randint(0, 10000),
+                readTime=max(1, len(content.split()) // 200),
+                featured=self.rng.random() < 0.1,
+            )
+            posts.append(post)
+            for _ in range(self.children('comments_per_post')):
+                comments.append(BlogComment(
+                    post_id=post.id,
+                    author_id=self.rng.choice(self.user_ids),
+                    content=self.paragraph(1),
+                    helpful_count=self.rng.randint(0, 10),
+                ))
+        self.insert(BlogPost, posts)
+        self.insert(BlogComment, comments)
+
+    def generate_conversations(self):
+        conversations, messages = [], []
+        first_id = self.next_id(Conversation)
+        for i in range(self.volumes['conversations']):
+            conversation = Conversation(
+                id=first_id + i,
+                user_id=self.rng.choice(self.user_ids) if self.rng.random() < 0.7 else None,
+                session_id=f'loadtest-{self.seed}-{i}',
+            )
+            conversations.append(conversation)
+            for n in range(self.children('messages_per_conversation')):
+                messages.append(Message(
+                    conversation_id=conversation.id,
+                    content=self.paragraph(1) if n % 2 else self.words(4, 12).capitalize() + '?',
+                    sender='bot' if n % 2 else 'user',
+                ))
+        self.insert(Conversation, conversations)
+        self.insert(Message, messages)
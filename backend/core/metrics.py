@@ -0,0 +1,108 @@
+"""
+Prometheus metrics, served at /metrics.
+
+Under gunicorn with several workers, set PROMETHEUS_MULTIPROC_DIR to an empty
+writable directory before the server starts; every worker then writes its
+samples to mmap files there and the scrape aggregates them. Gunicorn should
+call ``mark_process_dead`` from its ``child_exit`` hook.
+"""
+import os
+
+from django.db.models import Count
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+MULTIPROCESS = bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+REQUESTS = Counter(
+    'ethiotravel_http_requests_total', 'HTTP requests by route name and status',
+    ['method', 'route', 'status'],
+)
+REQUEST_LATENCY = Histogram(
+    'ethiotravel_http_request_duration_seconds', 'HTTP request latency by route name',
+    ['method', 'route'],
+)
+RESPONSE_BYTES = Counter(
+    'ethiotravel_http_response_bytes_total', 'Response body bytes by route name (streamed bodies excluded)',
+    ['route'],
+)
+DB_QUERIES = Histogram(
+    'ethiotravel_db_queries_per_request', 'SQL queries run per request',
+    ['route'], buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, float('inf')),
+)
+DB_TIME = Histogram(
+    'ethiotravel_db_time_per_request_seconds', 'Time spent in SQL per request',
+    ['route'], buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, float('inf')),
+)
+CACHE_READS = Counter(
+    'ethiotravel_cache_reads_total', 'Cache reads by result; hit ratio is hit / (hit + miss)',
+    ['result'],
+)
+CHATBOT_UPSTREAM_LATENCY = Histogram(
+    'ethiotravel_chatbot_upstream_duration_seconds', 'Latency of Gemini generate_content calls',
+    ['outcome'], buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, float('inf')),
+)
+EMAILS_IN_FLIGHT = Gauge(
+    'ethiotravel_email_send_in_progress', 'Emails currently being delivered (the send queue depth)',
+    multiprocess_mode='livesum',
+)
+EMAILS_SENT = Counter(
+    'ethiotravel_emails_total', 'Emails handed to the mail server, by outcome', ['outcome'],
+)
+EMAIL_LATENCY = Histogram(
+    'ethiotravel_email_send_duration_seconds', 'Time to deliver a batch of emails',
+)
+
+
+def observe_cache(hits, misses):
+    if hits:
+        CACHE_READS.labels('hit').inc(hits)
+    if misses:
+        CACHE_READS.labels('miss').inc(misses)
+
+
+class StateCollector:
+    """Booking and payment counts per status, queried at scrape time."""
+
+    FAMILIES = (('Booking', 'ethiotravel_bookings'), ('Payment', 'ethiotravel_payments'))
+
+    def describe(self):
+        # Lets the registry learn the metric names without querying the
+        # database at import time (which may be inside an event loop).
+        for model_name, name in self.FAMILIES:
+            yield GaugeMetricFamily(name, f'{model_name}s by status', labels=['status'])
+
+    def collect(self):
+        from booking import models
+
+        for model_name, name in self.FAMILIES:
+            model = getattr(models, model_name)
+            family = GaugeMetricFamily(name, f'{model_name}s by status', labels=['status'])
+            for row in model.objects.values('status').annotate(n=Count('pk')).order_by():
+                family.add_metric([row['status']], row['n'])
+            yield family
+
+
+_state_collector = StateCollector()
+if not MULTIPROCESS:
+    REGISTRY.register(_state_collector)
+
+
+def render():
+    """Return (body, content_type) for a scrape."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(_state_collector)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid):
+    """Gunicorn child_exit hook: drop live gauges of a worker that exited."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,263 @@
+import asyncio
+import hmac
+import random
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware as BaseWhiteNoiseMiddleware
+
+from . import compression, profiling
+from .db import routers
+
+
+class SyncAndAsyncMiddleware:
+    """
+    Base for middleware that runs natively under both WSGI and ASGI, so that
+    async views (ASYNC_VIEWS) aren't pushed back onto a sync thread. Subclasses
+    implement ``__call__`` and ``__acall__``; call ``dispatch`` from __call__.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Makes iscoroutinefunction(self) true, as MiddlewareMixin does.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def is_async(self):
+        return asyncio.iscoroutinefunction(self.get_response)
+
+
+class RequestProfilingMiddleware(SyncAndAsyncMiddleware):
+    """
+    Profile a request when it carries the REQUEST_PROFILING_HEADER (whose
+    value must match REQUEST_PROFILING_TOKEN, or anything when DEBUG is on
+    and no token is set) or is picked by REQUEST_PROFILING_SAMPLE_RATE.
+
+    Profiled responses get a Server-Timing header and are kept in a per-process
+    ring buffer served at /api/_debug/requests/. With sampling off and no way
+    to trigger it by header the middleware removes itself at startup.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.sample_rate = settings.REQUEST_PROFILING_SAMPLE_RATE
+        self.token = settings.REQUEST_PROFILING_TOKEN
+        self.header = 'HTTP_' + settings.REQUEST_PROFILING_HEADER.upper().replace('-', '_')
+        self.header_enabled = bool(self.token) or settings.DEBUG
+        if not self.sample_rate and not self.header_enabled:
+            raise MiddlewareNotUsed
+        profiling.install()
+
+    def trigger(self, request):
+        value = request.META.get(self.header) if self.header_enabled else None
+        if value is not None and (not self.token or hmac.compare_digest(value, self.token)):
+            return 'header'
+        if self.sample_rate and random.random() < self.sample_rate:
+            return 'sample'
+        return None
+
+    def __call__(self, request):
+        if self.is_async():
+            return self.__acall__(request)
+        trigger = self.trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        with profiling.profile_request(request, trigger) as profile:
+            response = self.get_response(request)
+        return self.finish(profile, response)
+
+    async def __acall__(self, request):
+        trigger = self.trigger(request)
+        if trigger is None:
+            return await self.get_response(request)
+
+        with profiling.profile_request(request, trigger) as profile:
+            response = await self.get_response(request)
+        return self.finish(profile, response)
+
+    def finish(self, profile, response):
+        response['Server-Timing'] = profile.server_timing()
+        profiling.record(profile.as_dict(response))
+        return response
+
+
+class MetricsMiddleware(SyncAndAsyncMiddleware):
+    """
+    Record Prometheus request count, latency and per-request SQL volume,
+    labelled by the resolved route name (e.g. destinations:destination-list).
+    Disabled with METRICS_ENABLED = False.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        from . import metrics
+
+        super().__init__(get_response)
+        self.metrics = metrics
+        profiling.install()
+        if metrics.observe_cache not in profiling.cache_observers:
+            profiling.cache_observers.append(metrics.observe_cache)
+
+    def __call__(self, request):
+        if self.is_async():
+            return self.__acall__(request)
+        queries = [0, 0.0]
+        start = time.perf_counter()
+        with profiling.observe_queries(self.counter(queries)):
+            response = self.get_response(request)
+        return self.record(request, response, time.perf_counter() - start, queries)
+
+    async def __acall__(self, request):
+        queries = [0, 0.0]
+        start = time.perf_counter()
+        with profiling.observe_queries(self.counter(queries)):
+            response = await self.get_response(request)
+        return self.record(request, response, time.perf_counter() - start, queries)
+
+    @staticmethod
+    def counter(queries):
+        def count_query(sql, seconds):
+            queries[0] += 1
+            queries[1] += seconds
+        return count_query
+
+    def record(self, request, response, elapsed, queries):
+        match = getattr(request, 'resolver_match', None)
+        route = match.view_name if match is not None else '<unresolved>'
+        self.metrics.REQUESTS.labels(request.method, route, response.status_code).inc()
+        self.metrics.REQUEST_LATENCY.labels(request.method, route).observe(elapsed)
+        if not response.streaming:
+            self.metrics.RESPONSE_BYTES.labels(route).inc(len(response.content))
+        self.metrics.DB_QUERIES.labels(route).observe(queries[0])
+        self.metrics.DB_TIME.labels(route).observe(queries[1])
+        return response
+
+
+class CompressionMiddleware(SyncAndAsyncMiddleware):
+    """
+    Compress JSON responses of at least COMPRESSION_MIN_BYTES with gzip or
+    Brotli, whichever the client accepts (core.compression); streamed ones
+    whatever their size. A response cached by core.conditional carries its
+    cache key, and its compressed body is cached alongside it. Disabled with
+    COMPRESSION_ENABLED = False.
+    """
+
+    def __init__(self, get_response):
+        if not settings.COMPRESSION_ENABLED:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        self.min_bytes = settings.COMPRESSION_MIN_BYTES
+
+    def __call__(self, request):
+        if self.is_async():
+            return self.__acall__(request)
+        return self.finish(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.finish(request, await self.get_response(request))
+
+    def finish(self, request, response):
+        if not compression.compressible(response):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = compression.negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compression.compress_stream(response.streaming_content, encoding)
+            del response['Content-Length']
+        else:
+            if len(response.content) < self.min_bytes:
+                return response
+            content = compression.compress(
+                response.content, encoding, getattr(response, 'response_cache_key', None),
+            )
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response['Content-Length'] = str(len(content))
+
+        # The bytes differ from the uncompressed ones, as Django's GZipMiddleware reasons.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
+
+
+class ReplicaRoutingMiddleware(SyncAndAsyncMiddleware):
+    """
+    Let safe-method requests to REPLICA_APPS views read from a replica
+    (core.db.routers), unless the client wrote something recently. Every
+    unsafe-method request pins its client to the primary for
+    READ_YOUR_WRITES_SECONDS. Removed at startup when no replica is configured.
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def __call__(self, request):
+        if self.is_async():
+            return self.__acall__(request)
+        with routers.request_routing():
+            response = self.get_response(request)
+        return self.finish(request, response)
+
+    async def __acall__(self, request):
+        with routers.request_routing():
+            response = await self.get_response(request)
+        return self.finish(request, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = routers.current()
+        if state is None or request.method not in self.SAFE_METHODS:
+            return None
+        app = view_func.__module__.partition('.')[0]
+        state.allowed = app in settings.REPLICA_APPS and not routers.is_pinned(request)
+        return None
+
+    def finish(self, request, response):
+        if request.method not in self.SAFE_METHODS:
+            routers.pin_to_primary(request, response)
+        return response
+
+
+class WhiteNoiseMiddleware(BaseWhiteNoiseMiddleware):
+    """
+    WhiteNoise, usable without adaptation under ASGI. Static files are looked
+    up in memory and served as is; everything else is passed straight on.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
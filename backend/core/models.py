@@ -7,4 +7,16 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+
+class SlugCounter(models.Model):
+    """The highest "-N" suffix given out for a slug base of a model (core.slugs)."""
+    scope = models.CharField(max_length=100)  # The model's label
+    base = models.CharField(max_length=255)
+    last = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['scope', 'base']
+
+    def __str__(self):
+        return f'{self.scope}: {self.base}-{self.last}'
@@ -0,0 +1,117 @@
+"""
+The OpenAPI schema, pre-rendered.
+
+Generating the schema introspects every view and serializer, so it is done
+once: ``manage.py build_openapi_schema`` writes it to STATIC_ROOT at deploy
+time, where WhiteNoise serves it (with .gz/.br siblings), and ``swagger.json``
+redirects there. Without that file, and for ``swagger.yaml``, the schema is
+rendered on first request and kept in memory.
+
+Both are keyed by RELEASE_VERSION, so a new release never serves the previous
+one's schema. In DEBUG the static file is ignored; the schema follows the code.
+"""
+import os
+import re
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.shortcuts import redirect
+from django.urls import resolve, reverse
+from django.views.decorators.csrf import csrf_exempt
+
+_lock = threading.Lock()
+_rendered = {}
+_static_files = {}
+
+
+def version():
+    return re.sub(r'[^\w.-]', '-', settings.RELEASE_VERSION)
+
+
+def static_name(release=None):
+    return f'openapi/schema-{release or version()}.json'
+
+
+def static_path(release=None):
+    return os.path.join(settings.STATIC_ROOT, static_name(release))
+
+
+def static_url():
+    """URL of the pre-built schema for this release, or None if there is none."""
+    if settings.DEBUG:
+        return None
+    key = (settings.STATIC_ROOT, version())
+    if key not in _static_files:
+        _static_files[key] = os.path.isfile(static_path())
+    if not _static_files[key]:
+        return None
+    # Not via staticfiles_storage.url(): the file isn't in the manifest.
+    return settings.STATIC_URL + static_name()
+
+
+def render(format='.json'):
+    """Generate the schema with drf-yasg; returns (body, content_type)."""
+    from django.test import RequestFactory
+
+    path = reverse('schema-json', kwargs={'format': format})
+    view = resolve(path).func
+    view = getattr(view, 'schema_view', view)
+    # A build, not a client request: skip throttling (and its cache round trip).
+    view = view.cls.as_view(**{**view.initkwargs, 'throttle_classes': ()})
+    response = view(RequestFactory().get(path), format=format)
+    response.render()
+    if response.status_code != 200:
+        raise ValueError(f'Schema view returned {response.status_code} for {path}')
+    return response.content, response['Content-Type']
+
+
+def get(format='.json'):
+    """The rendered schema for this release, generated at most once per process."""
+    key = (version(), format)
+    try:
+        return _rendered[key]
+    except KeyError:
+        pass
+    with _lock:
+        if key not in _rendered:
+            _rendered[key] = render(format)
+        return _rendered[key]
+
+
+def cached_schema_view(schema_view):
+    """
+    Wrap drf-yasg's ``without_ui`` view: JSON redirects to the static file when
+    one was built for this release; otherwise both formats come from memory.
+    """
+    @csrf_exempt
+    def view(request, format=None):
+        # Query strings (?version=...) are rare; leave them to drf-yasg.
+        if request.method not in ('GET', 'HEAD') or request.GET:
+            return schema_view(request, format=format)
+        if format == '.json':
+            url = static_url()
+            if url:
+                return redirect(url)
+        try:
+            body, content_type = get(format)
+        except ValueError:
+            return schema_view(request, format=format)
+        return HttpResponse(body, content_type=content_type)
+
+    view.schema_view = schema_view
+    return view
+
+
+def reset():
+    with _lock:
+        _rendered.clear()
+        _static_files.clear()
+
+
+@receiver(setting_changed)
+def _reset_on_setting_change(setting, **kwargs):
+    if setting in ('ROOT_URLCONF', 'RELEASE_VERSION', 'STATIC_ROOT', 'SWAGGER_SETTINGS'):
+        reset()
@@ -0,0 +1,247 @@
+"""
+Per-request profiling: wall time, SQL (with duplicate detection), cache hits
+and misses, and serializer time.
+
+Instrumentation hooks are installed once, and only when profiling or metrics
+can use them (see core.middleware). They check a context variable and return
+straight away when the current request is not being profiled and nothing is
+observing cache reads. Context variables, unlike thread-locals, follow a
+request into the threads sync_to_async runs its ORM calls in under ASGI.
+"""
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+_local = threading.local()
+_profile = ContextVar('request_profile', default=None)
+# Callables taking (sql, seconds), run for every query of the current request.
+_query_listeners = ContextVar('query_listeners', default=())
+_install_lock = threading.Lock()
+_installed = False
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+_MISSING = object()
+
+# Callables taking (hits, misses), run for every cache read once installed.
+cache_observers = []
+
+
+def current():
+    """The RequestProfile of the request being handled, or None."""
+    return _profile.get()
+
+
+class RequestProfile:
+    def __init__(self, request, trigger):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.trigger = trigger
+        self.started_at = timezone.now()
+        self.start = time.perf_counter()
+        self.total_ms = 0.0
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.sql_shapes = Counter()
+        self.sql_shape_ms = defaultdict(float)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.serializer_ms = 0.0
+        self.serializer_depth = 0
+
+    def add_query(self, sql, seconds):
+        elapsed = seconds * 1000
+        self.sql_count += 1
+        self.sql_ms += elapsed
+        # sql is the parameterised template, so equal shapes compare equal.
+        self.sql_shapes[sql] += 1
+        self.sql_shape_ms[sql] += elapsed
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self.start) * 1000
+
+    def duplicate_queries(self):
+        """Query shapes run more than once, most frequent first (likely N+1s)."""
+        return [
+            {'sql': sql, 'count': count, 'time_ms': round(self.sql_shape_ms[sql], 3)}
+            for sql, count in self.sql_shapes.most_common() if count > 1
+        ]
+
+    def server_timing(self):
+        duplicates = sum(count - 1 for count in self.sql_shapes.values() if count > 1)
+        return ', '.join([
+            f'total;dur={self.total_ms:.1f}',
+            f'db;dur={self.sql_ms:.1f};desc="{self.sql_count} queries, {duplicates} duplicate"',
+            f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+            f'serializer;dur={self.serializer_ms:.1f}',
+        ])
+
+    def as_dict(self, response=None):
+        user = getattr(self.request, 'user', None)
+        return {
+            'id': self.id,
+            'started_at': self.started_at.isoformat(),
+            'method': self.request.method,
+            'path': self.request.get_full_path(),
+            'status': getattr(response, 'status_code', None),
+            'user': str(user.pk) if user is not None and user.is_authenticated else None,
+            'trigger': self.trigger,
+            'total_ms': round(self.total_ms, 3),
+            'sql': {
+                'count': self.sql_count,
+                'time_ms': round(self.sql_ms, 3),
+                'duplicates': self.duplicate_queries(),
+            },
+            'cache': {'hits': self.cache_hits, 'misses': self.cache_misses},
+            'serializer_ms': round(self.serializer_ms, 3),
+        }
+
+
+def _sql_wrapper(execute, sql, params, many, context):
+    listeners = _query_listeners.get()
+    if not listeners:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        for listener in listeners:
+            listener(sql, elapsed)
+
+
+def _add_sql_wrapper(connection, **kwargs):
+    if _sql_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_sql_wrapper)
+
+
+@contextmanager
+def observe_queries(listener):
+    """Call listener(sql, seconds) for each query run while handling this request."""
+    token = _query_listeners.set(_query_listeners.get() + (listener,))
+    try:
+        yield
+    finally:
+        _query_listeners.reset(token)
+
+
+@contextmanager
+def profile_request(request, trigger):
+    profile = RequestProfile(request, trigger)
+    token = _profile.set(profile)
+    try:
+        with observe_queries(profile.add_query):
+            yield profile
+    finally:
+        profile.finish()
+        _profile.reset(token)
+
+
+def _count_cache(profile, hits, misses):
+    if profile is not None:
+        profile.cache_hits += hits
+        profile.cache_misses += misses
+    for observer in cache_observers:
+        observer(hits, misses)
+
+
+def _wrap_cache_get(original):
+    def get(self, key, default=None, version=None, **kwargs):
+        profile = current()
+        if (profile is None and not cache_observers) or getattr(_local, 'in_get_many', False):
+            return original(self, key, default, version, **kwargs)
+        value = original(self, key, _MISSING, version, **kwargs)
+        if value is _MISSING:
+            _count_cache(profile, 0, 1)
+            return default
+        _count_cache(profile, 1, 0)
+        return value
+    get.profiling_original = original
+    return get
+
+
+def _wrap_cache_get_many(original):
+    def get_many(self, keys, version=None, **kwargs):
+        profile = current()
+        if (profile is None and not cache_observers) or getattr(_local, 'in_get_many', False):
+            return original(self, keys, version, **kwargs)
+        keys = list(keys)
+        # The default get_many() loops over get(); don't count those twice.
+        _local.in_get_many = True
+        try:
+            result = original(self, keys, version, **kwargs)
+        finally:
+            _local.in_get_many = False
+        _count_cache(profile, len(result), len(keys) - len(result))
+        return result
+    get_many.profiling_original = original
+    return get_many
+
+
+def _timed(original):
+    def wrapper(self, *args, **kwargs):
+        profile = current()
+        if profile is None or profile.serializer_depth:
+            return original(self, *args, **kwargs)
+        profile.serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            profile.serializer_ms += (time.perf_counter() - start) * 1000
+            profile.serializer_depth -= 1
+    return wrapper
+
+
+def install():
+    """Hook SQL execution and patch cache backends and DRF serializers. Idempotent."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        # Connections are per thread; wrap each one as it connects, and the
+        # ones this thread already has.
+        connection_created.connect(_add_sql_wrapper, dispatch_uid='core.profiling')
+        for connection in connections.all():
+            _add_sql_wrapper(connection)
+        for config in settings.CACHES.values():
+            try:
+                backend = import_string(config['BACKEND'])
+            except ImportError:
+                continue
+            if not hasattr(backend.get, 'profiling_original'):
+                backend.get = _wrap_cache_get(backend.get)
+            if not hasattr(backend.get_many, 'profiling_original'):
+                backend.get_many = _wrap_cache_get_many(backend.get_many)
+
+        from rest_framework import serializers
+        # Outermost serializer work only: nested serializers and the
+        # ListSerializer -> child calls are counted once.
+        for cls in (serializers.Serializer, serializers.ListSerializer):
+            cls.data = property(_timed(cls.data.fget))
+        serializers.BaseSerializer.is_valid = _timed(serializers.BaseSerializer.is_valid)
+        _installed = True
+
+
+def record(entry):
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = deque(maxlen=settings.REQUEST_PROFILING_BUFFER_SIZE)
+        _buffer.append(entry)
+
+
+def recent():
+    """Profiles recorded by this process, newest first."""
+    with _buffer_lock:
+        return list(reversed(_buffer or ()))
@@ -0,0 +1,100 @@
+"""
+JSON rendering with orjson, and a streaming JSON array for unpaginated
+exports.
+
+ORJSONRenderer (with core.parsers.ORJSONParser) replaces DRF's JSONRenderer
+(see REST_FRAMEWORK in settings). Types orjson doesn't know (Decimal,
+timedelta, lazy translations, querysets, ...) go through DRF's own
+JSONEncoder.default(), so a Decimal still becomes a number, and UUIDs and
+datetimes are written the way DRF writes them (UTC as 'Z', microseconds
+kept). Data orjson can't encode at all, such as integers wider than 64 bits,
+is rendered by DRF's. Without orjson installed, or for an indented response
+(the browsable API), it falls back to DRF's.
+
+The output differs from DRF's in two ways, both still valid JSON for the
+same values: floats with an exponent are written shortest ('1e-7' and '1e16'
+where DRF writes '1e-07' and '1e+16'), and NaN and infinities are written as
+null where DRF raises ValueError.
+
+For a response too large to build in memory at once:
+
+    return StreamingJSONResponse(
+        (serializer.to_representation(obj) for obj in queryset.iterator()), request=request,
+    )
+
+writes a JSON array item by item, in chunks of about CHUNK_SIZE bytes.
+Django 3.2's ASGI handler iterates a streaming body on the event loop, where
+the database can't be used: for an ASGI request the chunks are encoded in
+the view instead, and only the bytes are streamed.
+"""
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework import renderers
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional; DRF's json-based classes are used instead
+    orjson = None
+
+CHUNK_SIZE = 64 * 1024
+_default = JSONEncoder().default
+
+
+def dumps(data):
+    """data as compact JSON bytes, as DRF's JSONRenderer writes it but for floats (see above)."""
+    if orjson is None:
+        return renderers.JSONRenderer().render(data)
+    try:
+        ret = orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # Integers wider than 64 bits, or what DRF can't encode either.
+        return renderers.JSONRenderer().render(data)
+    # As DRF does: valid JSON, but not valid JavaScript unescaped.
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (
+            orjson is None
+            or not api_settings.COMPACT_JSON
+            or not api_settings.UNICODE_JSON
+            or self.get_indent(accepted_media_type or '', renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+def iter_json_array(items, chunk_size=CHUNK_SIZE):
+    """The JSON array of items, as byte chunks of about chunk_size."""
+    buffer, size, separator = [b'['], 1, b''
+    for item in items:
+        encoded = dumps(item)
+        buffer += [separator, encoded]
+        size += len(encoded) + 1
+        separator = b','
+        if size >= chunk_size:
+            yield b''.join(buffer)
+            buffer, size = [], 0
+    buffer.append(b']')
+    yield b''.join(buffer)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    A JSON array response written as items is consumed; with request an ASGI
+    request, items is consumed here.
+    """
+
+    def __init__(self, items, chunk_size=CHUNK_SIZE, request=None, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        chunks = iter_json_array(items, chunk_size)
+        if isinstance(getattr(request, '_request', request), ASGIRequest):
+            chunks = list(chunks)
+        super().__init__(chunks, **kwargs)
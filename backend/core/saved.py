@@ -0,0 +1,219 @@
+"""
+Everything a user saved, across SavedDestination, SavedPackage, SavedEvent,
+SavedBusiness and SavedPost, newest first (GET /api/me/saved/,
+core.views.SavedItemsView).
+
+    items, next_cursor = saved_items(user, cursor=None, limit=20, context={'request': request})
+
+A page is read with one UNION ALL over the five tables of (type, saved id,
+object id, saved time) rows; the saved objects on it are then read with one
+query per type, in the list representation of their endpoint
+(core.listing.represent). Pages are keyed by a cursor on (saved time, type,
+saved id) instead of an offset: a page costs the same however deep it is,
+and saving or unsaving meanwhile doesn't shift the next one.
+
+    saved, unsaved, missing = change_saved(user, 'package', save=['3', '7'], unsave=['5'])
+
+saves and unsaves many objects of a type at once (POST /api/me/saved/bulk/),
+idempotently: saving what is saved already or unsaving what isn't is not an
+error, so a double tap or a retry is harmless. It takes one SELECT of the
+objects named, one INSERT ... ON CONFLICT DO NOTHING and one DELETE.
+"""
+import base64
+import binascii
+import functools
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import CharField, F, Q, Value
+from django.db.models.functions import Cast
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+
+from .listing import represent
+
+INVALID_CURSOR = 'Invalid cursor'
+TYPES = ['destination', 'package', 'event', 'business', 'post']
+MAX_IDS = 100
+
+
+class SavedType:
+    def __init__(self, name, model, field, saved_at, serializer_class, select_related=()):
+        self.name = name
+        self.model = model
+        # The foreign key to the saved object, and the time it was saved.
+        self.field = field
+        self.saved_at = saved_at
+        self.serializer_class = serializer_class
+        self.select_related = select_related
+        self.object_model = model._meta.get_field(field).related_model
+
+    def rows(self, user, after):
+        """(type, saved id, object id, saved time) rows of user's, those after the cursor only."""
+        queryset = self.model.objects.filter(user=user).annotate(
+            type=Value(self.name, output_field=CharField()),
+            saved_id=Cast('pk', output_field=CharField()),
+            object_id=Cast(f'{self.field}_id', output_field=CharField()),
+            saved=F(self.saved_at),
+        )
+        if after is not None:
+            saved, name, saved_id = after
+            # (saved, type, saved_id) < after, with this type's name a constant.
+            if self.name < name:
+                queryset = queryset.filter(saved__lte=saved)
+            elif self.name > name:
+                queryset = queryset.filter(saved__lt=saved)
+            else:
+                queryset = queryset.filter(Q(saved__lt=saved) | Q(saved=saved, saved_id__lt=saved_id))
+        return queryset.order_by().values_list('type', 'saved_id', 'object_id', 'saved')
+
+    def object_pk(self, value):
+        """The saved object's primary key an id names, or None if it can't be one."""
+        pk = self.object_model._meta.pk
+        try:
+            key = pk.to_python(value)
+            pk.run_validators(key)
+        except DjangoValidationError:
+            return None
+        return key
+
+    def objects(self, ids, context):
+        """{object id, as rows() reads it: item} for the saved objects, in one query."""
+        pk = self.object_model._meta.pk
+        ids = {pk.to_python(value): value for value in ids}
+        queryset = self.object_model.objects.filter(pk__in=list(ids)).order_by()
+        return {
+            ids[found[0]]: item
+            for found, item in represent(self.serializer_class, queryset, ('pk',), context, self.select_related)
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def saved_types():
+    """{name: SavedType} for the names in TYPES."""
+    from blog.models import SavedPost
+    from blog.serializers import BlogPostSerializer
+    from business.models import SavedBusiness
+    from business.serializers import BusinessListSerializer
+    from destinations.models import SavedDestination
+    from destinations.serializers import DestinationSerializer
+    from events.models import SavedEvent
+    from events.serializers import EventListSerializer
+    from packages.models import SavedPackage
+    from packages.serializers import PackageListSerializer
+
+    return {
+        saved_type.name: saved_type for saved_type in [
+            SavedType('destination', SavedDestination, 'destination', 'created_at', DestinationSerializer),
+            SavedType('package', SavedPackage, 'package', 'created_at', PackageListSerializer),
+            SavedType('event', SavedEvent, 'event', 'created_at', EventListSerializer),
+            SavedType('business', SavedBusiness, 'business', 'saved_at', BusinessListSerializer),
+            SavedType('post', SavedPost, 'post', 'saved_at', BlogPostSerializer, ['author__profile']),
+        ]
+    }
+
+
+def encode_cursor(row):
+    name, saved_id, _, saved = row
+    data = json.dumps([saved.isoformat(), name, saved_id]).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """(saved time, type, saved id) of a cursor; NotFound if it isn't one."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        saved, name, saved_id = data
+        saved = parse_datetime(saved)
+    except (binascii.Error, TypeError, ValueError):
+        raise NotFound(INVALID_CURSOR)
+    if saved is None or not isinstance(name, str) or not isinstance(saved_id, str):
+        raise NotFound(INVALID_CURSOR)
+    return saved, name, saved_id
+
+
+def saved_items(user, cursor=None, limit=20, context=None):
+    """
+    A page of at most limit of user's saved items after cursor, newest
+    first, and the cursor of the next page (None on the last one).
+    """
+    after = decode_cursor(cursor) if cursor else None
+    parts = [saved_type.rows(user, after) for saved_type in saved_types().values()]
+    rows = list(parts[0].union(*parts[1:], all=True).order_by('-saved', '-type', '-saved_id')[:limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    rows = rows[:limit]
+
+    ids = {}
+    for name, _, object_id, _ in rows:
+        ids.setdefault(name, []).append(object_id)
+    objects = {name: saved_types()[name].objects(object_ids, context) for name, object_ids in ids.items()}
+
+    saved_at = serializers.DateTimeField()
+    items = []
+    for name, saved_id, object_id, saved in rows:
+        item = objects[name].get(object_id)
+        if item is None:
+            # Deleted since the page was read.
+            continue
+        items.append({
+            'type': name,
+            'id': saved_types()[name].model._meta.pk.to_python(saved_id),
+            'saved_at': saved_at.to_representation(saved),
+            'object': item,
+        })
+    return items, next_cursor
+
+
+class SavedChangeSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=TYPES)
+    save = serializers.ListField(
+        child=serializers.CharField(max_length=64), required=False, default=list, max_length=MAX_IDS,
+        help_text='Ids of the objects to save',
+    )
+    unsave = serializers.ListField(
+        child=serializers.CharField(max_length=64), required=False, default=list, max_length=MAX_IDS,
+        help_text='Ids of the objects to unsave',
+    )
+
+    def validate(self, data):
+        if not data['save'] and not data['unsave']:
+            raise serializers.ValidationError('Nothing to save or unsave.')
+        both = set(data['save']) & set(data['unsave'])
+        if both:
+            raise serializers.ValidationError(f"Both saved and unsaved: {', '.join(sorted(both))}.")
+        return data
+
+
+def change_saved(user, name, save=(), unsave=()):
+    """
+    Save the objects of type name with the ids in save, and unsave those in
+    unsave, for user. Returns the pks of the objects now saved and unsaved,
+    in the order asked, and the ids matching no object.
+    """
+    saved_type = saved_types()[name]
+    model, field = saved_type.model, saved_type.field
+    save_pks = {value: saved_type.object_pk(value) for value in save}
+    unsave_pks = {value: saved_type.object_pk(value) for value in unsave}
+    to_save = list(dict.fromkeys(key for key in save_pks.values() if key is not None))
+    to_unsave = list(dict.fromkeys(key for key in unsave_pks.values() if key is not None))
+
+    with transaction.atomic():
+        # One SELECT for both: ids matching no object are reported, not unsaved.
+        found = set(saved_type.object_model.objects.filter(pk__in=[*to_save, *to_unsave]).values_list('pk', flat=True))
+        to_save = [key for key in to_save if key in found]
+        to_unsave = [key for key in to_unsave if key in found]
+        if to_save:
+            # Rows saved already are left as they are, saved_at included.
+            model.objects.bulk_create(
+                [model(user=user, **{f'{field}_id': key}) for key in to_save], ignore_conflicts=True,
+            )
+        if to_unsave:
+            # One DELETE: nothing receives these models' delete signals
+            # (core.versions.UNTRACKED), so no rows are selected first.
+            model.objects.filter(user=user, **{f'{field}__in': to_unsave}).delete()
+
+    missing = [value for value, key in save_pks.items() if key not in found]
+    missing += [value for value, key in unsave_pks.items() if key not in found]
+    return to_save, to_unsave, missing
@@ -0,0 +1,23 @@
+"""drf-yasg's view inspector, with the query parameters of the core view mixins."""
+from drf_yasg import openapi
+from drf_yasg.inspectors import SwaggerAutoSchema
+
+from .listing import SPARSE_ACTIONS, SparseFieldsMixin
+
+
+class AutoSchema(SwaggerAutoSchema):
+    def get_query_parameters(self):
+        parameters = super().get_query_parameters()
+        if isinstance(self.view, SparseFieldsMixin) and getattr(self.view, 'action', None) in SPARSE_ACTIONS:
+            parameters += [
+                openapi.Parameter('fields', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                                  description='Comma-separated fields to return, and no others'),
+                openapi.Parameter('exclude', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                                  description='Comma-separated fields to leave out'),
+            ]
+            if self.view.card_fields:
+                parameters.append(openapi.Parameter(
+                    'view', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=['card'],
+                    description=f"card: only {', '.join(self.view.card_fields)}",
+                ))
+        return parameters
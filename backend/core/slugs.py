@@ -0,0 +1,153 @@
+"""
+Unique slugs for the catalogue models: slugify(title), or, when that is
+taken, "-1", "-2", ... after it.
+
+Suffixes are numbered by a SlugCounter row per model and base, created on
+the first collision (starting above the highest suffix already in use) and
+incremented with a single UPDATE afterwards. A colliding title costs the
+same few indexed queries however many times it has been used, instead of
+one query per suffix tried. The UPDATE and the read of the new number share
+a transaction, so the UPDATE's row lock hands concurrent saves different
+numbers. Should a slug still be taken (one set by hand, say), the unique
+constraint rejects it and save_with_slug() resynchronises the counter and
+tries again.
+
+    def save(self, *args, **kwargs):
+        slugs.save_with_slug(self, self.title, super().save, *args, **kwargs)
+
+For many instances at once, bulk_create() fills in their slugs with
+allocate() and retries the same way:
+
+    slugs.bulk_create(Destination, objs, 'title')
+"""
+import re
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Length
+from django.utils.text import slugify
+
+from .models import SlugCounter
+
+FIELD = 'slug'
+# Saves that find their slug taken, in a row, before giving up.
+MAX_ATTEMPTS = 5
+
+
+def _base(model, value):
+    max_length = model._meta.get_field(FIELD).max_length
+    return (slugify(value) or model._meta.model_name)[:max_length].strip('-')
+
+
+def _with_suffix(model, base, number):
+    suffix = f'-{number}'
+    max_length = model._meta.get_field(FIELD).max_length
+    return base[:max_length - len(suffix)] + suffix
+
+
+def _highest(model, base):
+    """The highest suffix in use after base (`slug LIKE 'base-%'`), or 0."""
+    taken = model._default_manager.filter(
+        **{f'{FIELD}__startswith': f'{base}-', f'{FIELD}__regex': rf'^{re.escape(base)}-[0-9]+$'}
+    ).order_by(Length(FIELD).desc(), f'-{FIELD}').values_list(FIELD, flat=True).first()
+    return int(taken.rsplit('-', 1)[1]) if taken else 0
+
+
+def _reserve(model, base, count=1, resync=False):
+    """Reserve count suffixes for base; returns the last of them."""
+    counters = SlugCounter.objects.filter(scope=model._meta.label_lower, base=base)
+    # Until the transaction ends, the UPDATE's row lock keeps other saves
+    # from moving the counter before it is read back.
+    with transaction.atomic():
+        if resync:
+            highest = _highest(model, base)
+            counters.filter(last__lt=highest).update(last=highest)
+        if counters.update(last=F('last') + count):
+            return counters.values_list('last', flat=True).get()
+    last = _highest(model, base) + count
+    try:
+        with transaction.atomic():
+            SlugCounter.objects.create(scope=model._meta.label_lower, base=base, last=last)
+    except IntegrityError:
+        # Created by a concurrent save meanwhile.
+        return _reserve(model, base, count)
+    return last
+
+
+def next_free(model, value, exclude=None, resync=False):
+    """A slug for value not used by any model row (but exclude's)."""
+    base = _base(model, value)
+    taken = model._default_manager.filter(**{FIELD: base})
+    if exclude is not None:
+        taken = taken.exclude(pk=exclude)
+    if not taken.exists():
+        return base
+    return _with_suffix(model, base, _reserve(model, base, resync=resync))
+
+
+def allocate(objs, source, resync=False):
+    """
+    Give each of objs without a slug a unique one, from its `source`
+    attribute: a few queries per distinct base. Returns objs.
+    """
+    pending = {}
+    for obj in objs:
+        if not getattr(obj, FIELD):
+            pending.setdefault((type(obj), _base(type(obj), getattr(obj, source))), []).append(obj)
+    for (model, base), group in pending.items():
+        manager = model._default_manager
+        if not manager.filter(**{FIELD: base}).exists():
+            setattr(group.pop(0), FIELD, base)
+        for attempt in range(MAX_ATTEMPTS):
+            if not group:
+                break
+            first = _reserve(model, base, len(group), resync=resync or attempt > 0) - len(group) + 1
+            for number, obj in enumerate(group, first):
+                setattr(obj, FIELD, _with_suffix(model, base, number))
+            # Set by hand past the counter: resynchronise it and reserve again.
+            if not manager.filter(**{f'{FIELD}__in': [getattr(obj, FIELD) for obj in group]}).exists():
+                break
+    return objs
+
+
+def bulk_create(model, objs, source, **kwargs):
+    """
+    model's bulk_create(objs, **kwargs), after giving those of objs without
+    a slug one from their `source` attribute.
+    """
+    blank = [obj for obj in objs if not getattr(obj, FIELD)]
+    for attempt in range(MAX_ATTEMPTS):
+        allocate(blank, source, resync=attempt > 0)
+        try:
+            with transaction.atomic():
+                return model._default_manager.bulk_create(objs, **kwargs)
+        except IntegrityError:
+            allocated = [getattr(obj, FIELD) for obj in blank]
+            for obj in blank:
+                setattr(obj, FIELD, '')
+            # Another constraint failed, or the slugs keep being taken.
+            taken = model._default_manager.filter(**{f'{FIELD}__in': allocated}).exists()
+            if not taken or attempt == MAX_ATTEMPTS - 1:
+                raise
+
+
+def save_with_slug(instance, value, save, *args, **kwargs):
+    """
+    save(*args, **kwargs), after giving instance a unique slug for value if
+    it has none.
+    """
+    if getattr(instance, FIELD):
+        return save(*args, **kwargs)
+    model = type(instance)
+    for attempt in range(MAX_ATTEMPTS):
+        slug = next_free(model, value, exclude=instance.pk, resync=attempt > 0)
+        setattr(instance, FIELD, slug)
+        try:
+            with transaction.atomic():
+                return save(*args, **kwargs)
+        except IntegrityError:
+            setattr(instance, FIELD, '')
+            # Another constraint failed, or the slug keeps being taken.
+            taken = model._default_manager.filter(**{FIELD: slug}).exclude(pk=instance.pk).exists()
+            if not taken or attempt == MAX_ATTEMPTS - 1:
+                raise
@@ -0,0 +1,1081 @@
+import datetime
+import decimal
+import gzip
+import json
+import os
+import subprocess
+import uuid
+from collections import OrderedDict
+import sys
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management import call_command
+from django.db import connection, connections, router, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from blog.models import BlogPost, SavedPost
+from booking.models import Booking, Payment
+from business.models import Business, SavedBusiness
+from destinations.models import Destination, DestinationReview, SavedDestination
+from destinations.serializers import DestinationDetailSerializer, DestinationSerializer
+from destinations.views import DestinationViewSet
+from events.models import Event, EventRegistration, EventSubscription, SavedEvent
+from packages.models import Package, SavedPackage
+from users.models import User
+from users.views import UserViewSet
+
+from . import batch, compression, facets, listing, openapi, profiling, renderers, slugs, versions, warmup
+from .parsers import ORJSONParser
+from .middleware import CompressionMiddleware, ReplicaRoutingMiddleware
+from .views import APIRootView
+
+
+class HealthCheckTests(SimpleTestCase):
+    def connection(self, health_checks=True):
+        from .db.postgresql.base import DatabaseWrapper
+
+        db = DatabaseWrapper({
+            'NAME': 'ethiotravel', 'USER': '', 'PASSWORD': '', 'HOST': '', 'PORT': '', 'OPTIONS': {},
+            'TIME_ZONE': None, 'AUTOCOMMIT': True, 'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': health_checks,
+        })
+        # A persistent connection left over from an earlier request.
+        db.connection = mock.Mock()
+        db.autocommit = True
+        return db
+
+    def start_request(self, db):
+        db.close_if_unusable_or_obsolete()
+
+    def test_dead_connection_is_closed_before_first_use(self):
+        db = self.connection()
+        self.start_request(db)
+        with mock.patch.object(db, 'is_usable', return_value=False) as is_usable, \
+                mock.patch.object(db, 'close') as close:
+            db.close_if_health_check_failed()
+            db.close_if_health_check_failed()
+        is_usable.assert_called_once_with()
+        close.assert_called_once_with()
+
+    def test_checked_once_per_request(self):
+        db = self.connection()
+        with mock.patch.object(db, 'is_usable', return_value=True) as is_usable:
+            for _ in range(2):
+                self.start_request(db)
+                db.close_if_health_check_failed()
+                db.close_if_health_check_failed()
+        self.assertEqual(is_usable.call_count, 2)
+
+    def test_disabled(self):
+        db = self.connection(health_checks=False)
+        self.start_request(db)
+        with mock.patch.object(db, 'is_usable') as is_usable:
+            db.close_if_health_check_failed()
+        is_usable.assert_not_called()
+
+
+@override_settings(DATABASE_REPLICAS=['replica1'])
+class ReplicaRoutingTests(SimpleTestCase):
+    destinations = DestinationViewSet.as_view({'get': 'list', 'post': 'create'})
+    users = UserViewSet.as_view({'get': 'list'})
+
+    def setUp(self):
+        cache.clear()
+
+    def route(self, request, view):
+        """The database a Destination read in view would use, and the response."""
+        used = []
+
+        def get_response(request):
+            middleware.process_view(request, view, (), {})
+            used.append(router.db_for_read(Destination))
+            return HttpResponse()
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        response = middleware(request)
+        return used[0], response
+
+    def test_catalogue_reads_use_a_replica(self):
+        db, response = self.route(RequestFactory().get('/api/destinations/destinations/'), self.destinations)
+        self.assertEqual(db, 'replica1')
+        self.assertNotIn('primary_reads', response.cookies)
+        self.assertEqual(router.db_for_write(Destination), 'default')
+
+    def test_other_apps_and_writes_use_the_primary(self):
+        self.assertEqual(self.route(RequestFactory().get('/api/users/users/'), self.users)[0], 'default')
+        db, response = self.route(RequestFactory().post('/api/destinations/destinations/'), self.destinations)
+        self.assertEqual(db, 'default')
+        self.assertIn('primary_reads', response.cookies)
+
+    def test_a_write_pins_the_client_to_the_primary(self):
+        factory = RequestFactory(HTTP_AUTHORIZATION='Bearer one')
+        self.route(factory.post('/api/destinations/destinations/'), self.destinations)
+
+        # By token, for clients that don't keep cookies...
+        self.assertEqual(self.route(factory.get('/api/destinations/destinations/'), self.destinations)[0], 'default')
+        other = RequestFactory(HTTP_AUTHORIZATION='Bearer two').get('/api/destinations/destinations/')
+        self.assertEqual(self.route(other, self.destinations)[0], 'replica1')
+        # ...and by cookie.
+        request = RequestFactory().get('/api/destinations/destinations/')
+        request.COOKIES['primary_reads'] = '1'
+        self.assertEqual(self.route(request, self.destinations)[0], 'default')
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_everything_uses_the_primary(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ReplicaRoutingMiddleware(lambda request: HttpResponse())
+        self.assertEqual(router.db_for_read(Destination), 'default')
+
+
+@skipUnless(settings.DATABASE_REPLICAS, 'set DATABASE_REPLICA_URLS, e.g. to a second SQLite file')
+class ReplicaReadsTests(TransactionTestCase):
+    databases = {'default', *settings.DATABASE_REPLICAS}
+
+    def test_catalogue_reads_come_from_a_replica(self):
+        destination = Destination.objects.create(
+            title='Lalibela', description='Rock-hewn churches', category='religious', region='amhara',
+            city='Lalibela', address='Lalibela', status='active',
+        )
+        replica = connections[settings.DATABASE_REPLICAS[0]]
+        with CaptureQueriesContext(replica) as queries:
+            response = self.client.get(f'/api/destinations/destinations/{destination.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(queries.captured_queries)
+
+
+class GenerateLoadDataTests(TestCase):
+    class Rollback(Exception):
+        pass
+
+    def generate(self, seed):
+        """The generated destinations and the counts checked, with the rows rolled back."""
+        try:
+            with transaction.atomic():
+                call_command(
+                    'generate_load_data', '--seed', str(seed), '--scale', '0.05',
+                    '--batch-size', '50', '--anchor-date', '2027-01-01', stdout=StringIO(),
+                )
+                generated = (
+                    list(Destination.objects.order_by('slug').values_list('title', 'rating')),
+                    list(Event.objects.order_by('slug').values_list('start_date', flat=True)),
+                    User.objects.count(),
+                    Booking.objects.filter(payments__isnull=False).count(),
+                )
+                raise self.Rollback
+        except self.Rollback:
+            pass
+        return generated
+
+    def test_generates_every_app_deterministically(self):
+        first = self.generate(1)
+        self.assertEqual(first[2:], (50, 100))
+        # Events start from 90 days before the anchor date to 180 after.
+        self.assertGreaterEqual(min(first[1]).date(), datetime.date(2026, 10, 3))
+        self.assertLessEqual(max(first[1]).date(), datetime.date(2027, 6, 30))
+        # Not a flush: PostgreSQL won't TRUNCATE in a TestCase's transaction.
+        self.assertEqual(Destination.objects.count(), 0)
+        self.assertEqual(self.generate(1), first)
+
+
+class CheckQueryPlansTests(TestCase):
+    def test_explains_every_endpoint(self):
+        call_command(
+            'generate_load_data', '--seed', '1', '--scale', '0.05', '--batch-size', '50', stdout=StringIO(),
+        )
+        out = StringIO()
+        call_command('check_query_plans', stdout=out)
+        output = out.getvalue()
+        self.assertIn('GET /api/destinations/destinations/: 200', output)
+        self.assertIn('GET /api/booking/bookings/: 200', output)
+        self.assertRegex(output, r'\d+ queries checked, \d+ with sequential scans')
+
+
+class ArrayContainsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        EventSubscription.objects.create(email='a@example.com', categories=['Festival', 'Music'])
+        EventSubscription.objects.create(email='b@example.com', categories=['Music'])
+        EventSubscription.objects.create(email='c@example.com', categories=[])
+
+    def emails(self, value):
+        return list(
+            EventSubscription.objects.filter(categories__array_contains=value)
+            .order_by('email').values_list('email', flat=True)
+        )
+
+    def test_element(self):
+        self.assertEqual(self.emails('Music'), ['a@example.com', 'b@example.com'])
+        self.assertEqual(self.emails('Festival'), ['a@example.com'])
+        self.assertEqual(self.emails('Sports'), [])
+
+    def test_every_element_of_a_list(self):
+        self.assertEqual(self.emails(['Music', 'Festival']), ['a@example.com'])
+        self.assertEqual(self.emails(['Music', 'Sports']), [])
+
+    def test_excluded(self):
+        self.assertEqual(
+            list(EventSubscription.objects.exclude(categories__array_contains='Music').values_list('email', flat=True)),
+            ['c@example.com'],
+        )
+
+    @skipUnless(connection.vendor == 'postgresql', 'GIN indexes are PostgreSQL-only')
+    def test_served_by_gin_index(self):
+        queryset = EventSubscription.objects.filter(categories__array_contains='Music')
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        self.assertIn('eventsub_categories_gin', plan)
+
+
+class FacetsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for title, category, region, city, status in [
+            ('Fasil Ghebbi', 'historical', 'amhara', 'Gondar', 'active'),
+            ('Simien Mountains', 'natural', 'amhara', 'Debark', 'active'),
+            ('Harar Jugol', 'historical', 'harari', 'Harar', 'active'),
+            ('Draft', 'historical', 'harari', 'Harar', 'draft'),
+        ]:
+            Destination.objects.create(
+                title=title, description='-', category=category, region=region, city=city,
+                address='-', status=status,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def facets(self, query=''):
+        response = self.client.get(reverse('destinations:destination-facets') + query)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_counts_the_listed_rows(self):
+        result = self.facets()
+        self.assertEqual(result['count'], 3)
+        self.assertEqual(result['facets']['category'], [
+            {'value': 'historical', 'count': 2}, {'value': 'natural', 'count': 1},
+        ])
+        result = self.facets('?region=amhara')
+        self.assertEqual(result['count'], 2)
+        self.assertEqual(result['facets']['city'], [
+            {'value': 'Debark', 'count': 1}, {'value': 'Gondar', 'count': 1},
+        ])
+
+    def test_cached_until_a_save(self):
+        self.assertEqual(self.facets()['count'], 3)
+        Destination.objects.filter(status='draft').update(status='active')
+        self.assertEqual(self.facets()['count'], 3)
+        Destination.objects.get(title='Harar Jugol').save()
+        self.assertEqual(self.facets()['count'], 4)
+
+    def test_list_and_range_facets(self):
+        EventSubscription.objects.create(email='a@example.com', categories=['music', 'festival', 'music'])
+        EventSubscription.objects.create(email='b@example.com', categories=['music'])
+        EventSubscription.objects.create(email='c@example.com', categories='music')
+        # A null element, as many as 'festival': not a value.
+        EventSubscription.objects.create(email='d@example.com', categories=[None])
+        result = facets.Facets(
+            'events.EventSubscription', facets.ListFacet('categories'), facets.RangeFacet('pk', [2, 10]),
+        ).counts(EventSubscription.objects.all())
+        self.assertEqual(result['count'], 4)
+        self.assertEqual(result['facets']['categories'], [
+            {'value': 'music', 'count': 2}, {'value': 'festival', 'count': 1},
+        ])
+        # Every range is listed, in order.
+        self.assertEqual([value['value'] for value in result['facets']['pk']], ['0-2', '2-10', '10+'])
+        self.assertEqual(sum(value['count'] for value in result['facets']['pk']), 4)
+
+    def test_only_the_facets_asked(self):
+        result = facets.Facets(
+            'destinations.Destination', facets.FieldFacet('category'), facets.FieldFacet('city'),
+        ).counts(Destination.objects.filter(status='active'), only=['city'])
+        self.assertEqual(list(result['facets']), ['city'])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('packages:package-regions'))
+        self.assertEqual(response.json(), [])
+        sql = next(query['sql'] for query in queries if query['sql'].startswith('WITH filtered'))
+        self.assertNotIn('difficulty', sql)
+
+
+class SlugTests(TestCase):
+    def destination(self, title, **kwargs):
+        return Destination.objects.create(
+            title=title, description='-', category='historical', region='amhara', city='Gondar',
+            address='-', **kwargs,
+        )
+
+    def test_duplicate_titles_get_suffixes(self):
+        slugs_ = [self.destination('Fasil Ghebbi').slug for _ in range(3)]
+        self.assertEqual(slugs_, ['fasil-ghebbi', 'fasil-ghebbi-1', 'fasil-ghebbi-2'])
+        self.assertEqual(self.destination('Fasil Ghebbi Castle').slug, 'fasil-ghebbi-castle')
+        # The same queries, however many suffixes are taken (and the
+        # counter's savepoint).
+        with self.assertNumQueries(5):
+            self.assertEqual(slugs.next_free(Destination, 'Fasil Ghebbi'), 'fasil-ghebbi-3')
+
+    def test_first_collision_starts_above_existing_suffixes(self):
+        self.destination('Fasil Ghebbi')
+        self.destination('x', slug='fasil-ghebbi-10')
+        self.assertEqual(self.destination('Fasil Ghebbi').slug, 'fasil-ghebbi-11')
+
+    def test_retries_when_the_slug_is_taken(self):
+        self.destination('Fasil Ghebbi')
+        self.destination('Fasil Ghebbi')
+        # Taken behind the counter's back, as by a concurrent save.
+        self.destination('x', slug='fasil-ghebbi-2')
+        self.destination('y', slug='fasil-ghebbi-3')
+        self.assertEqual(self.destination('Fasil Ghebbi').slug, 'fasil-ghebbi-4')
+
+    def test_allocate_for_bulk_create(self):
+        self.destination('Fasil Ghebbi')
+        objs = [
+            Destination(title=title, description='-', category='historical', region='amhara', city='-', address='-')
+            for title in ['Fasil Ghebbi', 'Fasil Ghebbi', 'Lalibela']
+        ]
+        slugs.bulk_create(Destination, objs, 'title')
+        self.assertEqual([obj.slug for obj in objs], ['fasil-ghebbi-1', 'fasil-ghebbi-2', 'lalibela'])
+
+        # Taken behind the counter's back.
+        self.destination('x', slug='fasil-ghebbi-3')
+        objs = [
+            Destination(title='Fasil Ghebbi', description='-', category='historical', region='amhara', city='-',
+                        address='-')
+            for _ in range(2)
+        ]
+        slugs.bulk_create(Destination, objs, 'title')
+        self.assertEqual([obj.slug for obj in objs], ['fasil-ghebbi-5', 'fasil-ghebbi-6'])
+
+    def test_blog_posts_with_the_same_title(self):
+        first = BlogPost.objects.create(title='Coffee Ceremony', content='-')
+        second = BlogPost.objects.create(title='Coffee Ceremony', content='-')
+        self.assertEqual((first.slug, second.slug), ('coffee-ceremony', 'coffee-ceremony-1'))
+
+
+@skipUnless(connection.vendor == 'postgresql', 'SQLite serialises the writes of concurrent threads')
+class SlugConcurrencyTests(TransactionTestCase):
+    def test_concurrent_reservations_get_different_numbers(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def reserve(_):
+            try:
+                return [slugs._reserve(Destination, 'fasil-ghebbi') for _ in range(100)]
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(4) as pool:
+            numbers = [number for numbers in pool.map(reserve, range(4)) for number in numbers]
+        self.assertEqual(sorted(numbers), list(range(1, 401)))
+
+
+# Every response serialized: the cache would hand the second of a pair the first's bytes.
+@override_settings(RESPONSE_CACHE_SECONDS=0)
+class ValuesListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        organizer = User.objects.create_user(username='organizer', email='o@example.com', password='x')
+        Destination.objects.create(
+            title='Fasil Ghebbi', description='-', category='historical', region='amhara', city='Gondar',
+            address='-', status='active', latitude='12.607500', images=['https://example.com/a.jpg'],
+        )
+        for i in range(3):
+            Package.objects.create(
+                organizer=organizer, title=f'Simien Trek {i}', description='-', short_description='-',
+                location='Debark', region='amhara', price='12500.5', discounted_price=None if i else '9999.99',
+                duration='3 days', duration_in_days=3, category=['hiking', 'wildlife'], departure='Gondar',
+                departure_time='06:30', return_time='18:00:15', max_group_size=12, min_age=10,
+                difficulty='moderate', tour_guide='-', languages=['en', 'am'], coordinates=None, status='active',
+            )
+        Event.objects.create(
+            organizer=organizer, title='Timkat', description='-', category='festival', location='Gondar',
+            address='-', start_date='2027-01-19T06:00:00Z', end_date='2027-01-20T18:30:00.123456Z',
+            latitude=12.6075, price='250', status='published', images=[],
+        )
+
+    def assertSameAsSerializers(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        with mock.patch.object(listing, 'field_map', return_value=None):
+            expected = self.client.get(url)
+        self.assertEqual(response.content, expected.content)
+
+    def test_same_bytes_as_the_serializers(self):
+        self.assertSameAsSerializers(reverse('destinations:destination-list'))
+        self.assertSameAsSerializers(reverse('packages:package-list') + '?ordering=price')
+        self.assertSameAsSerializers(reverse('events:event-list'))
+        self.assertSameAsSerializers(reverse('events:event-list') + '?full_details=true')
+
+    def test_nested_organizer_is_joined(self):
+        # The ETag's, the count and the page, not a query per package for its organizer.
+        with self.assertNumQueries(3):
+            results = self.client.get(reverse('packages:package-list') + '?ordering=price').json()['results']
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['organizer']['username'], 'organizer')
+
+    def test_unsupported_serializers_have_no_field_map(self):
+        self.assertIsNotNone(listing.field_map(DestinationSerializer))
+        # Its reviews are a SerializerMethodField.
+        self.assertIsNone(listing.field_map(DestinationDetailSerializer))
+
+
+class SparseFieldsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.destination = Destination.objects.create(
+            title='Fasil Ghebbi', description='A long description', category='historical', region='amhara',
+            city='Gondar', address='-', status='active',
+        )
+
+    def get(self, url, status=200):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status)
+        return response.json(), ' '.join(query['sql'] for query in queries)
+
+    def test_fields(self):
+        body, sql = self.get(reverse('destinations:destination-list') + '?fields=id,title,city')
+        self.assertEqual(list(body['results'][0]), ['id', 'title', 'city'])
+        self.assertNotIn('description', sql)
+
+    def test_exclude(self):
+        body, sql = self.get(reverse('destinations:destination-list') + '?exclude=description,images')
+        self.assertNotIn('description', body['results'][0])
+        self.assertIn('gallery_images', body['results'][0])
+        self.assertNotIn('description', sql)
+
+    def test_card_view(self):
+        body, _ = self.get(reverse('destinations:destination-list') + '?view=card&exclude=images')
+        self.assertEqual(
+            set(body['results'][0]), set(DestinationViewSet.card_fields) - {'images'},
+        )
+
+    def test_retrieve(self):
+        url = reverse('destinations:destination-detail', args=[self.destination.pk])
+        body, sql = self.get(url + '?fields=title')
+        self.assertEqual(body, {'title': 'Fasil Ghebbi'})
+        self.assertNotIn('description', sql.split(' FROM ')[0])
+
+    def test_unknown_field(self):
+        body, _ = self.get(reverse('destinations:destination-list') + '?fields=title,secret', status=400)
+        self.assertIn('secret', body['fields'][0])
+        self.get(reverse('destinations:destination-list') + '?view=poster', status=400)
+
+
+class ORJSONTests(SimpleTestCase):
+    data = OrderedDict([
+        ('decimal', decimal.Decimal('12500.50')),
+        ('uuid', uuid.UUID('967315d1-ead0-4cdf-b4f2-9b5945a5ccf2')),
+        ('utc', datetime.datetime(2027, 1, 19, 6, 0, 0, 123456, tzinfo=datetime.timezone.utc)),
+        ('addis_ababa', datetime.datetime(2027, 1, 19, 9, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=3)))),
+        ('naive', datetime.datetime(2027, 1, 19, 6, 0)),
+        ('date', datetime.date(2027, 1, 19)),
+        ('time', datetime.time(6, 30, 15)),
+        ('duration', datetime.timedelta(hours=2)),
+        ('text', 'Gondar \u2028 ጎንደር'),
+        (1, [None, True, 1.5, {'nested': []}]),
+    ])
+
+    def test_same_bytes_as_drf(self):
+        self.assertEqual(renderers.ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_differences_from_drf(self):
+        render = renderers.ORJSONRenderer().render
+        self.assertEqual(render({'big': 2 ** 70}), JSONRenderer().render({'big': 2 ** 70}))
+        self.assertEqual(render([1e-7, 1e16]), b'[1e-7,1e16]')
+        self.assertEqual(json.loads(render([1e-7, 1e16])), [1e-7, 1e16])
+        self.assertEqual(render([float('nan')]), b'[null]')
+
+    def test_indented_falls_back(self):
+        rendered = renderers.ORJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+        self.assertEqual(rendered, b'{\n    "a": 1\n}')
+
+    def test_parser(self):
+        parsed = ORJSONParser().parse(BytesIO('{"title": "ጎንደር", "price": 1.5}'.encode()))
+        self.assertEqual(parsed, {'title': 'ጎንደር', 'price': 1.5})
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b'{"title": NaN}'))
+
+    def test_streamed_array(self):
+        items = [self.data] * 50
+        chunks = list(renderers.iter_json_array(iter(items), chunk_size=1000))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b''.join(chunks), JSONRenderer().render(items))
+        self.assertEqual(b''.join(renderers.iter_json_array([])), b'[]')
+
+
+class StreamingASGITests(TestCase):
+    """A streamed body that reads the database, served over ASGI."""
+
+    def setUp(self):
+        user = User.objects.create_user(username='traveller', email='t@example.com', password='x')
+        booking = Booking.objects.create(user=user)
+        self.payments = [
+            Payment.objects.create(booking=booking, amount='1500.00', payment_method='chapa') for _ in range(3)
+        ]
+        self.async_client.force_login(user)
+
+    async def test_payment_history(self):
+        response = await self.async_client.get(reverse('booking:payment-history'))
+        self.assertEqual(response.status_code, 200)
+        # As the ASGI handler does: the body is iterated on the event loop.
+        body = b''.join(response.streaming_content)
+        self.assertEqual(
+            sorted(payment['id'] for payment in json.loads(body)),
+            sorted(str(payment.pk) for payment in self.payments),
+        )
+
+
+class ConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.destination = Destination.objects.create(
+            title='Fasil Ghebbi', description='-', category='historical', region='amhara', city='Gondar',
+            address='-', status='active',
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.list_url = reverse('destinations:destination-list')
+        self.detail_url = reverse('destinations:destination-detail', args=[self.destination.pk])
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_not_modified(self):
+        for url in [self.list_url, self.detail_url, self.list_url + '?fields=title']:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Cache-Control'], 'no-cache')
+            self.assertEqual(self.revalidate(url, response['ETag']).status_code, 304)
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.content, b'')
+
+    def test_etags_differ_per_query(self):
+        etag = self.client.get(self.list_url)['ETag']
+        self.assertNotEqual(self.client.get(self.list_url + '?fields=title')['ETag'], etag)
+        self.assertEqual(self.revalidate(self.list_url + '?fields=title', etag).status_code, 200)
+
+    def test_changes(self):
+        list_etag = self.client.get(self.list_url)['ETag']
+        detail_etag = self.client.get(self.detail_url)['ETag']
+        # A row saved, ...
+        self.destination.save()
+        self.assertEqual(self.revalidate(self.detail_url, detail_etag).status_code, 200)
+        response = self.revalidate(self.list_url, list_etag)
+        self.assertEqual(response.status_code, 200)
+        # ... added without signals ...
+        list_etag = response['ETag']
+        Destination.objects.bulk_create([Destination(
+            title='Lalibela', slug='lalibela', description='-', category='religious', region='amhara',
+            city='Lalibela', address='-', status='active',
+        )])
+        response = self.revalidate(self.list_url, list_etag)
+        self.assertEqual(response.status_code, 200)
+        # ... or a review, shown in the detail.
+        detail_etag = self.client.get(self.detail_url)['ETag']
+        DestinationReview.objects.create(destination=self.destination, rating=5, title='-', content='-')
+        self.assertEqual(self.revalidate(self.detail_url, detail_etag).status_code, 200)
+
+    def test_last_modified_after_a_delete(self):
+        newest = Destination.objects.create(
+            title='Lalibela', description='-', category='religious', region='amhara', city='Lalibela',
+            address='-', status='active',
+        )
+        an_hour_ago = timezone.now() - datetime.timedelta(hours=1)
+        Destination.objects.filter(pk=self.destination.pk).update(updated_at=an_hour_ago)
+        Destination.objects.filter(pk=newest.pk).update(updated_at=an_hour_ago + datetime.timedelta(minutes=30))
+        for label in ['destinations.Destination', *DestinationViewSet.conditional_dependencies]:
+            cache.set(versions._key(label), an_hour_ago.timestamp(), None)
+        last_modified = self.client.get(self.list_url)['Last-Modified']
+        # The newest row goes: MAX(updated_at) moves back, Last-Modified mustn't.
+        newest.delete()
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+
+    def test_nested_users(self):
+        reviewer = User.objects.create_user(username='reviewer', email='r@example.com', password='x')
+        DestinationReview.objects.create(
+            destination=self.destination, user=reviewer, rating=5, title='-', content='-',
+        )
+        event = Event.objects.create(
+            organizer=User.objects.create_user(username='organizer', email='o@example.com', password='x'),
+            title='Timkat', description='-', category='festival', location='Gondar', address='-',
+            start_date='2027-01-19T06:00:00Z', end_date='2027-01-20T18:30:00Z', price='250',
+            status='published', images=[],
+        )
+        EventRegistration.objects.create(event=event, user=reviewer)
+        event_url = reverse('events:event-detail', args=[event.pk])
+        etags = {url: self.client.get(url)['ETag'] for url in [self.detail_url, event_url]}
+        # The reviewer renames themselves: the nested user changes.
+        reviewer.first_name = 'Abebe'
+        reviewer.save()
+        for url, etag in etags.items():
+            response = self.revalidate(url, etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['ETag'], etag)
+
+    def test_user_saves_that_responses_dont_show(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        User.objects.create_user(username='traveller', email='t@example.com', password='x')
+        user = User.objects.get(username='traveller')
+        user.set_password('y')
+        user.save()
+        user.last_login = timezone.now()
+        user.save(update_fields=['last_login'])
+        self.assertEqual(self.revalidate(self.detail_url, etag).status_code, 304)
+
+    def test_missing_row(self):
+        url = reverse('destinations:destination-detail', args=[uuid.uuid4()])
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class CompressionTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(20):
+            Destination.objects.create(
+                title=f'Fasil Ghebbi {i}', description='Castles of Gondar. ' * 10, category='historical',
+                region='amhara', city='Gondar', address='-', status='active',
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('destinations:destination-list')
+
+    def test_negotiate(self):
+        with mock.patch.object(compression, 'brotli', None):
+            self.assertEqual(compression.negotiate('gzip, deflate, br'), 'gzip')
+            self.assertIsNone(compression.negotiate('br'))
+        with mock.patch.object(compression, 'brotli', object()):
+            self.assertEqual(compression.negotiate('gzip, deflate, br'), 'br')
+            self.assertEqual(compression.negotiate('br;q=0.5, gzip'), 'gzip')
+            self.assertEqual(compression.negotiate('*'), 'br')
+        self.assertIsNone(compression.negotiate(''))
+        self.assertIsNone(compression.negotiate('gzip;q=0, identity'))
+
+    def test_gzip(self):
+        plain = self.client.get(self.url)
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(response['ETag'], plain['ETag'])
+
+    def test_small_responses_left_alone(self):
+        destination = Destination.objects.first()
+        url = reverse('destinations:destination-detail', args=[destination.pk]) + '?fields=id'
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_compressed_once_per_cache_entry(self):
+        with mock.patch.object(compression, '_compress', wraps=compression._compress) as compress:
+            first = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+            second = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+            self.assertEqual(compress.call_count, 1)
+            self.assertEqual(second.content, first.content)
+            # Data changed: a new ETag, a new entry.
+            Destination.objects.first().save()
+            self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+            self.assertEqual(compress.call_count, 2)
+
+    def test_response_cache(self):
+        first = self.client.get(self.url)
+        with mock.patch.object(listing.ValuesListMixin, 'list') as serialize:
+            second = self.client.get(self.url)
+        serialize.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['Content-Type'], first['Content-Type'])
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_streaming(self):
+        response = renderers.StreamingJSONResponse([{'id': i} for i in range(3)])
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        response = CompressionMiddleware(lambda request: response)(request)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        body = gzip.decompress(b''.join(response.streaming_content))
+        self.assertEqual(json.loads(body), [{'id': 0}, {'id': 1}, {'id': 2}])
+
+
+class BatchRetrieveTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        organizer = User.objects.create_user(username='organizer', email='o@example.com', password='x')
+        cls.packages = [
+            Package.objects.create(
+                organizer=organizer, title=f'Simien Trek {i}', description='-', short_description='-',
+                location='Debark', region='amhara', price='12500.5', duration='3 days', duration_in_days=3,
+                category=['hiking'], departure='Gondar', departure_time='06:30', return_time='18:00',
+                max_group_size=12, min_age=10, difficulty='moderate', tour_guide='-', languages=['en'],
+                status='active' if i else 'draft',
+            )
+            for i in range(3)
+        ]
+        cls.post = BlogPost.objects.create(title='Timkat in Gondar', content='-', excerpt='-', author=organizer)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('packages:package-batch')
+
+    def batch(self, ids, url=None):
+        return self.client.post(url or self.url, {'ids': ids}, format='json')
+
+    def test_request_order_and_missing(self):
+        first, second, third = self.packages
+        ids = [str(third.pk), second.slug, 'no-such-trek', str(first.pk), third.slug, str(uuid.uuid4())]
+        with self.assertNumQueries(1):
+            response = self.batch(ids)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item['id'] for item in response.data['results']],
+            [third.pk, second.pk, first.pk, third.pk],
+        )
+        self.assertEqual(response.data['missing'], ['no-such-trek', ids[-1]])
+        self.assertEqual(response.data['results'][0]['organizer']['username'], 'organizer')
+        # As the list represents it.
+        listed = self.client.get(reverse('packages:package-list') + '?ordering=created_at').json()['results']
+        self.assertEqual(response.json()['results'][1], listed[0])
+
+    def test_cached_items_skip_the_database(self):
+        ids = [str(package.pk) for package in self.packages]
+        expected = self.batch(ids).data
+        with self.assertNumQueries(0):
+            self.assertEqual(self.batch(ids).data, expected)
+        # Found by their slugs too.
+        with self.assertNumQueries(0):
+            self.batch([package.slug for package in self.packages])
+
+        self.packages[0].title = 'Simien Mountains Trek'
+        self.packages[0].save()
+        with self.assertNumQueries(1):
+            response = self.batch(ids)
+        self.assertEqual(response.data['results'][0]['title'], 'Simien Mountains Trek')
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.batch([]).status_code, 400)
+        self.assertEqual(self.batch(['x'] * (batch.MAX_IDS + 1)).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {'ids': 'x'}, format='json').status_code, 400)
+
+    def test_serializer_without_field_map(self):
+        with self.assertNumQueries(1):
+            response = self.batch([self.post.slug, '404'], url=reverse('blog:post-batch'))
+        self.assertEqual(response.data['results'][0]['authorName'], self.post.author.get_full_name())
+        self.assertEqual(response.data['missing'], ['404'])
+
+
+class SavedItemsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='traveller', email='t@example.com', password='x')
+        other = User.objects.create_user(username='other', email='x@example.com', password='x')
+        destination = Destination.objects.create(
+            title='Fasil Ghebbi', description='-', category='historical', region='amhara', city='Gondar',
+            address='-', status='active',
+        )
+        package = Package.objects.create(
+            organizer=other, title='Simien Trek', description='-', short_description='-', location='Debark',
+            region='amhara', price='12500.5', duration='3 days', duration_in_days=3, category=['hiking'],
+            departure='Gondar', departure_time='06:30', return_time='18:00', max_group_size=12, min_age=10,
+            difficulty='moderate', tour_guide='-', languages=['en'], status='active',
+        )
+        event = Event.objects.create(
+            organizer=other, title='Timkat', description='-', category='festival', location='Gondar',
+            address='-', start_date='2027-01-19T06:00:00Z', end_date='2027-01-20T18:30:00Z', price='250',
+            status='published', images=[],
+        )
+        business = Business.objects.create(
+            owner=other, name='Goha Hotel', business_type='hotel', description='-', contact_email='g@example.com',
+            contact_phone='-', region='amhara', city='Gondar', address='-', main_image='https://example.com/g.jpg',
+        )
+        post = cls.post = BlogPost.objects.create(title='Timkat in Gondar', content='-', excerpt='-', author=other)
+
+        base = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+        saved = [
+            (SavedDestination.objects.create(user=cls.user, destination=destination), 'created_at', 5),
+            (SavedPackage.objects.create(user=cls.user, package=package), 'created_at', 3),
+            (SavedEvent.objects.create(user=cls.user, event=event), 'created_at', 3),
+            (SavedBusiness.objects.create(user=cls.user, business=business), 'saved_at', 3),
+            (SavedPost.objects.create(user=cls.user, post=post), 'saved_at', 1),
+            (SavedPost.objects.create(user=other, post=post), 'saved_at', 9),
+        ]
+        for row, field, minutes in saved:
+            type(row).objects.filter(pk=row.pk).update(**{field: base + datetime.timedelta(minutes=minutes)})
+        # Newest first; the three saved at the same time by type, descending.
+        cls.expected = [
+            ('destination', str(destination.pk)), ('package', package.pk), ('event', event.pk),
+            ('business', business.pk), ('post', post.pk),
+        ]
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+        self.url = reverse('me-saved')
+
+    def test_all_types_newest_first(self):
+        # The UNION, then a query per type on the page.
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['next'])
+        self.assertEqual([(item['type'], item['object']['id']) for item in response.data['results']], self.expected)
+        self.assertEqual(response.data['results'][0]['saved_at'], '2026-01-01T03:05:00+03:00')
+        self.assertEqual(response.data['results'][1]['object']['organizer']['username'], 'other')
+        self.assertEqual(response.data['results'][4]['object']['authorName'], self.post.author.get_full_name())
+
+    def test_cursor_pages(self):
+        seen, url = [], self.url + '?page_size=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data['results']), 2)
+            seen += [(item['type'], item['object']['id']) for item in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(seen, self.expected)
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(self.url + '?cursor=nonsense').status_code, 404)
+        self.assertEqual(self.client.get(self.url + '?page_size=0').status_code, 400)
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+
+class SavedItemsBulkTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='traveller', email='t@example.com', password='x')
+        cls.other = User.objects.create_user(username='other', email='x@example.com', password='x')
+        cls.destinations = [
+            Destination.objects.create(
+                title=f'Fasil Ghebbi {i}', description='-', category='historical', region='amhara', city='Gondar',
+                address='-', status='active',
+            )
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+        self.url = reverse('me-saved-bulk')
+
+    def change(self, **data):
+        return self.client.post(self.url, {'type': 'destination', **data}, format='json')
+
+    def saved(self, user):
+        return set(SavedDestination.objects.filter(user=user).values_list('destination_id', flat=True))
+
+    def test_save_is_idempotent(self):
+        first, second, _ = self.destinations
+        ids = [str(first.pk), str(second.pk), str(uuid.uuid4()), 'nope']
+        # The savepoint, the objects' SELECT, the INSERT and the release.
+        with self.assertNumQueries(4):
+            response = self.change(save=ids)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'type': 'destination', 'saved': ids[:2], 'unsaved': [], 'missing': ids[2:],
+        })
+        self.assertEqual(self.saved(self.user), {first.pk, second.pk})
+
+        saved_at = SavedDestination.objects.get(user=self.user, destination=first).created_at
+        response = self.change(save=ids[:2])
+        self.assertEqual(response.json()['saved'], ids[:2])
+        self.assertEqual(SavedDestination.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(SavedDestination.objects.get(user=self.user, destination=first).created_at, saved_at)
+
+    def test_save_and_unsave(self):
+        first, second, third = self.destinations
+        for user in [self.user, self.other]:
+            SavedDestination.objects.create(user=user, destination=first)
+        ids = [str(first.pk), str(second.pk), str(uuid.uuid4()), 'nope']
+        # The savepoint, the objects' SELECT, the DELETE and the release.
+        with self.assertNumQueries(4):
+            response = self.change(unsave=ids)
+        self.assertEqual(response.json(), {
+            'type': 'destination', 'saved': [], 'unsaved': ids[:2], 'missing': ids[2:],
+        })
+        self.assertEqual(self.saved(self.user), set())
+        self.assertEqual(self.saved(self.other), {first.pk})
+
+        response = self.change(save=[str(third.pk)], unsave=[str(first.pk)])
+        self.assertEqual(response.json()['saved'], [str(third.pk)])
+        self.assertEqual(self.saved(self.user), {third.pk})
+
+    def test_invalid_requests(self):
+        pk = str(self.destinations[0].pk)
+        self.assertEqual(self.change().status_code, 400)
+        self.assertEqual(self.change(save=[pk], unsave=[pk]).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {'type': 'hotel', 'save': [pk]}, format='json').status_code, 400)
+        self.client.force_authenticate(None)
+        self.assertEqual(self.change(save=[pk]).status_code, 401)
+
+
+@override_settings(REQUEST_PROFILING_TOKEN='secret')
+class RequestProfilingTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email='admin@example.com', username='admin', password='secret123'
+        )
+
+    def test_header_enables_profiling(self):
+        response = self.client.get('/api/destinations/destinations/', HTTP_X_PROFILE='secret')
+        self.assertIn('db;dur=', response['Server-Timing'])
+
+        self.client.force_authenticate(self.admin)
+        entry = self.client.get('/api/_debug/requests/').data[0]
+        self.assertEqual(entry['path'], '/api/destinations/destinations/')
+        self.assertEqual(entry['trigger'], 'header')
+        self.assertGreater(entry['sql']['count'], 0)
+
+    def test_disabled_without_valid_header(self):
+        response = self.client.get('/api/destinations/destinations/', HTTP_X_PROFILE='wrong')
+        self.assertFalse(response.has_header('Server-Timing'))
+
+    def test_debug_endpoint_is_admin_only(self):
+        user = User.objects.create_user(email='u@example.com', username='user1', password='secret123')
+        self.client.force_authenticate(user)
+        self.assertEqual(self.client.get('/api/_debug/requests/').status_code, 403)
+
+    def test_counts_cache_hits_and_duplicate_queries(self):
+        profiling.install()
+        with profiling.profile_request(RequestFactory().get('/'), 'test') as profile:
+            cache.get('profiling-test')
+            cache.set('profiling-test', 1)
+            cache.get('profiling-test')
+            for _ in range(3):
+                list(User.objects.filter(pk=self.admin.pk))
+        self.assertEqual((profile.cache_hits, profile.cache_misses), (1, 1))
+        self.assertEqual(profile.duplicate_queries()[0]['count'], 3)
+
+
+class MetricsTests(APITestCase):
+    @override_settings(METRICS_TOKEN='scrape')
+    def test_metrics_endpoint_reports_routes_and_states(self):
+        self.client.get('/api/destinations/destinations/')
+        body = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape').content.decode()
+        self.assertIn(
+            'ethiotravel_http_requests_total{method="GET",route="destinations:destination-list",status="200"}',
+            body
+        )
+        self.assertIn('ethiotravel_db_queries_per_request_bucket{le="1.0",route="destinations:destination-list"}', body)
+        self.assertIn('# TYPE ethiotravel_bookings gauge', body)
+
+    @override_settings(METRICS_TOKEN='scrape')
+    def test_metrics_token_required_when_configured(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape')
+        self.assertEqual(response.status_code, 200)
+
+    def test_metrics_not_served_without_token(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/metrics').status_code, 404)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+
+class APIRootTests(TestCase):
+    def test_urls_come_from_the_resolver(self):
+        data = self.client.get('/', HTTP_ACCEPT='application/json').json()
+        self.assertEqual(
+            data['authentication']['register']['url'],
+            'http://testserver' + reverse('users:user-register')
+        )
+        detail = data['business']['detail']
+        self.assertEqual(detail['url'], 'http://testserver/api/business/businesses/{pk}/')
+        self.assertEqual(detail['path_params'], {'pk': 'integer'})
+
+    def test_urls_follow_the_request_host(self):
+        data = self.client.get('/', HTTP_HOST='api.example.com', secure=True).json()
+        self.assertTrue(data['events']['list']['url'].startswith('https://api.example.com/api/'))
+
+    def test_browsable_api_for_browsers(self):
+        response = self.client.get('/', HTTP_ACCEPT='text/html')
+        self.assertContains(response, '/api/destinations/destinations/')
+
+    def test_api_root_view_serves_same_document(self):
+        response = APIRootView.as_view()(RequestFactory().get('/'))
+        self.assertEqual(response.data, self.client.get('/', HTTP_ACCEPT='application/json').json())
+
+
+class OpenAPISchemaTests(TestCase):
+    def setUp(self):
+        openapi.reset()
+        self.addCleanup(openapi.reset)
+
+    def test_schema_is_rendered_once(self):
+        first = self.client.get('/swagger.json/')
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('/destinations/destinations/', first.json()['paths'])
+        with self.assertNumQueries(0):
+            second = self.client.get('/swagger.json/')
+        self.assertEqual(second.content, first.content)
+
+    def test_built_file_is_served_for_its_release_only(self):
+        with tempfile.TemporaryDirectory() as root, \
+                override_settings(STATIC_ROOT=root, DEBUG=False, RELEASE_VERSION='r1'):
+            call_command('build_openapi_schema', stdout=StringIO())
+            self.assertTrue(os.path.isfile(os.path.join(root, 'openapi', 'schema-r1.json.gz')))
+            response = self.client.get('/swagger.json/')
+            self.assertRedirects(response, '/static/openapi/schema-r1.json', fetch_redirect_response=False)
+
+            with override_settings(RELEASE_VERSION='r2'):
+                self.assertEqual(self.client.get('/swagger.json/').status_code, 200)
+                call_command('build_openapi_schema', stdout=StringIO())
+            self.assertEqual(os.listdir(os.path.join(root, 'openapi')), ['schema-r2.json', 'schema-r2.json.gz'])
+
+
+class ImportTimeTests(SimpleTestCase):
+    """Cold start cost of a worker: everything `manage.py check` imports."""
+
+    # About 600ms locally, down from 1050ms before the Gemini SDK was deferred.
+    # The budget is twice that, so a slow or busy machine still passes; what
+    # must stay deferred is checked on its own. IMPORT_TIME_BUDGET_MS overrides it.
+    BUDGET_MS = int(os.getenv('IMPORT_TIME_BUDGET_MS', '1200'))
+    DEFERRED = ('google.generativeai', 'google.api_core', 'IPython', 'stripe')
+
+    def measure(self):
+        """(total import time in ms, names of imported modules)."""
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', 'manage.py', 'check'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        total_us = 0
+        imported = set()
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or line.endswith('imported package'):
+                continue
+            _, cumulative, name = line.split('|')
+            imported.add(name.strip())
+            if not name.startswith('  '):  # top level: its cumulative time covers its children
+                total_us += int(cumulative)
+        return total_us / 1000, imported
+
+    def test_manage_check_defers_heavy_imports(self):
+        _, imported = self.measure()
+        for module in self.DEFERRED:
+            self.assertFalse(module in imported, f'{module} should only be imported on first use')
+
+    def test_manage_check_import_budget(self):
+        total_ms, _ = self.measure()
+        if total_ms >= self.BUDGET_MS:
+            # One retry: a busy machine can push a single run over.
+            total_ms = min(total_ms, self.measure()[0])
+        self.assertLess(total_ms, self.BUDGET_MS, 'manage.py check import time regressed')
+
+
+class WarmUpTests(TestCase):
+    def test_warm_up(self):
+        self.assertGreater(warmup.warm_serializers(), 20)
+        with self.assertLogs('core.warmup', 'INFO'):
+            warmup.warm_up()
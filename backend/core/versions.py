@@ -0,0 +1,103 @@
+"""
+A version per model, kept in the cache: the time of the last save or delete
+of any of its rows, for keys and validators that must change with the data
+(cached facet counts, ETags).
+
+    versions.get('packages.Package')
+    versions.get_many(['packages.PackageReview', 'users.User'])
+
+The project's models are tracked from start-up (CoreConfig.ready()), through
+the post_save and post_delete signals, in every process that saves rows.
+Rows changed without signals, by bulk_create() or update(), don't change the
+version. For the models in TRACKED_FIELDS only a save that changes one of
+the fields listed does: a User is nested in most catalogue responses, but
+sign-ups, logins, verification codes and password resets change nothing
+they show.
+"""
+import os
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+
+# Models no version is read for, left untracked: without delete receivers,
+# QuerySet.delete() removes their rows with one DELETE (core.saved).
+UNTRACKED = {
+    'blog.SavedPost', 'business.SavedBusiness', 'destinations.SavedDestination', 'events.SavedEvent',
+    'packages.SavedPackage',
+}
+
+# {label: fields}: saves of these models that change none of the fields, and
+# their creation, leave the version alone.
+TRACKED_FIELDS = {
+    # users.serializers.UserSerializer's, the widest of the nested serializers.
+    'users.User': [
+        'username', 'email', 'first_name', 'last_name', 'role', 'status', 'is_active', 'is_staff',
+        'is_superuser', 'email_verified',
+    ],
+}
+
+
+def _key(label):
+    return f'version:{label}'
+
+
+def get_many(labels):
+    """{label: version} for labels; a model without one gets the current time."""
+    found = cache.get_many([_key(label) for label in labels]) if labels else {}
+    versions = {}
+    for label in labels:
+        key = _key(label)
+        version = found.get(key)
+        if version is None:
+            version = time.time()
+            if not cache.add(key, version, None):
+                # Set by another process meanwhile.
+                version = cache.get(key, version)
+        versions[label] = version
+    return versions
+
+
+def get(label):
+    return get_many([label])[label]
+
+
+def bump(label):
+    cache.set(_key(label), time.time(), None)
+
+
+def _saving(sender, instance, update_fields=None, **kwargs):
+    """Note whether saving instance of a TRACKED_FIELDS model changes a field listed."""
+    fields = TRACKED_FIELDS[sender._meta.label]
+    if instance._state.adding or (update_fields is not None and not set(update_fields) & set(fields)):
+        instance._version_changed = False
+        return
+    saved = sender._base_manager.filter(pk=instance.pk).values_list(*fields).first()
+    instance._version_changed = saved != tuple(getattr(instance, field) for field in fields)
+
+
+def _saved(sender, instance, **kwargs):
+    if instance.__dict__.pop('_version_changed', True):
+        bump(sender._meta.label)
+
+
+def _deleted(sender, **kwargs):
+    bump(sender._meta.label)
+
+
+def track_project_models():
+    """Bump the version of each model of the project's apps (but UNTRACKED) on every save or delete."""
+    base = os.path.join(os.path.realpath(settings.BASE_DIR), '')
+    for config in apps.get_app_configs():
+        if not os.path.realpath(config.path).startswith(base):
+            continue
+        for model in config.get_models():
+            if model._meta.label in UNTRACKED:
+                continue
+            uid = f'version:{model._meta.label}'
+            if model._meta.label in TRACKED_FIELDS:
+                pre_save.connect(_saving, sender=model, weak=False, dispatch_uid=uid)
+            post_save.connect(_saved, sender=model, weak=False, dispatch_uid=uid)
+            post_delete.connect(_deleted, sender=model, weak=False, dispatch_uid=uid)
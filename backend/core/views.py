@@ -1,606 +1,137 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
-from django.urls import NoReverseMatch
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.utils.crypto import constant_time_compare
+
+from . import api_root as api_root_document
+from . import profiling, saved
 
 @api_view(['GET'])
+def browsable_api_root(request, format=None):
+    return Response(api_root_document.as_dict(request))
+
+
+@csrf_exempt
 def api_root(request, format=None):
     """
     API Root View
+
+    Serves the precomputed document from core.api_root. Browsers (and
+    ?format=api) get DRF's browsable API; everything else gets the cached
+    JSON bytes without going through DRF.
     """
-    return Response({
-        'authentication': {
-            'register': {
-                'url': reverse('users:user-register', request=request, format=format),
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Register a new user',
-                'body': {
-                    'username': 'string',
-                    'email': 'string',
-                    'password': 'string',
-                    'password2': 'string',
-                    'first_name': 'string',
-                    'last_name': 'string',
-                    'role': 'string (user, business_owner, admin)'
-                }
-            },
-            'login': {
-                'url': reverse('token_obtain_pair', request=request, format=format),
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Get JWT access token',
-                'body': {
-                    'email': 'string',
-                    'password': 'string'
-                }
-            },
-            'refresh': {
-                'url': reverse('token_refresh', request=request, format=format),
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Refresh JWT access token',
-                'body': {
-                    'refresh': 'string (JWT refresh token)'
-                },
-                'response': {
-                    'access': 'string (new JWT token)'
-                }
-            }
-        },
-        'chatbot': {
-            'message': {
-                'url': reverse('chatbot:chatbot-message', request=request, format=format),
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Send a message to the chatbot and get a response',
-                'body': {
-                    'message': 'string',
-                    'session_id': 'string (optional)'
-                },
-                'response': {
-                    'session_id': 'string',
-                    'response': {
-                        'content': 'string',
-                        'timestamp': 'string (date-time)'
-                    }
-                }
-            },
-            'history': {
-                'url': reverse('chatbot:chatbot-history', request=request, format=format),
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'Get conversation history for a session',
-                'query_params': {
-                    'session_id': 'string'
-                }
-            }
-        },
-        'email_verification': {
-            'verify': {
-                'url': reverse('users:user-verify-email', request=request, format=format),
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Verify user email with verification code',
-                'body': {
-                    'email': 'string',
-                    'code': 'string (6-digit code)'
-                },
-                'response': {
-                    'status': 'string (success/error)',
-                    'message': 'string'
-                }
-            },
-            'resend': {
-                'url': reverse('users:user-resend-verification', request=request, format=format),
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Resend verification code to email',
-                'body': {
-                    'email': 'string'
-                },
-                'response': {
-                    'status': 'string (success/error)',
-                    'message': 'string'
-                }
-            }
-        },
-        'password_management': {
-            'forgot': {
-                'url': reverse('users:user-forgot-password', request=request, format=format),
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Request password reset link',
-                'body': {
-                    'email': 'string'
-                },
-                'response': {
-                    'status': 'string (success/error)',
-                    'message': 'string'
-                }
-            },
-            'reset': {
-                'url': '/api/users/reset_password/{token}/',
-                'method': 'POST',
-                'auth_required': False,
-                'description': 'Reset password using reset token',
-                'body': {
-                    'new_password': 'string (min length: 8)',
-                    'new_password2': 'string (must match new_password)'
-                },
-                'response': {
-                    'status': 'string (success/error)',
-                    'message': 'string'
-                }
-            },
-            'change': {
-                'url': reverse('users:user-change-password', request=request, format=format),
-                'method': 'POST',
-                'auth_required': True,
-                'description': 'Change password while logged in',
-                'body': {
-                    'current_password': 'string',
-                    'new_password': 'string (min length: 8)',
-                    'new_password2': 'string (must match new_password)'
-                },
-                'response': {
-                    'status': 'string (success/error)',
-                    'message': 'string'
-                }
-            }
-        },
-        'profile_management': {
-            'me': {
-                'url': reverse('users:user-me', request=request, format=format),
-                'method': 'GET',
-                'auth_required': True,
-                'description': 'Get current user profile details',
-                'response': {
-                    'username': 'string',
-                    'email': 'string',
-                    'first_name': 'string',
-                    'last_name': 'string',
-                    'role': 'string',
-                    'status': 'string',
-                    'email_verified': 'boolean',
-                    'image': 'string (url)'
-                }
-            },
-            'change_email': {
-                'url': reverse('users:user-change-email', request=request, format=format),
-                'method': 'POST',
-                'auth_required': True,
-                'description': 'Change email address (requires verification)',
-                'body': {
-                    'email': 'string',
-                    'password': 'string'
-                },
-                'response': {
-                    'status': 'string (success/error)',
-                    'message': 'string'
-                }
-            },
-            'logout': {
-                'url': reverse('users:user-logout', request=request, format=format),
-                'method': 'POST',
-                'auth_required': True,
-                'description': 'Logout and invalidate refresh token',
-                'body': {
-                    'refresh_token': 'string'
-                },
-                'response': {
-                    'status': 'string (success/error)',
-                    'message': 'string'
-                }
-            }
-        },
-        'admin': {
-            'users': {
-                'list': {
-                    'url': reverse('users:user-list', request=request, format=format),
-                    'method': 'GET',
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'List all users',
-                    'query_params': {
-                        'page': 'integer',
-                        'page_size': 'integer',
-                        'search': 'string'
-                    }
-                },
-                'detail': {
-                    'url': '/api/users/management/{id}/',
-                    'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'Manage individual user',
-                    'path_params': {
-                        'id': 'integer'
-                    }
-                },
-                'toggle_active': {
-                    'url': '/api/users/management/{id}/toggle_active/',
-                    'method': 'POST',
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'Toggle user active status',
-                    'path_params': {
-                        'id': 'integer'
-                    }
-                },
-                'toggle_staff': {
-                    'url': '/api/users/management/{id}/toggle_staff/',
-                    'method': 'POST',
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'Toggle user staff status',
-                    'path_params': {
-                        'id': 'integer'
-                    }
-                }
-            },
-            'profiles': {
-                'list': {
-                    'url': reverse('users:profile-list', request=request, format=format),
-                    'method': 'GET',
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'List all user profiles',
-                    'query_params': {
-                        'page': 'integer',
-                        'page_size': 'integer'
-                    }
-                },
-                'detail': {
-                    'url': '/api/users/profiles/{id}/',
-                    'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'Manage individual profile',
-                    'path_params': {
-                        'id': 'integer'
-                    }
-                }
-            },
-            'business_profiles': {
-                'list': {
-                    'url': reverse('users:business-profile-list', request=request, format=format),
-                    'method': 'GET',
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'List all business profiles',
-                    'query_params': {
-                        'page': 'integer',
-                        'page_size': 'integer'
-                    }
-                },
-                'detail': {
-                    'url': '/api/users/business_profiles/{id}/',
-                    'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
-                    'auth_required': True,
-                    'admin_required': True,
-                    'description': 'Manage individual business profile',
-                    'path_params': {
-                        'id': 'integer'
-                    }
-                }
-            }
-        },
-        'destinations': {
-            'list': {
-                'url': reverse('destinations:destination-list', request=request, format=format),
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'List all destinations',
-                'query_params': {
-                    'page': 'integer',
-                    'page_size': 'integer',
-                    'search': 'string'
-                }
-            }
-        },
-        'events': {
-            'list': {
-                'url': reverse('events:event-list', request=request, format=format),
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'List all events',
-                'query_params': {
-                    'page': 'integer',
-                    'page_size': 'integer',
-                    'search': 'string'
-                }
-            }
-        },
-        'packages': {
-            'list': {
-                'url': reverse('packages:package-list', request=request, format=format),
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'List all travel packages',
-                'query_params': {
-                    'page': 'integer',
-                    'page_size': 'integer',
-                    'search': 'string'
-                }
-            }
-        },
-        'business': {
-            'list': {
-                'url': '/api/business/',
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'List all businesses',
-                'query_params': {
-                    'page': 'integer',
-                    'page_size': 'integer',
-                    'search': 'string',
-                    'business_type': 'string',
-                    'region': 'string',
-                    'city': 'string'
-                }
-            },
-            'create': {
-                'url': '/api/business/create/',
-                'method': 'POST',
-                'auth_required': True,
-                'description': 'Create a new business',
-                'body': {
-                    'business_name': 'string (required)',
-                    'business_type': 'string (required)',
-                    'description': 'string (required)',
-                    'short_description': 'string (required)',
-                    'region': 'string (required)',
-                    'city': 'string (required)',
-                    'address': 'string (required)',
-                    'phone': 'string (required)',
-                    'email': 'string (required)',
-                    'website': 'string (optional)',
-                    'image': 'string (optional)',
-                    'gallery_images': 'array (optional)',
-                    'opening_hours': 'array (optional)',
-                    'facilities': 'array (optional)',
-                    'services': 'array (optional)',
-                    'team': 'array (optional)',
-                    'facebook': 'string (optional)',
-                    'instagram': 'string (optional)',
-                    'coordinates': 'array (optional)'
-                }
-            },
-            'detail': {
-                'url': '/api/business/{id}/',
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'Get business details',
-                'path_params': {
-                    'id': 'integer'
-                }
-            },
-            'reviews': {
-                'url': '/api/business/{id}/reviews/',
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'List business reviews',
-                'path_params': {
-                    'id': 'integer'
-                }
-            },
-            'add_review': {
-                'url': '/api/business/{id}/add_review/',
-                'method': 'POST',
-                'auth_required': True,
-                'description': 'Add a review to a business',
-                'path_params': {
-                    'id': 'integer'
-                },
-                'body': {
-                    'rating': 'number (1-5)',
-                    'comment': 'string'
-                }
-            },
-            'my_businesses': {
-                'url': '/api/business/my-businesses/',
-                'method': 'GET',
-                'auth_required': True,
-                'description': 'List businesses owned by the current user'
-            },
-            'featured': {
-                'url': '/api/business/featured/',
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'List featured businesses'
-            }
-        },
-        'blog': {
-            'list': {
-                'url': reverse('blog:post-list', request=request, format=format),
-                'method': 'GET',
-                'auth_required': False,
-                'description': 'List all blog posts',
-                'query_params': {
-                    'page': 'integer',
-                    'page_size': 'integer',
-                    'search': 'string',
-                    'status': 'string (published/draft)',
-                    'featured': 'boolean'
-                }
-            },
-            'create': {
-                'url': reverse('blog:post-list', request=request, format=format),
-                'method': 'POST',
-                'auth_required': True,
-                'description': 'Create a new blog post',
-                'body': {
-                    'title': 'string',
-                    'content': 'string',
-                    'excerpt': 'string (optional)',
-                    'featured_image': 'file (optional)',
-                    'tags': 'array of strings',
-                    'status': 'string (draft/published)'
-                }
-            }
-        },
-        'booking': {
-            'list': {
-                'url': reverse('booking:booking-list', request=request, format=format),
-                'method': 'GET',
-                'auth_required': True,
-                'description': 'List user bookings',
-                'query_params': {
-                    'page': 'integer',
-                    'page_size': 'integer',
-                    'status': 'string'
-                }
-            },
-            'create': {
-                'url': reverse('booking:booking-list', request=request, format=format),
-                'method': 'POST',
-                'auth_required': True,
-                'description': 'Create new booking'
-            }
-        }
-    })
+    format = format or request.GET.get('format')
+    wants_html = format == 'api' or (
+        format is None and 'text/html' in request.META.get('HTTP_ACCEPT', '')
+    )
+    if wants_html or request.method not in ('GET', 'HEAD'):
+        return browsable_api_root(request, format=format)
+    response = HttpResponse(api_root_document.render_json(request), content_type='application/json')
+    response['Vary'] = 'Accept'
+    return response
+
 
 class APIRootView(APIView):
     def get(self, request, *args, **kwargs):
-        data = {
-            "authentication": {
-                "register": {
-                    "url": reverse("users:register", request=request),
-                    "method": "POST",
-                    "auth_required": False,
-                    "description": "Register a new user",
-                    "body": {
-                        "username": "string",
-                        "email": "string",
-                        "password": "string",
-                        "password2": "string",
-                        "first_name": "string",
-                        "last_name": "string",
-                        "role": "string (user, business_owner, admin)"
-                    }
-                },
-                "login": {
-                    "url": reverse("token_obtain_pair", request=request),
-                    "method": "POST",
-                    "auth_required": False,
-                    "description": "Get JWT access token",
-                    "body": {
-                        "email": "string",
-                        "password": "string"
-                    },
-                    "response": {
-                        "access": "string (JWT token)",
-                        "refresh": "string (JWT refresh token)"
-                    }
-                },
-                "chatbot": {
-                    "message": {
-                        "url": reverse("chatbot:chatbot-message", request=request),
-                        "method": "POST",
-                        "auth_required": False,
-                        "description": "Send a message to the chatbot and get a response",
-                        "body": {
-                            "message": "string",
-                            "session_id": "string (optional)"
-                        },
-                        "response": {
-                            "session_id": "string",
-                            "response": {
-                                "content": "string",
-                                "timestamp": "string (date-time)"
-                            }
-                        }
-                    },
-                    "history": {
-                        "url": reverse("chatbot:chatbot-history", request=request),
-                        "method": "GET",
-                        "auth_required": False,
-                        "description": "Get conversation history for a session",
-                        "query_params": {
-                            "session_id": "string"
-                        }
-                    }
-                }
-            },
-            "blog": {
-                "list": {
-                    "url": reverse("blog:post-list", request=request),
-                    "method": "GET",
-                    "auth_required": False,
-                    "description": "List all blog posts",
-                    "query_params": {
-                        "page": "integer",
-                        "page_size": "integer",
-                        "search": "string",
-                        "status": "string (published/draft)",
-                        "featured": "boolean"
-                    }
-                },
-                "create": {
-                    "url": reverse("blog:post-list", request=request),
-                    "method": "POST",
-                    "auth_required": True,
-                    "description": "Create a new blog post",
-                    "body": {
-                        "title": "string",
-                        "content": "string",
-                        "excerpt": "string (optional)",
-                        "featured_image": "file (optional)",
-                        "tags": "array of strings",
-                        "status": "string (draft/published)"
-                    }
-                }
-            },
-            "businesses": {
-                "list": {
-                    "url": reverse("businesses:business-list", request=request),
-                    "method": "GET",
-                    "auth_required": False,
-                    "description": "List all businesses",
-                    "query_params": {
-                        "page": "integer",
-                        "page_size": "integer",
-                        "search": "string",
-                        "business_type": "string",
-                        "verified": "boolean",
-                        "status": "string"
-                    }
-                },
-                "create": {
-                    "url": reverse("businesses:business-create", request=request),
-                    "method": "POST",
-                    "auth_required": True,
-                    "description": "Create a new business",
-                    "body": {
-                        "business_name": "string",
-                        "business_type": "string",
-                        "description": "string",
-                        "short_description": "string",
-                        "region": "string",
-                        "city": "string",
-                        "address": "string",
-                        "phone": "string",
-                        "email": "string",
-                        "website": "string (optional)",
-                        "image": "string (optional)",
-                        "gallery_images": "array (optional)",
-                        "opening_hours": "array (optional)",
-                        "facilities": "array (optional)",
-                        "services": "array (optional)",
-                        "team": "array (optional)",
-                        "facebook": "string (optional)",
-                        "instagram": "string (optional)",
-                        "coordinates": "array (optional)"
-                    }
-                },
-                "reviews": {
-                    "url": reverse("businesses:review-list", request=request),
-                    "method": "GET",
-                    "auth_required": False,
-                    "description": "List all business reviews"
-                }
-            }
-        }
-        return Response(data) 
\ No newline at end of file
+        return Response(api_root_document.as_dict(request))
+
+
+class RequestProfileListView(APIView):
+    """
+    Recent request profiles recorded by RequestProfilingMiddleware in this
+    worker process, newest first. Admin only.
+    """
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(tags=['Debug'], operation_description="List recent request profiles")
+    def get(self, request, *args, **kwargs):
+        return Response(profiling.recent())
+
+
+class SavedItemsView(APIView):
+    """
+    The destinations, packages, events, businesses and blog posts the user
+    saved, newest first, a page at a time (core.saved).
+    """
+    permission_classes = [IsAuthenticated]
+    max_page_size = 100
+
+    @swagger_auto_schema(
+        tags=['Users'],
+        operation_description="List everything the current user saved, newest first",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="The next page, from the previous page's next link"),
+            openapi.Parameter('page_size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                              description=f"Items per page, at most {max_page_size}"),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        page_size = request.query_params.get('page_size') or api_settings.PAGE_SIZE
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            page_size = 0
+        if not 0 < page_size <= self.max_page_size:
+            raise ValidationError({'page_size': [f'Must be between 1 and {self.max_page_size}.']})
+
+        items, cursor = saved.saved_items(
+            request.user, request.query_params.get('cursor'), page_size, {'request': request},
+        )
+        next_url = replace_query_param(request.build_absolute_uri(), 'cursor', cursor) if cursor else None
+        return Response({'next': next_url, 'results': items})
+
+
+class SavedItemsBulkView(APIView):
+    """
+    Save and unsave many objects of a type at once, idempotently
+    (core.saved.change_saved); the response is their state afterwards.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=['Users'],
+        operation_description="Save and unsave many destinations, packages, events, businesses or posts",
+        request_body=saved.SavedChangeSerializer,
+        responses={
+            200: openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+                'type': openapi.Schema(type=openapi.TYPE_STRING),
+                'saved': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING)),
+                'unsaved': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING)),
+                'missing': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING)),
+            }),
+            400: "Bad Request",
+            401: "Unauthorized",
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = saved.SavedChangeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        name = serializer.validated_data['type']
+        saved_pks, unsaved_pks, missing = saved.change_saved(
+            request.user, name, serializer.validated_data['save'], serializer.validated_data['unsave'],
+        )
+        return Response({'type': name, 'saved': saved_pks, 'unsaved': unsaved_pks, 'missing': missing})
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint; open without METRICS_TOKEN in DEBUG only."""
+    if not settings.METRICS_ENABLED or not (settings.METRICS_TOKEN or settings.DEBUG):
+        raise Http404
+    if settings.METRICS_TOKEN and not constant_time_compare(
+        request.META.get('HTTP_AUTHORIZATION', ''), f'Bearer {settings.METRICS_TOKEN}'
+    ):
+        return HttpResponse(status=401)
+    from . import metrics
+
+    body, content_type = metrics.render()
+    return HttpResponse(body, content_type=content_type)
@@ -0,0 +1,66 @@
+"""
+Work done once in the server's master process before it forks workers (see
+gunicorn.conf.py and run.py), so workers start warm and share the memory.
+
+Everything here only fills caches: the URL resolver, model metadata, every
+serializer's fields (which also loads validators and translations), the API
+root document and a DB connectivity check.
+"""
+import logging
+import time
+
+from django.apps import apps
+from django.db import connections
+from django.urls import get_resolver
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def warm_serializers():
+    """Build the fields of every project serializer; returns how many were built."""
+    project_apps = {config.name for config in apps.get_app_configs() if '.' not in config.name}
+    built = 0
+    for serializer_class in set(_subclasses(serializers.Serializer)):
+        if serializer_class.__module__.split('.')[0] not in project_apps:
+            continue
+        try:
+            serializer_class(context={}).fields
+        except Exception:
+            # Some serializers need a request in their context; skipping them
+            # only means they warm up on first use.
+            logger.debug('Could not warm %s', serializer_class.__qualname__, exc_info=True)
+            continue
+        built += 1
+    return built
+
+
+def check_databases():
+    """Connect to every database once, then close: connections must not cross a fork."""
+    for connection in connections.all():
+        try:
+            connection.ensure_connection()
+        except Exception as e:
+            logger.error('Database %r is not reachable: %s', connection.alias, e)
+    connections.close_all()
+
+
+def warm_up():
+    start = time.perf_counter()
+    resolver = get_resolver()
+    resolver.reverse_dict  # imports every URLconf and view module
+    for model in apps.get_models():
+        model._meta.get_fields()
+    built = warm_serializers()
+
+    from . import api_root
+    api_root.document()
+
+    check_databases()
+    logger.info('Warm-up finished in %.0fms (%d serializers)', (time.perf_counter() - start) * 1000, built)
@@ -5,4 +5,4 @@ class DestinationsConfig(AppConfig):
     name = "destinations"
 
     def ready(self):
-        import destinations.signals
\ No newline at end of file
+        import destinations.signals
@@ -0,0 +1,8 @@
+from core.facets import Facets, FieldFacet
+
+DESTINATION_FACETS = Facets(
+    'destinations.Destination',
+    FieldFacet('category'),
+    FieldFacet('region'),
+    FieldFacet('city'),
+)
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-19 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('destinations', '0003_auto_20250517_1511'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='destinationreview',
+            name='destination_destina_4a0a56_idx',
+        ),
+        migrations.AddIndex(
+            model_name='destination',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['-created_at'], name='destination_active_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='destinationreview',
+            index=models.Index(fields=['destination', '-created_at'], name='destreview_dest_recent_idx'),
+        ),
+    ]
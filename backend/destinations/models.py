@@ -1,5 +1,5 @@
 from django.db import models
-from django.utils.text import slugify
+from core import slugs
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
 import uuid
@@ -64,21 +64,13 @@ class Destination(models.Model):
         return self.title
     
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-            # Ensure slug uniqueness
-            original_slug = self.slug
-            counter = 1
-            while Destination.objects.filter(slug=self.slug).exclude(id=self.id).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
-            # Cast longitude and latitude to 6 decimal places if they are not None
+        # Cast longitude and latitude to 6 decimal places if they are not None
         if self.latitude is not None:
             self.latitude = round(float(self.latitude), 6)
         if self.longitude is not None:
             self.longitude = round(float(self.longitude), 6)
         
-        super().save(*args, **kwargs)
+        slugs.save_with_slug(self, self.title, super().save, *args, **kwargs)
     
     class Meta:
         indexes = [
@@ -87,6 +79,10 @@ class Destination(models.Model):
             models.Index(fields=['region']),
             models.Index(fields=['featured']),
             models.Index(fields=['status']),
+            # The public list: active destinations, newest first.
+            models.Index(
+                fields=['-created_at'], condition=models.Q(status='active'), name='destination_active_recent_idx',
+            ),
         ]
 
 class DestinationReview(models.Model):
@@ -106,7 +102,8 @@ class DestinationReview(models.Model):
     
     class Meta:
         indexes = [
-            models.Index(fields=['destination']),
+            # A destination's reviews, newest first.
+            models.Index(fields=['destination', '-created_at'], name='destreview_dest_recent_idx'),
             models.Index(fields=['user']),
             models.Index(fields=['rating']),
         ]
@@ -11,10 +11,15 @@ from .serializers import (
     DestinationReviewSerializer, SavedDestinationSerializer
 )
 from .permissions import IsDestinationOwnerOrReadOnly, IsReviewOwnerOrReadOnly
+from .facets import DESTINATION_FACETS
+from core.facets import response_schema
+from core.batch import BatchRetrieveMixin
+from core.conditional import ConditionalGetMixin
+from core.listing import SparseFieldsMixin, ValuesListMixin
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-class DestinationViewSet(viewsets.ModelViewSet):
+class DestinationViewSet(BatchRetrieveMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Destination.objects.all()
     serializer_class = DestinationSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -22,6 +27,10 @@ class DestinationViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'description', 'city']
     ordering_fields = ['rating', 'review_count', 'created_at']
     ordering = ['-created_at']
+    # Models nested in the responses, for the ETags.
+    conditional_dependencies = ['destinations.DestinationReview', 'users.User']
+    # ?view=card
+    card_fields = ['id', 'title', 'slug', 'category', 'region', 'city', 'images', 'rating', 'review_count', 'featured']
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -40,7 +49,7 @@ class DestinationViewSet(viewsets.ModelViewSet):
         return []
 
     def get_queryset(self):
-        if self.action == 'list':
+        if self.action in ('list', 'facets'):
             return self.queryset.filter(status='active')
         return self.queryset
 
@@ -248,7 +257,17 @@ class DestinationViewSet(viewsets.ModelViewSet):
         serializer = SavedDestinationSerializer(saved_destinations, many=True)
         return Response(serializer.data)
 
-class DestinationReviewViewSet(viewsets.ModelViewSet):
+    @swagger_auto_schema(
+        tags=['Destinations'],
+        operation_description="Counts of active destinations per category, region and city, for the same filters as the list",
+        responses={200: response_schema(DESTINATION_FACETS)}
+    )
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(DESTINATION_FACETS.for_request(queryset, request))
+
+class DestinationReviewViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = DestinationReviewSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
@@ -354,7 +373,7 @@ class DestinationReviewViewSet(viewsets.ModelViewSet):
         review.save()
         return Response({'reported': review.reported})
 
-class SavedDestinationViewSet(viewsets.ModelViewSet):
+class SavedDestinationViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = SavedDestination.objects.all()
     serializer_class = SavedDestinationSerializer
     permission_classes = [IsAuthenticated]
@@ -2,6 +2,10 @@
 ASGI config for ethiotravel project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+ASYNC_VIEWS is switched on here, so the I/O-bound endpoints use async views.
+Serve it with uvicorn::
+
+    uvicorn ethiotravel.asgi:application --host 0.0.0.0 --port 8000
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
@@ -12,5 +16,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+os.environ.setdefault('ASYNC_VIEWS', 'True')
 
 application = get_asgi_application()
@@ -9,7 +9,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from core.views import api_root
+from core.views import api_root, metrics_view, RequestProfileListView, SavedItemsBulkView, SavedItemsView
+from core.openapi import cached_schema_view
 from django.views.generic import RedirectView
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
@@ -56,11 +57,17 @@ urlpatterns = [
     path('api/booking/', include('booking.urls', namespace='booking')),
     path('api/business/', include('business.urls', namespace='business')),
     path('api/chatbot/message/', include('chatbot.urls', namespace='chatbot')),
+    path('api/me/saved/', SavedItemsView.as_view(), name='me-saved'),
+    path('api/me/saved/bulk/', SavedItemsBulkView.as_view(), name='me-saved-bulk'),
     
     # Authentication endpoints
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('api-auth/', include('rest_framework.urls')),  # Django REST framework browsable API auth
+
+    # Monitoring and debugging
+    path('metrics', metrics_view, name='metrics'),
+    path('api/_debug/requests/', RequestProfileListView.as_view(), name='debug-requests'),
 ]
 
 # Swagger documentation
@@ -75,9 +82,10 @@ schema_view = get_schema_view(
     authentication_classes=(),
 )
 
-# Add Swagger URLs
+# Add Swagger URLs. The UIs only render a page shell; they load the spec from
+# schema-json, which is built once per release (see core.openapi).
 urlpatterns += [
-    path('swagger<format>/', schema_view.without_ui(cache_timeout=0), name='schema-json'),
+    path('swagger<format>/', cached_schema_view(schema_view.without_ui(cache_timeout=0)), name='schema-json'),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
 ]
@@ -0,0 +1,7 @@
+from core.facets import Facets, FieldFacet, RangeFacet
+
+EVENT_FACETS = Facets(
+    'events.Event',
+    FieldFacet('category'),
+    RangeFacet('price', [500, 1000, 2000]),
+)
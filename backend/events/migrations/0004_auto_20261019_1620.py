@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-19 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_auto_20250525_1158'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='eventreview',
+            name='events_even_event_i_d1e89c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['start_date'], name='event_published_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventreview',
+            index=models.Index(fields=['event', '-created_at'], name='eventreview_event_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from core.db.operations import AddJSONPathIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_auto_20261019_1620'),
+    ]
+
+    operations = [
+        AddJSONPathIndex(model_name='eventsubscription', field='categories', name='eventsub_categories_gin'),
+    ]
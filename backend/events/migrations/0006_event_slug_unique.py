@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-19 13:37
+
+from django.db import migrations, models
+
+
+def deduplicate_slugs(apps, schema_editor):
+    """Give every event after the first with a slug (or none) a free "-N" one."""
+    Event = apps.get_model('events', 'Event')
+    taken = set(Event.objects.values_list('slug', flat=True))
+    seen = set()
+    for event in Event.objects.order_by('pk').only('pk', 'slug').iterator():
+        if event.slug and event.slug not in seen:
+            seen.add(event.slug)
+            continue
+        base = event.slug or 'event'
+        number = 1
+        while f'{base}-{number}' in taken:
+            number += 1
+        event.slug = f'{base}-{number}'
+        taken.add(event.slug)
+        seen.add(event.slug)
+        event.save(update_fields=['slug'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_eventsubscription_categories_gin'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='event',
+            name='slug',
+            field=models.SlugField(blank=True, unique=True),
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from django.utils.text import slugify
+from core import slugs
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 User = get_user_model()
@@ -29,7 +29,7 @@ class Event(models.Model):
     
     id = models.AutoField(primary_key=True)
     title = models.CharField(max_length=300)
-    slug = models.SlugField(unique=False, blank=True)
+    slug = models.SlugField(unique=True, blank=True)
     description = models.TextField()
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     start_date = models.DateTimeField()
@@ -53,15 +53,13 @@ class Event(models.Model):
         return self.title
     
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
         # Cast longitude and latitude to 6 decimal places if they are not None
         if self.latitude is not None:
             self.latitude = round(float(self.latitude), 6)
         if self.longitude is not None:
             self.longitude = round(float(self.longitude), 6)
         
-        super().save(*args, **kwargs)
+        slugs.save_with_slug(self, self.title, super().save, *args, **kwargs)
     
     class Meta:
         indexes = [
@@ -70,6 +68,10 @@ class Event(models.Model):
             models.Index(fields=['start_date']),
             models.Index(fields=['status']),
             models.Index(fields=['featured']),
+            # Published events by date: the list, upcoming, featured and calendar.
+            models.Index(
+                fields=['start_date'], condition=models.Q(status='published'), name='event_published_start_idx',
+            ),
         ]
 
 class EventReview(models.Model):
@@ -89,7 +91,8 @@ class EventReview(models.Model):
     
     class Meta:
         indexes = [
-            models.Index(fields=['event']),
+            # An event's reviews, newest first.
+            models.Index(fields=['event', '-created_at'], name='eventreview_event_recent_idx'),
             models.Index(fields=['user']),
             models.Index(fields=['rating']),
         ]
@@ -140,6 +143,7 @@ class SavedEvent(models.Model):
 class EventSubscription(models.Model):
     id = models.AutoField(primary_key=True)
     email = models.EmailField(unique=True)
+    # GIN-indexed on PostgreSQL; filter with categories__array_contains.
     categories = models.JSONField(default=list)  # Updated to use Django's native JSONField
     created_at = models.DateTimeField(auto_now_add=True)
     
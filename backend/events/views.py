@@ -13,11 +13,16 @@ from .serializers import (
     SavedEventSerializer, EventSubscriptionSerializer
 )
 from .permissions import IsEventOwnerOrReadOnly, IsReviewOwnerOrReadOnly
+from .facets import EVENT_FACETS
+from core.facets import response_schema
+from core.batch import BatchRetrieveMixin
+from core.conditional import ConditionalGetMixin
+from core.listing import SparseFieldsMixin, ValuesListMixin
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework import serializers
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(BatchRetrieveMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -25,8 +30,14 @@ class EventViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'description', 'location']
     ordering_fields = ['start_date', 'created_at', 'rating']
     ordering = ['-start_date']
+    # Models nested in the responses, for the ETags.
+    conditional_dependencies = ['events.EventReview', 'events.EventRegistration', 'users.User']
+    # ?view=card
+    card_fields = ['id', 'title', 'slug', 'category', 'location', 'start_date', 'end_date', 'images', 'price', 'featured']
 
     def get_serializer_class(self):
+        if self.action == 'batch':
+            return EventListSerializer
         if self.action == 'list':
             if self.request.query_params.get('full_details', 'false').lower() == 'true':
                 return EventSerializer
@@ -43,7 +54,7 @@ class EventViewSet(viewsets.ModelViewSet):
         return []
 
     def get_queryset(self):
-        if self.action == 'list':
+        if self.action in ('list', 'facets'):
             return self.queryset.filter(status='published')
         return self.queryset
 
@@ -350,8 +361,18 @@ class EventViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'])
     def categories(self, request):
-        categories = Event.objects.values_list('category', flat=True).distinct()
-        return Response(categories)
+        counts = EVENT_FACETS.for_request(Event.objects.all(), request, only=['category'])
+        return Response([value['value'] for value in counts['facets']['category']])
+
+    @swagger_auto_schema(
+        tags=['Events'],
+        operation_description="Counts of published events per category and price range, for the same filters as the list",
+        responses={200: response_schema(EVENT_FACETS)}
+    )
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(EVENT_FACETS.for_request(queryset, request))
 
     @swagger_auto_schema(
         tags=['Events'],
@@ -420,7 +441,7 @@ class EventViewSet(viewsets.ModelViewSet):
         
         return Response(calendar_data)
 
-class EventReviewViewSet(viewsets.ModelViewSet):
+class EventReviewViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = EventReview.objects.all()
     serializer_class = EventReviewSerializer
     permission_classes = [IsReviewOwnerOrReadOnly]
@@ -481,7 +502,7 @@ class EventReviewViewSet(viewsets.ModelViewSet):
         review.save()
         return Response({'message': 'Review reported successfully'})
 
-class SavedEventViewSet(viewsets.ModelViewSet):
+class SavedEventViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = SavedEvent.objects.all()
     serializer_class = SavedEventSerializer
     permission_classes = [IsAuthenticated]
@@ -521,7 +542,7 @@ class SavedEventViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-class EventRegistrationViewSet(viewsets.ModelViewSet):
+class EventRegistrationViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = EventRegistrationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -560,7 +581,7 @@ class EventRegistrationViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-class EventSubscriptionViewSet(viewsets.ModelViewSet):
+class EventSubscriptionViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = EventSubscription.objects.all()
     serializer_class = EventSubscriptionSerializer
     permission_classes = [IsAuthenticated]
@@ -0,0 +1,66 @@
+"""
+Production gunicorn settings, picked up automatically when gunicorn is started
+from this directory::
+
+    gunicorn ethiotravel.wsgi
+
+The app is imported and warmed up (core.warmup) once in the master. Then the
+heap is frozen with gc.freeze(), so the garbage collector in the workers never
+writes to those pages and they stay shared copy-on-write.
+
+Environment: PORT, WEB_CONCURRENCY (workers, default 2 per CPU + 1),
+GUNICORN_THREADS (per worker, default 4), GUNICORN_TIMEOUT.
+"""
+import gc
+import os
+import shutil
+import tempfile
+
+
+def cpu_count():
+    # Only the CPUs this process may run on, which respects container limits.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+keepalive = 5
+preload_app = True
+# Recycle workers now and then, so slow leaks can't accumulate; the jitter
+# keeps them from all restarting at once.
+max_requests = 5000
+max_requests_jitter = 500
+accesslog = '-'
+
+# Workers write Prometheus samples to files here; core.metrics merges them at
+# scrape time. Must be set before the app (and prometheus_client) is imported.
+METRICS_DIR_PREFIX = 'ethiotravel-prometheus-'
+if workers > 1 and not os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix=METRICS_DIR_PREFIX)
+
+
+def when_ready(server):
+    # With preload_app the application is imported by now, in the master.
+    from core.warmup import warm_up
+
+    warm_up()
+    gc.freeze()
+
+
+def child_exit(server, worker):
+    from core import metrics
+
+    metrics.mark_process_dead(worker.pid)
+
+
+def on_exit(server):
+    # Only a directory created above; one set by the deployment is left alone.
+    metrics_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR', '')
+    if os.path.basename(metrics_dir).startswith(METRICS_DIR_PREFIX):
+        shutil.rmtree(metrics_dir, ignore_errors=True)
@@ -0,0 +1,7 @@
+"""
+HTTP load tests for the EthioTravel API.
+
+Scenarios drive a running server (``python run.py`` or gunicorn) over real
+HTTP and report throughput and latency percentiles per endpoint. See
+``python -m loadtest --help``.
+"""
@@ -0,0 +1,124 @@
+"""
+Benchmark the batch endpoints (core.batch): resolving N objects with one
+POST .../batch/ against a GET of each detail URL.
+
+    python -m loadtest.batchbench --ids 50 --repeat 10
+
+For packages, destinations and blog posts, times in process through the
+Django test client and all middleware, and reports the median server time
+and SQL queries of:
+
+    details     one GET of the detail URL per id
+    batch       POST .../batch/ with the ids, item cache empty
+    cached      the same POST again, items cached
+
+Run from the backend directory against a seeded database (generate_load_data).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+def resources(count):
+    from blog.models import BlogPost
+    from destinations.models import Destination
+    from packages.models import Package
+
+    return [
+        ('packages', 'packages:package', list(Package.objects.order_by('pk').values_list('pk', flat=True)[:count])),
+        ('destinations', 'destinations:destination',
+         list(Destination.objects.order_by('pk').values_list('pk', flat=True)[:count])),
+        ('blog posts', 'blog:post', list(BlogPost.objects.order_by('pk').values_list('pk', flat=True)[:count])),
+    ]
+
+
+def measure(request, repeat, before=None):
+    """(median ms, queries per run) of request()."""
+    from django.db import connections
+    from django.test.utils import CaptureQueriesContext
+
+    from .runner import percentile
+
+    timings, queries = [], 0
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        contexts = [CaptureQueriesContext(connection) for connection in connections.all()]
+        for context in contexts:
+            context.__enter__()
+        started = time.perf_counter()
+        try:
+            request()
+        finally:
+            timings.append((time.perf_counter() - started) * 1000)
+            for context in contexts:
+                context.__exit__(None, None, None)
+        queries += sum(len(context) for context in contexts)
+    timings.sort()
+    return percentile(timings, 50), queries / repeat
+
+
+def bench(count, repeat):
+    from django.core.cache import cache
+    from django.test import Client
+    from django.urls import reverse
+
+    client = Client()
+    results = []
+    for name, route, pks in resources(count):
+        ids = [str(pk) for pk in pks]
+        batch_url = reverse(f'{route}-batch')
+
+        def details():
+            for pk in pks:
+                client.get(reverse(f'{route}-detail', args=[pk]))
+
+        def batch():
+            client.post(batch_url, {'ids': ids}, content_type='application/json')
+
+        for mode, request, before in [('details', details, cache.clear), ('batch', batch, cache.clear),
+                                      ('cached', batch, None)]:
+            ms, queries = measure(request, repeat, before)
+            results.append({'resource': name, 'ids': len(ids), 'mode': mode, 'ms': round(ms, 2),
+                            'queries': round(queries, 1)})
+    return results
+
+
+def summary_table(results):
+    header = f"{'resource':<14} {'ids':>5} {'mode':<8} {'ms':>9} {'queries':>8}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(f"{r['resource']:<14} {r['ids']:>5} {r['mode']:<8} {r['ms']:>9.2f} {r['queries']:>8.1f}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.batchbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ids', type=int, default=50, help='Objects per resource')
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per resource and mode')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+    import django
+
+    django.setup()
+    from django.conf import settings
+
+    # The test client's host.
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+
+    results = bench(args.ids, args.repeat)
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'ids': args.ids, 'repeat': args.repeat, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
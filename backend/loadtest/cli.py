@@ -0,0 +1,113 @@
+"""
+Run the load-test scenarios against a live server and print per-endpoint
+throughput and latency percentiles.
+
+Typical release check::
+
+    python manage.py generate_load_data --seed 42 --anchor-date today
+    python -m loadtest.fake_gemini &
+    GEMINI_API_KEY=fake GEMINI_API_ENDPOINT=http://127.0.0.1:8089 python run.py &
+    python -m loadtest --users 50 --duration 120 --json release.json --compare previous.json
+"""
+import argparse
+import json
+import sys
+
+from . import runner
+from .scenarios import SCENARIOS
+
+COLUMNS = [
+    ('requests', 'reqs', '{:>8}'),
+    ('failures', 'fails', '{:>6}'),
+    ('rps', 'req/s', '{:>8.1f}'),
+    ('mean_ms', 'mean', '{:>8.0f}'),
+    ('p50_ms', 'p50', '{:>7.0f}'),
+    ('p90_ms', 'p90', '{:>7.0f}'),
+    ('p95_ms', 'p95', '{:>7.0f}'),
+    ('p99_ms', 'p99', '{:>7.0f}'),
+    ('max_ms', 'max', '{:>7.0f}'),
+]
+
+
+def format_table(rows, baseline=None):
+    baseline = {(r['method'], r['name']): r for r in (baseline or [])}
+    width = max([len(f"{r['method']} {r['name']}") for r in rows] + [20])
+    header = f"{'Endpoint':<{width}} " + ' '.join(
+        f'{label:>{len(fmt.format(0))}}' for _, label, fmt in COLUMNS
+    )
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        label = f"{row['method']} {row['name']}".strip()
+        line = f'{label:<{width}} ' + ' '.join(fmt.format(row[key]) for key, _, fmt in COLUMNS)
+        before = baseline.get((row['method'], row['name']))
+        if before and before['p95_ms']:
+            change = (row['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+            rps_change = (row['rps'] - before['rps']) / before['rps'] * 100 if before['rps'] else 0
+            line += f'  p95 {change:+.0f}%, req/s {rps_change:+.0f}%'
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='http://127.0.0.1:8000', help='Server base URL')
+    parser.add_argument('--users', type=int, default=20, help='Concurrent virtual users')
+    parser.add_argument('--spawn-rate', type=float, default=5.0, help='Users started per second')
+    parser.add_argument('--duration', type=float, default=60.0, help='Test length in seconds')
+    parser.add_argument(
+        '--scenario', action='append', choices=sorted(SCENARIOS),
+        help='Run only these scenarios (repeatable; default: all, by weight)'
+    )
+    parser.add_argument('--seed', type=int, default=1, help='Seed for user and task selection')
+    parser.add_argument('--accounts', type=int, default=1000,
+                        help='Number of generate_load_data accounts to log in as')
+    parser.add_argument('--accounts-seed', type=int, default=42,
+                        help='Seed generate_load_data was run with')
+    parser.add_argument('--fake-gemini-port', type=int,
+                        help='Also start the fake Gemini endpoint on this port')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Show p95 and req/s deltas against an earlier --json file')
+    args = parser.parse_args(argv)
+
+    fake_gemini = None
+    if args.fake_gemini_port:
+        from .fake_gemini import start
+        fake_gemini = start(port=args.fake_gemini_port, latency_ms=400)
+        print(f'Fake Gemini on http://127.0.0.1:{args.fake_gemini_port} '
+              '(start the server with GEMINI_API_ENDPOINT pointing here)')
+
+    scenarios = [SCENARIOS[name] for name in (args.scenario or SCENARIOS)]
+    print(f'Running {", ".join(s.__name__ for s in scenarios)} with {args.users} users '
+          f'for {args.duration:.0f}s against {args.host}')
+    stats = runner.run(
+        scenarios, args.host, args.users, args.duration,
+        spawn_rate=args.spawn_rate, seed=args.seed,
+        options={'accounts': args.accounts, 'accounts_seed': args.accounts_seed},
+    )
+    if fake_gemini is not None:
+        fake_gemini.shutdown()
+
+    rows = stats.rows()
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['endpoints']
+    print(format_table(rows, baseline))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'host': args.host,
+                'users': args.users,
+                'duration': stats.duration,
+                'scenarios': [s.__name__ for s in scenarios],
+                'endpoints': rows,
+            }, f, indent=2)
+
+    failed = rows[-1]['failures']
+    return 1 if failed and failed == rows[-1]['requests'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
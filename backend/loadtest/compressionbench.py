@@ -0,0 +1,114 @@
+"""
+Benchmark response compression (core.middleware.CompressionMiddleware) and
+the ETag-keyed response cache (core.conditional).
+
+    python -m loadtest.compressionbench --repeat 50
+
+For list and detail URLs of the catalogue endpoints, times GETs in process
+through the Django test client and all middleware, and reports the median
+server time and the bytes sent, in each mode:
+
+    identity        no Accept-Encoding, response cache off
+    gzip            Accept-Encoding: gzip, response cache off (compressed per request)
+    gzip, cached    Accept-Encoding: gzip, response cache on (compressed once)
+    br, cached      Accept-Encoding: br, response cache on (with brotli installed)
+
+Run from the backend directory against a seeded database (generate_load_data).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+def urls():
+    from django.urls import reverse
+
+    from destinations.models import Destination
+    from packages.models import Package
+
+    package = Package.objects.filter(status='active').order_by('pk').first()
+    destination = Destination.objects.filter(status='active').order_by('pk').first()
+    return [
+        ('packages list', reverse('packages:package-list') + '?ordering=price'),
+        ('package detail', reverse('packages:package-detail', args=[package.pk])),
+        ('destinations list', reverse('destinations:destination-list')),
+        ('destination detail', reverse('destinations:destination-detail', args=[destination.pk])),
+        ('blog list', reverse('blog:post-list')),
+    ]
+
+
+def modes():
+    from core import compression
+
+    yield 'identity', '', 0
+    yield 'gzip', 'gzip', 0
+    yield 'gzip, cached', 'gzip', 300
+    if compression.brotli is not None:
+        yield 'br, cached', 'br', 300
+
+
+def measure(client, url, repeat, accept_encoding):
+    """(median ms, body bytes) of GET url."""
+    from .runner import percentile
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(url, HTTP_ACCEPT_ENCODING=accept_encoding)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return percentile(timings, 50), len(response.content)
+
+
+def bench(repeat):
+    from django.core.cache import cache
+    from django.test import Client, override_settings
+
+    client = Client()
+    results = []
+    for name, url in urls():
+        for mode, accept_encoding, cache_seconds in modes():
+            cache.clear()
+            with override_settings(RESPONSE_CACHE_SECONDS=cache_seconds):
+                ms, size = measure(client, url, repeat, accept_encoding)
+            results.append({'url': name, 'mode': mode, 'ms': round(ms, 2), 'bytes': size})
+    return results
+
+
+def summary_table(results):
+    header = f"{'url':<22} {'mode':<14} {'ms':>8} {'bytes':>9}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(f"{r['url']:<22} {r['mode']:<14} {r['ms']:>8.2f} {r['bytes']:>9}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.compressionbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50, help='Requests per URL and mode')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+    import django
+
+    django.setup()
+    from django.conf import settings
+
+    # The test client's host.
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+
+    results = bench(args.repeat)
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'repeat': args.repeat, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
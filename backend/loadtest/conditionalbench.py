@@ -0,0 +1,125 @@
+"""
+Benchmark conditional GET (core.conditional): what a revalidation that ends
+in 304 Not Modified costs against downloading the response again.
+
+    python -m loadtest.conditionalbench --repeat 50
+
+For list and detail URLs of the catalogue endpoints, times full GETs and
+GETs with the ETag of the first response (If-None-Match), in process through
+the Django test client and all middleware, and reports the median server
+time, the SQL queries and the bytes sent for each. Run from the backend
+directory against a seeded database (generate_load_data).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+def urls():
+    from django.urls import reverse
+
+    from blog.models import BlogPost
+    from destinations.models import Destination
+    from packages.models import Package
+
+    package = Package.objects.filter(status='active').order_by('pk').first()
+    destination = Destination.objects.filter(status='active').order_by('pk').first()
+    post = BlogPost.objects.order_by('pk').first()
+    return [
+        ('packages list', reverse('packages:package-list') + '?ordering=price'),
+        ('packages list, card', reverse('packages:package-list') + '?ordering=price&view=card'),
+        ('package detail', reverse('packages:package-detail', args=[package.pk])),
+        ('destinations list', reverse('destinations:destination-list')),
+        ('destination detail', reverse('destinations:destination-detail', args=[destination.pk])),
+        ('blog list', reverse('blog:post-list')),
+        ('blog post', reverse('blog:post-detail', args=[post.pk])),
+    ]
+
+
+def measure(client, url, repeat, **headers):
+    """(median ms, queries per request, body bytes, status) of GET url."""
+    from django.db import connections
+    from django.test.utils import CaptureQueriesContext
+
+    from .runner import percentile
+
+    timings = []
+    contexts = [CaptureQueriesContext(connection) for connection in connections.all()]
+    for context in contexts:
+        context.__enter__()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = client.get(url, **headers)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        for context in contexts:
+            context.__exit__(None, None, None)
+    timings.sort()
+    queries = sum(len(context) for context in contexts) / repeat
+    return percentile(timings, 50), queries, len(response.content), response.status_code
+
+
+def bench(repeat):
+    from django.test import Client
+
+    client = Client()
+    results = []
+    for name, url in urls():
+        etag = client.get(url)['ETag']
+        full_ms, full_queries, full_bytes, _ = measure(client, url, repeat)
+        cond_ms, cond_queries, cond_bytes, status = measure(client, url, repeat, HTTP_IF_NONE_MATCH=etag)
+        results.append({
+            'url': name,
+            'full_ms': round(full_ms, 2),
+            'full_queries': round(full_queries, 1),
+            'full_bytes': full_bytes,
+            'revalidate_ms': round(cond_ms, 2),
+            'revalidate_queries': round(cond_queries, 1),
+            'revalidate_bytes': cond_bytes,
+            'revalidate_status': status,
+        })
+    return results
+
+
+def summary_table(results):
+    header = (f"{'url':<22} {'200 ms':>8} {'queries':>8} {'bytes':>8} "
+              f"{'304 ms':>8} {'queries':>8} {'status':>7}")
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['url']:<22} {r['full_ms']:>8.2f} {r['full_queries']:>8.1f} {r['full_bytes']:>8} "
+            f"{r['revalidate_ms']:>8.2f} {r['revalidate_queries']:>8.1f} {r['revalidate_status']:>7}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.conditionalbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50, help='Requests per URL and mode')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+    import django
+
+    django.setup()
+    from django.conf import settings
+
+    # The test client's host.
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+
+    results = bench(args.repeat)
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'repeat': args.repeat, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Benchmark database connection handling: many concurrent clients each run
+request-shaped work (request_started, a typical list query, request_finished)
+against the configured database, and we report latency, how many connections
+were opened and how many the server held at once.
+
+    python -m loadtest.dbbench --clients 200 --duration 20 --restart
+
+Modes:
+    per-request  CONN_MAX_AGE=0: connect for every request
+    persistent   CONN_MAX_AGE=600: reuse the thread's connection
+    checked      persistent, with CONN_HEALTH_CHECKS (core.db.postgresql)
+
+--restart kills every server connection halfway through (pg_terminate_backend,
+as a database restart or failover would) while the clients are between
+requests, and counts the requests that fail on a dead connection afterwards. Point DATABASE_URL at pgbouncer (with DATABASE_POOLER=pgbouncer)
+to measure through it instead. Run from the backend directory against a
+seeded PostgreSQL database (generate_load_data).
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+MODES = {
+    'per-request': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False},
+    'persistent': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': False},
+    'checked': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True},
+}
+
+
+def server_connections(cursor):
+    cursor.execute(
+        "SELECT count(*) FROM pg_stat_activity WHERE datname = current_database() AND pid <> pg_backend_pid()"
+    )
+    return cursor.fetchone()[0]
+
+
+def terminate_connections(cursor):
+    cursor.execute(
+        "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+        "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+    )
+
+
+def bench(mode, clients, duration, restart):
+    from django.core.signals import request_finished, request_started
+    from django.db import DatabaseError, connection, connections
+    from django.db.backends.signals import connection_created
+
+    from destinations.models import Destination
+
+    from .runner import percentile
+
+    connections.close_all()
+    connections.databases['default'].update(MODES[mode])
+    # The monitor uses its own, unpooled connection, opened before the clients'.
+    monitor = connections.create_connection('default')
+    monitor.ensure_connection()
+
+    opened = []
+    connection_created.connect(lambda **kwargs: opened.append(1), weak=False, dispatch_uid='dbbench')
+    latencies, failures = [], []
+    lock = threading.Lock()
+    stop = threading.Event()
+    ready = threading.Barrier(clients + 1)
+    # The restart happens with every client parked between two requests.
+    pause_requested = threading.Event()
+    pause = threading.Barrier(clients + 1)
+
+    def client():
+        mine, failed = [], 0
+        ready.wait()
+        while not stop.is_set():
+            if pause_requested.is_set():
+                pause.wait()
+                pause.wait()
+            started = time.perf_counter()
+            request_started.send(sender=None)
+            try:
+                list(Destination.objects.filter(featured=True).order_by('-rating')[:20])
+            except DatabaseError:
+                failed += 1
+            else:
+                mine.append((time.perf_counter() - started) * 1000)
+            finally:
+                request_finished.send(sender=None)
+        connection.close()
+        with lock:
+            latencies.extend(mine)
+            failures.append(failed)
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    started = time.perf_counter()
+    peak = 0
+    restarted = not restart
+    with monitor.cursor() as cursor:
+        while time.perf_counter() - started < duration:
+            time.sleep(0.25)
+            peak = max(peak, server_connections(cursor))
+            if not restarted and time.perf_counter() - started >= duration / 2:
+                pause_requested.set()
+                pause.wait()
+                terminate_connections(cursor)
+                pause_requested.clear()
+                pause.wait()
+                restarted = True
+    stop.set()
+    elapsed = time.perf_counter() - started
+    for thread in threads:
+        thread.join()
+    monitor.close()
+    connection_created.disconnect(dispatch_uid='dbbench')
+
+    latencies.sort()
+    return {
+        'mode': mode,
+        'requests': len(latencies),
+        'failures': sum(failures),
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50), 1),
+        'p95_ms': round(percentile(latencies, 95), 1),
+        'p99_ms': round(percentile(latencies, 99), 1),
+        'connections_opened': len(opened),
+        'peak_server_connections': peak,
+    }
+
+
+def summary_table(results):
+    header = (f"{'mode':<12} {'requests':>9} {'fails':>6} {'req/s':>8} {'p50':>6} {'p95':>6} {'p99':>6} "
+              f"{'opened':>7} {'peak':>5}")
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['mode']:<12} {r['requests']:>9} {r['failures']:>6} {r['rps']:>8.1f} {r['p50_ms']:>6.1f} "
+            f"{r['p95_ms']:>6.1f} {r['p99_ms']:>6.1f} {r['connections_opened']:>7} "
+            f"{r['peak_server_connections']:>5}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.dbbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mode', action='append', choices=list(MODES),
+                        help='Connection modes to compare (repeatable; default: all)')
+    parser.add_argument('--clients', type=int, default=200, help='Concurrent clients (threads)')
+    parser.add_argument('--duration', type=float, default=20.0, help='Seconds per mode')
+    parser.add_argument('--restart', action='store_true',
+                        help='Terminate all server connections halfway through each mode')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+    import django
+
+    django.setup()
+
+    results = []
+    for mode in args.mode or MODES:
+        print(f'{mode}: {args.clients} clients for {args.duration:.0f}s', flush=True)
+        results.append(bench(mode, args.clients, args.duration, args.restart))
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'clients': args.clients, 'duration': args.duration, 'restart': args.restart,
+                       'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+A local stand-in for the Gemini REST API, so chatbot load tests measure our
+server rather than Google's.
+
+Start it, then run the API server with GEMINI_API_ENDPOINT pointing at it::
+
+    python -m loadtest.fake_gemini --port 8089 --latency-ms 400
+    GEMINI_API_KEY=fake GEMINI_API_ENDPOINT=http://127.0.0.1:8089 python run.py
+
+Every ``POST .../models/<model>:generateContent`` returns a canned answer
+after ``--latency-ms``, roughly what a real model call costs.
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPLY = (
+    'Ethiopia offers rock-hewn churches in Lalibela, the castles of Gondar, '
+    'the Simien Mountains and the Danakil Depression. Travel between October '
+    'and March for the driest weather.'
+)
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        if not self.path.split('?')[0].endswith(':generateContent'):
+            self.send_error(404)
+            return
+        if self.latency:
+            time.sleep(self.latency)
+        body = json.dumps({
+            'candidates': [{
+                'content': {'role': 'model', 'parts': [{'text': REPLY}]},
+                'finishReason': 'STOP',
+                'index': 0,
+            }],
+            'usageMetadata': {'promptTokenCount': 64, 'candidatesTokenCount': 48, 'totalTokenCount': 112},
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start(host='127.0.0.1', port=8089, latency_ms=0):
+    """Serve in a daemon thread and return the server; call shutdown() to stop."""
+    handler = type('Handler', (FakeGeminiHandler,), {'latency': latency_ms / 1000.0})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fake Gemini generateContent endpoint')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency-ms', type=float, default=400)
+    args = parser.parse_args()
+    server = start(args.host, args.port, args.latency_ms)
+    print(f'Fake Gemini listening on http://{args.host}:{server.server_port}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark the JSON list filters (?category= on packages, core.db.lookups)
+with and without the jsonb_path_ops GIN index, at a realistic table size.
+
+    python -m loadtest.jsonbench --packages 500000
+
+Tops the packages table up to --packages rows (copies of an existing package
+with generated categories), ANALYZEs it, then times the category filter's
+two queries, the count and the first page of the list endpoint, for a
+common, a combined, a rare and an absent category:
+
+    gin      as migrated (packages.0006_package_category_gin)
+    no-index the index dropped
+
+Everything happens in one transaction that is rolled back: the added rows
+and the dropped index are gone afterwards. Run from the backend directory
+against a seeded database (generate_load_data). On SQLite, which has no such
+index, only the json_each fallback is timed.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+COMMON = ['hiking', 'history', 'culture', 'food', 'wildlife', 'photography', 'religion', 'music']
+RARE = 'birdwatching'
+RARE_SHARE = 0.001
+QUERIES = {
+    'common': 'hiking',
+    'combined': 'hiking,food',
+    'rare': RARE,
+    'absent': 'ice-climbing',
+}
+INDEX = 'package_category_gin'
+
+
+def top_up(total, batch_size, seed):
+    """Add copies of the first package until the table has total rows."""
+    from packages.models import Package
+
+    existing = Package.objects.count()
+    template = Package.objects.order_by('pk').first()
+    if template is None:
+        raise SystemExit('No packages to copy; run generate_load_data first.')
+    fields = {
+        field.attname: getattr(template, field.attname)
+        for field in Package._meta.concrete_fields if not field.primary_key
+    }
+    rng = random.Random(seed)
+    missing = max(0, total - existing)
+    for start in range(0, missing, batch_size):
+        batch = []
+        for i in range(start, min(start + batch_size, missing)):
+            category = rng.sample(COMMON, rng.randint(1, 3))
+            if rng.random() < RARE_SHARE:
+                category.append(RARE)
+            batch.append(Package(**dict(fields, slug=f'jsonbench-{seed}-{i}', category=category)))
+        Package.objects.bulk_create(batch)
+    return existing, missing
+
+
+def time_filter(category, repeat):
+    """Latencies (ms) of the list endpoint's two queries for ?category=."""
+    from packages.models import Package
+
+    from .runner import percentile
+
+    counts, pages = [], []
+    for _ in range(repeat):
+        queryset = Package.objects.filter(category__array_contains=category.split(','))
+        started = time.perf_counter()
+        rows = queryset.count()
+        counts.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        list(queryset.order_by('-created_at')[:20])
+        pages.append((time.perf_counter() - started) * 1000)
+    counts.sort()
+    pages.sort()
+    return {
+        'rows': rows,
+        'count_p50_ms': round(percentile(counts, 50), 2),
+        'count_p95_ms': round(percentile(counts, 95), 2),
+        'page_p50_ms': round(percentile(pages, 50), 2),
+        'page_p95_ms': round(percentile(pages, 95), 2),
+    }
+
+
+def bench(total, repeat, batch_size, seed):
+    from django.db import connection, transaction
+
+    modes = ['gin', 'no-index'] if connection.vendor == 'postgresql' else ['json_each']
+    results = []
+    with transaction.atomic():
+        started = time.perf_counter()
+        existing, added = top_up(total, batch_size, seed)
+        print(f'{existing} packages, added {added} in {time.perf_counter() - started:.0f}s', flush=True)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE packages_package' if connection.vendor == 'postgresql' else 'ANALYZE')
+        for mode in modes:
+            if mode == 'no-index':
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DROP INDEX {connection.ops.quote_name(INDEX)}')
+            for name, category in QUERIES.items():
+                print(f'{mode}: {name} ({category})', flush=True)
+                results.append({'mode': mode, 'query': name, **time_filter(category, repeat)})
+        transaction.set_rollback(True)
+    return results
+
+
+def summary_table(results):
+    header = (f"{'mode':<10} {'query':<9} {'rows':>7} {'count p50':>10} {'p95':>8} "
+              f"{'page p50':>9} {'p95':>8}")
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['mode']:<10} {r['query']:<9} {r['rows']:>7} {r['count_p50_ms']:>10.2f} "
+            f"{r['count_p95_ms']:>8.2f} {r['page_p50_ms']:>9.2f} {r['page_p95_ms']:>8.2f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.jsonbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--packages', type=int, default=500000, help='Table size to measure at')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs of each query')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk_create call')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the added categories')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+    import django
+
+    django.setup()
+
+    results = bench(args.packages, args.repeat, args.batch_size, args.seed)
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'packages': args.packages, 'repeat': args.repeat, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
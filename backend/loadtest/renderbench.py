@@ -0,0 +1,125 @@
+"""
+Benchmark JSON rendering: DRF's JSONRenderer against core.renderers'
+ORJSONRenderer, and a whole-list response against the streaming JSON array.
+
+    python -m loadtest.renderbench --items 20000
+
+Serializes the seeded packages with PackageListSerializer (Decimals, times,
+datetimes, nested organizer, JSON lists) and repeats them to --items items.
+For each mode it reports the render time and the peak memory allocated
+while producing the body (tracemalloc):
+
+    drf      JSONRenderer().render(list of items)
+    orjson   ORJSONRenderer().render(list of items)
+    stream   iter_json_array() over items made one at a time, chunks discarded
+
+drf and orjson count the list of items too, as a view holds it; stream never
+has more than one item and one chunk. Run from the backend directory against
+a seeded database (generate_load_data).
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+
+def base_items(rows):
+    from packages.models import Package
+    from packages.serializers import PackageListSerializer
+
+    queryset = Package.objects.select_related('organizer').order_by('pk')[:rows]
+    items = PackageListSerializer(queryset, many=True).data
+    if not items:
+        raise SystemExit('No packages to serialize; run generate_load_data first.')
+    return items
+
+
+def measure(produce, repeat):
+    """(median seconds, peak bytes, body size) of produce() over repeat runs."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = produce()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    tracemalloc.start()
+    produce()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return timings[len(timings) // 2], peak, size
+
+
+def bench(items, rows, repeat):
+    from rest_framework.renderers import JSONRenderer
+
+    from core.renderers import ORJSONRenderer, iter_json_array
+
+    base = base_items(rows)
+
+    def copies():
+        # Fresh dicts, as a serializer would make them.
+        return (dict(item) for item in itertools.islice(itertools.cycle(base), items))
+
+    def whole(renderer):
+        def produce():
+            return len(renderer.render(list(copies())))
+        return produce
+
+    def stream():
+        return sum(len(chunk) for chunk in iter_json_array(copies()))
+
+    results = []
+    for mode, produce in [
+        ('drf', whole(JSONRenderer())), ('orjson', whole(ORJSONRenderer())), ('stream', stream),
+    ]:
+        seconds, peak, size = measure(produce, repeat)
+        results.append({
+            'mode': mode,
+            'items': items,
+            'render_ms': round(seconds * 1000, 1),
+            'us_per_item': round(seconds * 1e6 / items, 2),
+            'peak_mb': round(peak / 2 ** 20, 1),
+            'body_mb': round(size / 2 ** 20, 1),
+        })
+    return results
+
+
+def summary_table(results):
+    header = f"{'mode':<8} {'items':>7} {'render ms':>10} {'µs/item':>8} {'peak MB':>8} {'body MB':>8}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['mode']:<8} {r['items']:>7} {r['render_ms']:>10.1f} {r['us_per_item']:>8.2f} "
+            f"{r['peak_mb']:>8.1f} {r['body_mb']:>8.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.renderbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=20000, help='Items in the rendered array')
+    parser.add_argument('--rows', type=int, default=200, help='Distinct packages to repeat')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs of each mode')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+    import django
+
+    django.setup()
+
+    results = bench(args.items, args.rows, args.repeat)
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'items': args.items, 'repeat': args.repeat, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
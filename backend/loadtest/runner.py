@@ -0,0 +1,178 @@
+import random
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Stats:
+    """Thread-safe latency and failure bookkeeping, keyed by (method, name)."""
+
+    PERCENTILES = (50, 90, 95, 99)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.failures = defaultdict(int)
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, method, name, elapsed_ms, ok):
+        with self.lock:
+            self.latencies[(method, name)].append(elapsed_ms)
+            if not ok:
+                self.failures[(method, name)] += 1
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def duration(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def rows(self):
+        """One dict per endpoint plus an 'Aggregated' row, sorted by name."""
+        with self.lock:
+            items = {key: sorted(values) for key, values in self.latencies.items()}
+            failures = dict(self.failures)
+        duration = self.duration or 1.0
+
+        def row(method, name, values, failed):
+            data = {
+                'method': method,
+                'name': name,
+                'requests': len(values),
+                'failures': failed,
+                'rps': len(values) / duration,
+                'mean_ms': sum(values) / len(values) if values else 0.0,
+                'max_ms': values[-1] if values else 0.0,
+            }
+            for pct in self.PERCENTILES:
+                data[f'p{pct}_ms'] = percentile(values, pct)
+            return data
+
+        rows = [
+            row(method, name, values, failures.get((method, name), 0))
+            for (method, name), values in sorted(items.items(), key=lambda kv: (kv[0][1], kv[0][0]))
+        ]
+        everything = sorted(v for values in items.values() for v in values)
+        rows.append(row('', 'Aggregated', everything, sum(failures.values())))
+        return rows
+
+
+class HttpSession:
+    """
+    A requests.Session bound to a base URL that records every call in Stats.
+
+    ``name`` groups URLs that differ only by ids (e.g. ``/api/events/{id}/``);
+    ``expect`` lists status codes that count as success besides 2xx/3xx.
+    """
+
+    def __init__(self, base_url, stats, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.stats = stats
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def request(self, method, path, name=None, expect=(), **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, self.base_url + path, **kwargs)
+        except requests.RequestException:
+            self.stats.record(method, name or path, (time.perf_counter() - start) * 1000, False)
+            return None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        ok = response.status_code < 400 or response.status_code in expect
+        self.stats.record(method, name or path.split('?')[0], elapsed_ms, ok)
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request('POST', path, **kwargs)
+
+
+def task(weight=1):
+    """Mark a Scenario method as a task picked with the given relative weight."""
+    def decorator(func):
+        func.task_weight = weight
+        return func
+    return decorator
+
+
+class Scenario:
+    """
+    A virtual user. Subclasses define ``@task`` methods; each user runs
+    ``on_start`` once, then repeatedly picks a weighted task and sleeps a
+    random ``wait_time`` between iterations until the test stops.
+    """
+
+    weight = 1
+    wait_time = (0.5, 2.0)
+
+    def __init__(self, client, rng, options):
+        self.client = client
+        self.rng = rng
+        self.options = options
+        self.tasks = [
+            getattr(self, name) for name in dir(type(self))
+            if getattr(getattr(type(self), name), 'task_weight', None)
+        ]
+        self.task_weights = [t.task_weight for t in self.tasks]
+
+    def on_start(self):
+        pass
+
+    def run(self, stop_event):
+        self.on_start()
+        while not stop_event.is_set():
+            self.rng.choices(self.tasks, weights=self.task_weights)[0]()
+            stop_event.wait(self.rng.uniform(*self.wait_time))
+
+
+def run(scenarios, host, users, duration, spawn_rate=10.0, seed=None, options=None):
+    """
+    Spawn ``users`` virtual users, picked from ``scenarios`` by weight, at
+    ``spawn_rate`` users per second, run for ``duration`` seconds and return
+    the collected Stats.
+    """
+    stats = Stats()
+    stop_event = threading.Event()
+    rng = random.Random(seed)
+    weights = [scenario.weight for scenario in scenarios]
+    threads = []
+
+    def worker(scenario_class, user_seed):
+        scenario = scenario_class(HttpSession(host, stats), random.Random(user_seed), options or {})
+        try:
+            scenario.run(stop_event)
+        except Exception as e:  # keep the other users going
+            stats.record('ERROR', f'{scenario_class.__name__}: {type(e).__name__}', 0.0, False)
+
+    deadline = time.perf_counter() + duration
+    for _ in range(users):
+        if time.perf_counter() >= deadline:
+            break
+        scenario_class = rng.choices(scenarios, weights=weights)[0]
+        thread = threading.Thread(target=worker, args=(scenario_class, rng.getrandbits(32)), daemon=True)
+        thread.start()
+        threads.append(thread)
+        time.sleep(1.0 / spawn_rate)
+
+    stop_event.wait(max(0.0, deadline - time.perf_counter()))
+    stop_event.set()
+    for thread in threads:
+        thread.join(timeout=35)
+    stats.stop()
+    return stats
@@ -0,0 +1,197 @@
+"""
+Load-test scenarios mirroring the main user journeys of the frontend.
+
+Authenticated scenarios log in as accounts created by
+``manage.py generate_load_data`` (``lt<seed>_<n>@loadtest.example.com`` with
+password ``loadtest123``), so seed the database before running them.
+"""
+import datetime
+import uuid
+
+from .runner import Scenario, task
+
+DESTINATION_CATEGORIES = ['historical', 'natural', 'cultural', 'religious', 'adventure']
+REGIONS = ['amhara', 'oromia', 'addis_ababa', 'sidama', 'harari']
+SEARCH_TERMS = ['lake', 'church', 'coffee', 'market', 'trek', 'gondar', 'lalibela']
+CHAT_PROMPTS = [
+    'What should I see in Lalibela?',
+    'Is October a good month to visit the Simien Mountains?',
+    'How do I get from Addis Ababa to Bahir Dar?',
+    'Recommend a three day itinerary around Gondar.',
+    'What is the coffee ceremony?',
+]
+
+
+def results(response):
+    """Items of a list response, paginated or not; [] on failure."""
+    if response is None or response.status_code != 200:
+        return []
+    data = response.json()
+    if isinstance(data, dict):
+        return data.get('results', [])
+    return data
+
+
+class BrowseDestinations(Scenario):
+    weight = 4
+
+    @task(3)
+    def list_destinations(self):
+        self.client.get(
+            f'/api/destinations/destinations/?page={self.rng.randint(1, 5)}',
+            name='/api/destinations/destinations/'
+        )
+
+    @task(2)
+    def filter_destinations(self):
+        self.client.get(
+            f'/api/destinations/destinations/?category={self.rng.choice(DESTINATION_CATEGORIES)}'
+            f'&region={self.rng.choice(REGIONS)}&ordering=-rating',
+            name='/api/destinations/destinations/?category&region'
+        )
+
+    @task(3)
+    def view_destination(self):
+        items = results(self.client.get('/api/destinations/destinations/', name='/api/destinations/destinations/'))
+        if items:
+            pk = self.rng.choice(items)['id']
+            self.client.get(f'/api/destinations/destinations/{pk}/', name='/api/destinations/destinations/{id}/')
+            self.client.get(
+                f'/api/destinations/destinations/{pk}/reviews/',
+                name='/api/destinations/destinations/{id}/reviews/'
+            )
+
+
+class SearchPackages(Scenario):
+    weight = 3
+
+    @task(3)
+    def search(self):
+        self.client.get(
+            f'/api/packages/packages/?search={self.rng.choice(SEARCH_TERMS)}',
+            name='/api/packages/packages/?search'
+        )
+
+    @task(2)
+    def filter_by_price(self):
+        low = self.rng.randrange(0, 20000, 1000)
+        self.client.get(
+            f'/api/packages/packages/?min_price={low}&max_price={low + 10000}&ordering=price',
+            name='/api/packages/packages/?min_price&max_price'
+        )
+
+    @task(1)
+    def facets(self):
+        self.client.get('/api/packages/packages/categories/')
+        self.client.get('/api/packages/packages/regions/')
+
+    @task(2)
+    def view_package(self):
+        items = results(self.client.get('/api/packages/packages/', name='/api/packages/packages/'))
+        if items:
+            pk = self.rng.choice(items)['id']
+            self.client.get(f'/api/packages/packages/{pk}/', name='/api/packages/packages/{id}/')
+
+
+class EventCalendar(Scenario):
+    weight = 2
+
+    @task(3)
+    def calendar(self):
+        month = datetime.date.today() + datetime.timedelta(days=30 * self.rng.randint(-1, 3))
+        self.client.get(
+            f'/api/events/events/calendar/?month={month.month}&year={month.year}',
+            name='/api/events/events/calendar/'
+        )
+
+    @task(2)
+    def upcoming(self):
+        self.client.get('/api/events/events/upcoming/')
+
+    @task(1)
+    def view_event(self):
+        items = results(self.client.get('/api/events/events/', name='/api/events/events/'))
+        if items:
+            pk = self.rng.choice(items)['id']
+            self.client.get(f'/api/events/events/{pk}/', name='/api/events/events/{id}/')
+
+
+class AuthenticatedScenario(Scenario):
+    """Logs in as a random generated account before running its tasks."""
+
+    def on_start(self):
+        n = self.rng.randrange(self.options.get('accounts', 1000))
+        seed = self.options.get('accounts_seed', 42)
+        response = self.client.post('/api/users/login/', json={
+            'email': f'lt{seed}_{n}@loadtest.example.com',
+            'password': 'loadtest123',
+        })
+        if response is not None and response.status_code == 200:
+            token = response.json()['data']['access_token']
+            self.client.session.headers['Authorization'] = f'Bearer {token}'
+
+
+class RegisterForEvent(AuthenticatedScenario):
+    weight = 1
+
+    @task(1)
+    def register(self):
+        items = results(self.client.get('/api/events/events/upcoming/'))
+        if items:
+            pk = self.rng.choice(items)['id']
+            # 400 means already registered or full, which is a valid outcome.
+            self.client.post(
+                f'/api/events/events/{pk}/register/',
+                name='/api/events/events/{id}/register/', expect=(400,)
+            )
+
+
+class BookAndPay(AuthenticatedScenario):
+    weight = 1
+
+    @task(1)
+    def book_package(self):
+        items = results(self.client.get('/api/packages/packages/', name='/api/packages/packages/'))
+        if not items:
+            return
+        package = self.rng.choice(items)
+        people = self.rng.randint(1, 4)
+        response = self.client.post('/api/booking/bookings/', json={
+            'package': package['id'],
+            'number_of_people': people,
+        })
+        if response is None or response.status_code != 201:
+            return
+        self.client.post('/api/booking/payments/', json={
+            'booking': response.json()['id'],
+            'amount': str(float(package['price']) * people),
+            'payment_method': self.rng.choice(['chapa', 'stripe']),
+            'status': 'completed',
+            'transaction_id': f'lt-{uuid.UUID(int=self.rng.getrandbits(128))}',
+        })
+        self.client.get('/api/booking/bookings/')
+
+
+class ChatWithBot(AuthenticatedScenario):
+    weight = 1
+    wait_time = (2.0, 5.0)
+
+    session_id = None
+
+    @task(1)
+    def chat(self):
+        payload = {'message': self.rng.choice(CHAT_PROMPTS)}
+        if self.session_id:
+            payload['session_id'] = self.session_id
+        response = self.client.post('/api/chatbot/message/message/', json=payload)
+        if response is not None and response.status_code == 200:
+            self.session_id = response.json()['session_id']
+
+
+SCENARIOS = {
+    scenario.__name__: scenario
+    for scenario in (
+        BrowseDestinations, SearchPackages, EventCalendar,
+        RegisterForEvent, BookAndPay, ChatWithBot,
+    )
+}
@@ -0,0 +1,111 @@
+"""
+Benchmark the list endpoints' serialization: the DRF serializers over model
+instances against core.listing's field maps over values_list() rows.
+
+    python -m loadtest.serializerbench --rows 500
+
+For each list serializer, times reading --rows rows and turning them into
+rendered JSON both ways (queries included: PackageListSerializer's nested
+organizer costs a query per row the DRF way), checks that the two outputs
+are the same bytes and reports microseconds per item. Run from the backend
+directory against a seeded database (generate_load_data).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+def serializers():
+    from business.serializers import BusinessListSerializer
+    from destinations.serializers import DestinationSerializer
+    from events.serializers import EventListSerializer
+    from packages.serializers import PackageListSerializer
+
+    return [DestinationSerializer, PackageListSerializer, EventListSerializer, BusinessListSerializer]
+
+
+def time_per_item(render, rows, repeat):
+    """Median microseconds per item of render() over repeat runs, and its output."""
+    from .runner import percentile
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = render()
+        timings.append((time.perf_counter() - started) * 1e6 / max(rows, 1))
+    timings.sort()
+    return percentile(timings, 50), output
+
+
+def bench(rows, repeat):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.renderers import JSONRenderer
+
+    from core.listing import field_map
+
+    renderer = JSONRenderer()
+    results = []
+    for serializer_class in serializers():
+        queryset = serializer_class.Meta.model.objects.order_by('pk')[:rows]
+        fields = field_map(serializer_class)
+        count = queryset.count()
+        with CaptureQueriesContext(connection) as drf_queries:
+            drf_us, drf_output = time_per_item(
+                lambda: renderer.render(serializer_class(queryset.all(), many=True).data), count, repeat,
+            )
+        with CaptureQueriesContext(connection) as values_queries:
+            values_us, values_output = time_per_item(
+                lambda: renderer.render(fields.data(fields.rows(queryset))), count, repeat,
+            )
+        results.append({
+            'serializer': serializer_class.__name__,
+            'rows': count,
+            'drf_us_per_item': round(drf_us, 1),
+            'values_us_per_item': round(values_us, 1),
+            'speedup': round(drf_us / values_us, 1) if values_us else None,
+            'drf_queries': round(len(drf_queries) / repeat),
+            'values_queries': round(len(values_queries) / repeat),
+            'identical': drf_output == values_output,
+        })
+    return results
+
+
+def summary_table(results):
+    header = (f"{'serializer':<24} {'rows':>5} {'drf µs':>8} {'values µs':>10} {'speedup':>8} "
+              f"{'queries':>9} {'identical':>9}")
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['serializer']:<24} {r['rows']:>5} {r['drf_us_per_item']:>8.1f} {r['values_us_per_item']:>10.1f} "
+            f"{r['speedup']:>7.1f}x {r['drf_queries']:>4}/{r['values_queries']:<4} {str(r['identical']):>9}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.serializerbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500, help='Rows serialized per run')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs of each serializer')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ethiotravel.settings')
+    import django
+
+    django.setup()
+
+    results = bench(args.rows, args.repeat)
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'rows': args.rows, 'repeat': args.repeat, 'results': results}, f, indent=2)
+    return 0 if all(r['identical'] for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
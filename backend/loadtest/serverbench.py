@@ -0,0 +1,220 @@
+"""
+Compare server set-ups: start each one, drive the anonymous browsing scenarios
+against it, and report req/s, latency and memory per worker process.
+
+    python -m loadtest.serverbench --workers 4 --users 16 --duration 60
+
+With --chat the users talk to the chatbot instead, answered by the fake Gemini
+endpoint after --gemini-latency-ms; this is where the ASGI server (uvicorn,
+with the async views) and the WSGI servers differ most:
+
+    python -m loadtest.serverbench --chat --server gunicorn --server uvicorn --workers 1 --users 64
+
+Run from the backend directory against a seeded database (generate_load_data).
+Memory comes from /proc, so this only runs on Linux. RSS counts pages shared
+with the gunicorn master in full; PSS splits shared pages between the
+processes sharing them, so summed PSS is the real footprint of the server.
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+from . import runner
+from .cli import format_table
+from . import fake_gemini
+from .scenarios import BrowseDestinations, ChatWithBot, EventCalendar, SearchPackages
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Closed loop: users send their next request as soon as a response arrives,
+# so req/s measures the server rather than the scenarios' think time.
+SCENARIOS = [
+    type(scenario.__name__, (scenario,), {'wait_time': (0, 0)})
+    for scenario in (BrowseDestinations, SearchPackages, EventCalendar)
+]
+CHAT_SCENARIOS = [type('ChatWithBot', (ChatWithBot,), {'wait_time': (0, 0)})]
+
+# How run.py served the app before the preloading entrypoints.
+PLAIN_WAITRESS = (
+    'import os; from waitress import serve; from ethiotravel.wsgi import application; '
+    "serve(application, host='127.0.0.1', port=int(os.environ['PORT']), threads=4)"
+)
+
+SERVERS = {
+    'waitress-plain': lambda workers, port: [sys.executable, '-c', PLAIN_WAITRESS],
+    'run.py': lambda workers, port: [sys.executable, 'run.py'],
+    # gunicorn.conf.py settings without preloading, warm-up or gc.freeze().
+    'gunicorn-plain': lambda workers, port: [
+        sys.executable, '-m', 'gunicorn', '--config', os.devnull, '--workers', str(workers),
+        '--worker-class', 'gthread', '--threads', '4', 'ethiotravel.wsgi',
+    ],
+    'gunicorn': lambda workers, port: [sys.executable, '-m', 'gunicorn', 'ethiotravel.wsgi'],
+    'uvicorn': lambda workers, port: [
+        sys.executable, '-m', 'uvicorn', 'ethiotravel.asgi:application', '--port', str(port),
+        '--workers', str(workers), '--no-access-log',
+    ],
+}
+
+
+def _children(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; fields after it are fixed.
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            children.append(int(entry))
+    return children
+
+
+def _memory_kb(pid):
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('Rss', 'Pss'):
+                values[key.lower()] = int(rest.split()[0])
+    return values
+
+
+def memory(pid):
+    """Per-process RSS/PSS of a server: its workers, or the process itself."""
+    workers = _children(pid)
+    processes = workers or [pid]
+    per_process = [_memory_kb(p) for p in processes]
+    total_pss = sum(m['pss'] for m in per_process) + (_memory_kb(pid)['pss'] if workers else 0)
+    return {
+        'processes': len(processes),
+        'rss_mb_per_worker': round(sum(m['rss'] for m in per_process) / len(per_process) / 1024, 1),
+        'pss_mb_per_worker': round(sum(m['pss'] for m in per_process) / len(per_process) / 1024, 1),
+        'pss_mb_total': round(total_pss / 1024, 1),
+    }
+
+
+def wait_until_up(base_url, process, timeout):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'server exited with status {process.returncode}')
+        try:
+            if requests.get(base_url + '/', headers={'Accept': 'application/json'}, timeout=2).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'server not up after {timeout}s')
+
+
+def bench(name, args, port, env=None):
+    env = dict(os.environ, **(env or {}), PORT=str(port), WEB_CONCURRENCY=str(args.workers))
+    base_url = f'http://127.0.0.1:{port}'
+    process = subprocess.Popen(
+        SERVERS[name](args.workers, port), cwd=BACKEND_DIR, env=env, start_new_session=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        started = time.perf_counter()
+        wait_until_up(base_url, process, timeout=120)
+        startup_s = time.perf_counter() - started
+        time.sleep(1)  # let the remaining workers finish booting
+        idle = memory(process.pid)
+        stats = runner.run(
+            CHAT_SCENARIOS if args.chat else SCENARIOS, base_url, args.users, args.duration,
+            spawn_rate=args.users, seed=args.seed,
+            options={'accounts': args.accounts, 'accounts_seed': args.accounts_seed},
+        )
+        loaded = memory(process.pid)
+    finally:
+        if process.poll() is None:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=30)
+    total = stats.rows()[-1]
+    return {
+        'server': name,
+        'startup_s': round(startup_s, 2),
+        'idle': idle,
+        'loaded': loaded,
+        'requests': total['requests'],
+        'failures': total['failures'],
+        'rps': total['rps'],
+        'p50_ms': total['p50_ms'],
+        'p95_ms': total['p95_ms'],
+        'p99_ms': total['p99_ms'],
+        'endpoints': stats.rows(),
+    }
+
+
+def summary_table(results):
+    header = (f"{'server':<16} {'procs':>5} {'start s':>7} {'RSS/w MB':>9} {'PSS/w MB':>9} "
+              f"{'PSS tot':>8} {'req/s':>8} {'p50':>6} {'p95':>6} {'p99':>6} {'fails':>6}")
+    lines = [header, '-' * len(header)]
+    for r in results:
+        m = r['loaded']
+        lines.append(
+            f"{r['server']:<16} {m['processes']:>5} {r['startup_s']:>7.1f} {m['rss_mb_per_worker']:>9.1f} "
+            f"{m['pss_mb_per_worker']:>9.1f} {m['pss_mb_total']:>8.1f} {r['rps']:>8.1f} "
+            f"{r['p50_ms']:>6.0f} {r['p95_ms']:>6.0f} {r['p99_ms']:>6.0f} {r['failures']:>6}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest.serverbench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', action='append', choices=list(SERVERS),
+                        help='Server set-ups to compare (repeatable; default: all)')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn worker processes')
+    parser.add_argument('--users', type=int, default=16, help='Concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds of load per server')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--chat', action='store_true',
+                        help='Drive the chatbot (against a fake Gemini) instead of browsing')
+    parser.add_argument('--gemini-latency-ms', type=float, default=400,
+                        help='Fake Gemini response time with --chat')
+    parser.add_argument('--accounts', type=int, default=1000,
+                        help='Accounts created by generate_load_data, for --chat logins')
+    parser.add_argument('--accounts-seed', type=int, default=42,
+                        help='Seed generate_load_data was run with')
+    parser.add_argument('--endpoints', action='store_true', help='Also print per-endpoint tables')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    env, gemini = {}, None
+    if args.chat:
+        gemini = fake_gemini.start(port=0, latency_ms=args.gemini_latency_ms)
+        env = {'GEMINI_API_KEY': 'fake', 'GEMINI_API_ENDPOINT': f'http://127.0.0.1:{gemini.server_port}'}
+
+    results = []
+    try:
+        for name in args.server or SERVERS:
+            print(f'{name}: {args.users} users for {args.duration:.0f}s', flush=True)
+            results.append(bench(name, args, args.port, env))
+            if args.endpoints:
+                print(format_table(results[-1]['endpoints']))
+    finally:
+        if gemini is not None:
+            gemini.shutdown()
+    print(summary_table(results))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'workers': args.workers, 'users': args.users, 'duration': args.duration,
+                       'chat': args.chat, 'servers': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncRequestFactory, SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from chatbot import async_views
+from chatbot.models import Message
+from users.models import User
+
+from . import fake_gemini
+from .runner import Stats, percentile
+
+
+class StatsTests(SimpleTestCase):
+    def test_percentile_uses_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_rows_group_by_endpoint_and_aggregate(self):
+        stats = Stats()
+        stats.record('GET', '/api/events/', 10, True)
+        stats.record('GET', '/api/events/', 30, False)
+        stats.record('POST', '/api/booking/bookings/', 20, True)
+        stats.stop()
+        rows = {(r['method'], r['name']): r for r in stats.rows()}
+        self.assertEqual(rows[('GET', '/api/events/')]['failures'], 1)
+        self.assertEqual(rows[('', 'Aggregated')]['requests'], 3)
+        self.assertEqual(rows[('', 'Aggregated')]['p50_ms'], 20)
+
+
+class FakeGeminiTests(APITestCase):
+    def setUp(self):
+        self.server = fake_gemini.start(port=0)
+        self.addCleanup(self.server.shutdown)
+        gemini = override_settings(
+            GEMINI_API_KEY='fake', GEMINI_API_ENDPOINT=f'http://127.0.0.1:{self.server.server_port}'
+        )
+        gemini.enable()
+        self.addCleanup(gemini.disable)
+
+    def test_chatbot_answers_from_fake_gemini(self):
+        user = User.objects.create_user(email='chat@example.com', username='chat', password='secret123')
+        self.client.force_authenticate(user)
+        response = self.client.post('/api/chatbot/message/message/', {'message': 'Hello'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['response']['content'], fake_gemini.REPLY)
+        self.assertEqual(Message.objects.filter(sender='bot').count(), 1)
+
+    async def test_async_chatbot_answers_from_fake_gemini(self):
+        user = await sync_to_async(User.objects.create_user)(
+            email='chat@example.com', username='chat', password='secret123'
+        )
+        token = await sync_to_async(lambda: str(RefreshToken.for_user(user).access_token))()
+        request = AsyncRequestFactory().post(
+            '/api/chatbot/message/', {'message': 'Hello'},
+            content_type='application/json', authorization=f'Bearer {token}',
+        )
+        response = await async_views.message(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['response']['content'], fake_gemini.REPLY)
+        self.assertEqual(await sync_to_async(Message.objects.filter(sender='bot').count)(), 1)
@@ -5,4 +5,4 @@ class PackagesConfig(AppConfig):
     name = "packages"
     
     def ready(self):
-        import packages.signals
\ No newline at end of file
+        import packages.signals
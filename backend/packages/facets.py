@@ -0,0 +1,10 @@
+from core.facets import Facets, FieldFacet, ListFacet, RangeFacet
+
+PACKAGE_FACETS = Facets(
+    'packages.Package',
+    ListFacet('category'),
+    FieldFacet('region'),
+    FieldFacet('location', name='city'),
+    FieldFacet('difficulty'),
+    RangeFacet('price', [5000, 10000, 20000, 35000]),
+)
@@ -5,7 +5,7 @@ from .models import Package
 class JSONFieldFilter(CharFilter):
     def filter(self, qs, value):
         if value not in (None, ''):
-            return qs.filter(**{f"{self.field_name}__contains": value})
+            return qs.filter(**{f"{self.field_name}__array_contains": value})
         return qs
 
 class PackageFilter(filters.FilterSet):
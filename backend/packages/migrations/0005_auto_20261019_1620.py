@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-19 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('packages', '0004_alter_package_coordinates'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='package',
+            name='packages_pa_status_1e0453_idx',
+        ),
+        migrations.AddIndex(
+            model_name='departure',
+            index=models.Index(fields=['package', 'start_date'], name='departure_package_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='package',
+            index=models.Index(fields=['status', 'featured'], name='package_status_featured_idx'),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from core.db.operations import AddJSONPathIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('packages', '0005_auto_20261019_1620'),
+    ]
+
+    operations = [
+        AddJSONPathIndex(model_name='package', field='category', name='package_category_gin'),
+    ]
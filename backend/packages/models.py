@@ -1,5 +1,5 @@
 from django.db import models
-from django.utils.text import slugify
+from core import slugs
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -44,6 +44,7 @@ class Package(models.Model):
     duration_in_days = models.IntegerField()
     image = models.CharField(max_length=200, blank=True)
     gallery_images = models.JSONField(default=default_json_list)
+    # GIN-indexed on PostgreSQL; filter with category__array_contains.
     category = models.JSONField(default=default_json_list)
     included = models.JSONField(default=default_json_list)
     not_included = models.JSONField(default=default_json_list)
@@ -66,15 +67,7 @@ class Package(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Package.objects.filter(slug=slug).exclude(id=self.id).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+        slugs.save_with_slug(self, self.title, super().save, *args, **kwargs)
 
     def __str__(self):
         return self.title
@@ -84,7 +77,8 @@ class Package(models.Model):
             models.Index(fields=['slug']),
             models.Index(fields=['region']),
             models.Index(fields=['featured']),
-            models.Index(fields=['status']),
+            # Active packages, optionally only the featured ones.
+            models.Index(fields=['status', 'featured'], name='package_status_featured_idx'),
         ]
 
 
@@ -183,6 +177,8 @@ class Departure(models.Model):
     class Meta:
         ordering = ['start_date']
         indexes = [
+            # A package's departures, in date order.
+            models.Index(fields=['package', 'start_date'], name='departure_package_start_idx'),
             models.Index(fields=['start_date']),
             models.Index(fields=['is_guaranteed']),
         ]
\ No newline at end of file
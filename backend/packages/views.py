@@ -11,16 +11,28 @@ from .serializers import (
     PackageSerializer, PackageListSerializer, PackageDetailSerializer,
     PackageReviewSerializer, SavedPackageSerializer, DepartureSerializer
 )
+from core.facets import response_schema
+from core.batch import BatchRetrieveMixin
+from core.conditional import ConditionalGetMixin
+from core.listing import SparseFieldsMixin, ValuesListMixin
+from .facets import PACKAGE_FACETS
 from .filters import PackageFilter
 from .permissions import IsPackageOwnerOrReadOnly
 
-class PackageViewSet(viewsets.ModelViewSet):
+class PackageViewSet(BatchRetrieveMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Package.objects.all()
     serializer_class = PackageSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = PackageFilter
     search_fields = ['title', 'description', 'location']
     ordering_fields = ['price', 'created_at', 'updated_at']
+    # Models nested in the responses, for the ETags.
+    conditional_dependencies = ['packages.PackageReview', 'packages.Departure', 'users.User']
+    # ?view=card
+    card_fields = [
+        'id', 'title', 'slug', 'short_description', 'category', 'location', 'region', 'price',
+        'discounted_price', 'duration', 'image', 'rating', 'featured',
+    ]
 
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy', 'toggle_status']:
@@ -32,14 +44,14 @@ class PackageViewSet(viewsets.ModelViewSet):
         return []
 
     def get_serializer_class(self):
-        if self.action == 'list':
+        if self.action in ('list', 'batch'):
             return PackageListSerializer
         elif self.action == 'retrieve':
             return PackageDetailSerializer
         return PackageSerializer
 
     def get_queryset(self):
-        if self.action == 'list':
+        if self.action in ('list', 'facets'):
             return self.queryset.filter(status='active')
         if self.action == 'my_packages':
             return self.queryset.filter(organizer=self.request.user)
@@ -261,15 +273,8 @@ class PackageViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'])
     def categories(self, request):
-        categories = Package.objects.values_list('category', flat=True).distinct()
-        # Flatten the list in case category is stored as a list
-        flattened_categories = []
-        for cat_list in categories:
-            if isinstance(cat_list, list):
-                flattened_categories.extend(cat_list)
-            else:
-                flattened_categories.append(cat_list)
-        return Response(list(set(flattened_categories)))
+        counts = PACKAGE_FACETS.for_request(Package.objects.all(), request, only=['category'])
+        return Response([value['value'] for value in counts['facets']['category']])
 
     @swagger_auto_schema(
         tags=['Tour Packages'],
@@ -280,10 +285,23 @@ class PackageViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'])
     def regions(self, request):
-        regions = Package.objects.values_list('region', flat=True).distinct()
-        return Response(list(set(regions)))
+        counts = PACKAGE_FACETS.for_request(Package.objects.all(), request, only=['region'])
+        return Response([value['value'] for value in counts['facets']['region']])
 
-class PackageReviewViewSet(viewsets.ModelViewSet):
+    @swagger_auto_schema(
+        tags=['Tour Packages'],
+        operation_description=(
+            "Counts of active packages per category, region, city, difficulty and price range, "
+            "for the same filters as the list"
+        ),
+        responses={200: response_schema(PACKAGE_FACETS)}
+    )
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(PACKAGE_FACETS.for_request(queryset, request))
+
+class PackageReviewViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = PackageReviewSerializer
     permission_classes = [IsAuthenticated]
 
@@ -339,7 +357,7 @@ class PackageReviewViewSet(viewsets.ModelViewSet):
         review.save()
         return Response({'message': 'Review reported successfully'})
 
-class SavedPackageViewSet(viewsets.ModelViewSet):
+class SavedPackageViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = SavedPackage.objects.all()
     serializer_class = SavedPackageSerializer
     permission_classes = [IsAuthenticated]
@@ -379,7 +397,7 @@ class SavedPackageViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-class DepartureViewSet(viewsets.ModelViewSet):
+class DepartureViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = DepartureSerializer
     permission_classes = []
 
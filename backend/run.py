@@ -1,6 +1,21 @@
+"""
+Single-process server (waitress), e.g. for Windows hosts where gunicorn does
+not run. On Linux prefer ``gunicorn ethiotravel.wsgi`` (see gunicorn.conf.py).
+
+Environment: PORT, WAITRESS_THREADS (default 4 per CPU, at least 8).
+"""
+import gc
+import os
+
 from waitress import serve
 from ethiotravel.wsgi import application
+from core.warmup import warm_up
 
 if __name__ == '__main__':
-    print("Starting server on http://0.0.0.0:8000")
-    serve(application, host='0.0.0.0', port=8000) 
\ No newline at end of file
+    warm_up()
+    # Long-lived start-up objects: keep the collector from rescanning them.
+    gc.freeze()
+    port = int(os.getenv('PORT', '8000'))
+    threads = int(os.getenv('WAITRESS_THREADS', max(8, (os.cpu_count() or 1) * 4)))
+    print(f"Starting server on http://0.0.0.0:{port} ({threads} threads)")
+    serve(application, host='0.0.0.0', port=port, threads=threads)
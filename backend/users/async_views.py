@@ -0,0 +1,83 @@
+"""
+Async versions of the endpoints that send email, routed in when ASYNC_VIEWS
+is on. The SMTP exchange waits on core.asyncviews' I/O threads instead of a
+request thread.
+"""
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework import status
+
+from core.asyncviews import async_action, respond, run_blocking
+from .models import User
+from .views import UserViewSet, reset_password_email, verification_email
+
+logger = logging.getLogger(__name__)
+
+
+async def _send(build, user, sent, failed):
+    """Like UserViewSet.send_*_email: build (in a thread, it saves), send, log."""
+    try:
+        email = await sync_to_async(build)(user)
+        await run_blocking(email.send, fail_silently=False)
+        logger.info(f"{sent} {user.email}")
+        return True
+    except Exception as e:
+        logger.error(f"{failed} {user.email}: {str(e)}")
+        return False
+
+
+@async_action(UserViewSet, 'resend_verification')
+async def resend_verification(view, request):
+    serializer = view.get_serializer(data=request.data)
+    if not serializer.is_valid():
+        return await respond(view, serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        user = await sync_to_async(User.objects.get)(email=serializer.validated_data['email'])
+    except User.DoesNotExist:
+        # For security reasons, don't reveal if the email exists
+        return await respond(view, {
+            'status': 'success',
+            'message': 'If the email exists and is not verified, a new code has been sent'
+        })
+    if user.email_verified:
+        return await respond(view, {
+            'status': 'error',
+            'message': 'Email is already verified'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    if await _send(verification_email, user, 'Verification code sent to', 'Failed to send verification code to'):
+        return await respond(view, {
+            'status': 'success',
+            'message': 'New verification code sent'
+        })
+    return await respond(view, {
+        'status': 'error',
+        'message': 'Failed to send verification code'
+    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@async_action(UserViewSet, 'forgot_password')
+async def forgot_password(view, request):
+    serializer = view.get_serializer(data=request.data)
+    if not serializer.is_valid():
+        return await respond(view, serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    response_data = {
+        'status': 'success',
+        'message': 'Password reset instructions sent to your email if account exists'
+    }
+    try:
+        user = await sync_to_async(User.objects.get)(email=serializer.validated_data['email'])
+    except User.DoesNotExist:
+        # Return same message even if user doesn't exist (security)
+        return await respond(view, response_data)
+
+    email_sent = await _send(
+        reset_password_email, user, 'Password reset email sent to', 'Failed to send password reset email to'
+    )
+    if not email_sent and settings.DEBUG:
+        response_data['reset_token'] = user.reset_password_token
+    return await respond(view, response_data)
@@ -0,0 +1,79 @@
+import os
+import time
+from multiprocessing import Pool
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+
+def _run_hasher(hasher_path, duration):
+    """Hash a fixed password for `duration` seconds and return (count, elapsed)."""
+    hasher = import_string(hasher_path)()
+    salt = hasher.salt()
+    count = 0
+    start = time.perf_counter()
+    deadline = start + duration
+    while time.perf_counter() < deadline:
+        hasher.encode('benchmark-password', salt)
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def _run_hasher_star(args):
+    return _run_hasher(*args)
+
+
+class Command(BaseCommand):
+    help = 'Measure password hashes per second per core for the configured hashers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hasher', action='append', dest='hashers',
+            help='Dotted path of a hasher to benchmark (repeatable). '
+                 'Defaults to every entry in PASSWORD_HASHERS.'
+        )
+        parser.add_argument(
+            '--duration', type=float, default=2.0,
+            help='Seconds to hash for, per hasher (default: 2)'
+        )
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Run this many hashing processes in parallel to measure '
+                 'aggregate throughput (default: 1)'
+        )
+
+    def handle(self, *args, **options):
+        hashers = options['hashers'] or settings.PASSWORD_HASHERS
+        duration = options['duration']
+        processes = options['processes']
+        if duration <= 0:
+            raise CommandError('--duration must be positive')
+        if processes < 1:
+            raise CommandError('--processes must be at least 1')
+
+        cores = os.cpu_count() or 1
+        self.stdout.write(
+            f"Profile: {getattr(settings, 'PASSWORD_HASHER_PROFILE', 'custom')}, "
+            f"CPU cores: {cores}, processes: {processes}, duration: {duration}s"
+        )
+
+        for hasher_path in hashers:
+            try:
+                if processes == 1:
+                    results = [_run_hasher(hasher_path, duration)]
+                else:
+                    with Pool(processes) as pool:
+                        results = pool.map(_run_hasher_star, [(hasher_path, duration)] * processes)
+            except (ImportError, ValueError) as e:
+                self.stdout.write(self.style.WARNING(f"{hasher_path}: unavailable ({e})"))
+                continue
+
+            per_core = sum(count / elapsed for count, elapsed in results) / len(results)
+            aggregate = sum(count / elapsed for count, elapsed in results)
+            self.stdout.write(
+                f"{hasher_path}: {per_core:,.1f} hashes/s per core "
+                f"({1000 / per_core:.2f} ms/hash), "
+                f"{aggregate:,.1f} hashes/s across {processes} process(es), "
+                f"~{per_core * cores:,.0f} logins/s at {cores} cores"
+            )
@@ -0,0 +1,189 @@
+import csv
+import json
+import time
+from itertools import islice
+from multiprocessing import Pool
+
+from django.contrib.auth.base_user import BaseUserManager
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models, transaction
+
+from users.models import BusinessOwnerProfile, User, UserProfile
+
+USER_FIELDS = (
+    'first_name', 'last_name', 'role', 'status', 'provider', 'provider_id',
+    'email_verified', 'interests', 'image',
+)
+TRUE_VALUES = ('1', 'true', 'yes', 'y', 't')
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield row
+
+
+def _read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _coerce(field, value):
+    """Convert a raw CSV/JSON value into something the model field accepts."""
+    if value is None:
+        return None
+    if isinstance(field, models.JSONField) and isinstance(value, str):
+        return json.loads(value) if value.strip() else field.get_default()
+    if isinstance(field, models.BooleanField) and isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    if isinstance(value, str) and value == '' and field.null:
+        return None
+    return value
+
+
+def _model_kwargs(model, row, names=None, prefix=''):
+    """Pick the columns of `row` that map onto concrete fields of `model`."""
+    kwargs = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.is_relation:
+            continue
+        if names is not None and field.name not in names:
+            continue
+        key = f'{prefix}{field.name}'
+        if key in row:
+            kwargs[field.name] = _coerce(field, row[key])
+    return kwargs
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk import users from a CSV or JSONL file. Users, profiles and business '
+        'owner profiles are inserted with bulk_create in chunks, bypassing the '
+        'per-row post_save signals. Required columns: email, username. Optional: '
+        'password or password_hash, first_name, last_name, role, status, '
+        'email_verified, interests, profile_<field> for UserProfile and '
+        'the business_* fields of BusinessOwnerProfile.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSONL file to import')
+        parser.add_argument(
+            '--format', choices=['csv', 'jsonl'],
+            help='Input format (default: guessed from the file extension)'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Rows per bulk_create chunk and transaction (default: 1000)'
+        )
+        parser.add_argument(
+            '--hash-workers', type=int, default=1,
+            help='Processes used to hash plaintext passwords (default: 1). Rows '
+                 'that already carry a password_hash column skip hashing.'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        rows = _read_jsonl(path) if fmt == 'jsonl' else _read_csv(path)
+        pool = Pool(options['hash_workers']) if options['hash_workers'] > 1 else None
+
+        created = skipped = 0
+        seen_emails, seen_usernames = set(), set()
+        start = time.perf_counter()
+        try:
+            for chunk in _chunks(rows, batch_size):
+                chunk_created, chunk_skipped = self.import_chunk(
+                    chunk, pool, seen_emails, seen_usernames
+                )
+                created += chunk_created
+                skipped += chunk_skipped
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f"{created + skipped} rows processed, {created} created, "
+                    f"{skipped} skipped ({(created + skipped) / elapsed:,.0f} rows/s)"
+                )
+        except (OSError, ValueError, csv.Error) as e:
+            raise CommandError(f'Failed to read {path}: {e}')
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {created} users ({skipped} skipped) in {elapsed:.1f}s, "
+            f"{created / elapsed if elapsed else 0:,.0f} users/s"
+        ))
+
+    def import_chunk(self, chunk, pool, seen_emails, seen_usernames):
+        normalize_email = BaseUserManager.normalize_email
+        candidates = []
+        for row in chunk:
+            email = normalize_email((row.get('email') or '').strip())
+            username = (row.get('username') or '').strip()
+            if not email or not username or email in seen_emails or username in seen_usernames:
+                continue
+            seen_emails.add(email)
+            seen_usernames.add(username)
+            candidates.append((email, username, row))
+
+        # One query per chunk to drop rows that collide with existing accounts.
+        existing = User.objects.filter(
+            models.Q(email__in=[c[0] for c in candidates]) |
+            models.Q(username__in=[c[1] for c in candidates])
+        ).values_list('email', 'username')
+        taken_emails = {e for e, _ in existing}
+        taken_usernames = {u for _, u in existing}
+        candidates = [
+            c for c in candidates
+            if c[0] not in taken_emails and c[1] not in taken_usernames
+        ]
+
+        plaintext = [
+            row.get('password') or None
+            for _, _, row in candidates if not row.get('password_hash')
+        ]
+        if pool is not None and plaintext:
+            hashed = iter(pool.map(make_password, plaintext, chunksize=max(1, len(plaintext) // 32)))
+        else:
+            hashed = iter([make_password(p) for p in plaintext])
+
+        users, profiles, business_profiles = [], [], []
+        for email, username, row in candidates:
+            password = row.get('password_hash') or next(hashed)
+            user = User(
+                email=email,
+                username=username,
+                password=password,
+                **_model_kwargs(User, row, names=USER_FIELDS)
+            )
+            users.append(user)
+            profiles.append(UserProfile(user=user, **_model_kwargs(UserProfile, row, prefix='profile_')))
+            if user.role == 'business_owner':
+                business_profiles.append(
+                    BusinessOwnerProfile(user=user, **_model_kwargs(BusinessOwnerProfile, row))
+                )
+
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+            UserProfile.objects.bulk_create(profiles)
+            BusinessOwnerProfile.objects.bulk_create(business_profiles)
+
+        return len(users), len(chunk) - len(users)
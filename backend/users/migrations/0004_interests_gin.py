@@ -0,0 +1,15 @@
+from django.db import migrations
+
+from core.db.operations import AddJSONPathIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_user_status'),
+    ]
+
+    operations = [
+        AddJSONPathIndex(model_name='user', field='interests', name='user_interests_gin'),
+        AddJSONPathIndex(model_name='userprofile', field='travel_interests', name='userprofile_interests_gin'),
+    ]
@@ -75,6 +75,7 @@ class User(AbstractUser):
     reset_password_expires = models.DateTimeField(blank=True, null=True)
     login_attempts = models.IntegerField(default=0)
     lock_until = models.DateTimeField(blank=True, null=True)
+    # GIN-indexed on PostgreSQL; filter with interests__array_contains.
     interests = models.JSONField(default=list)
     image = models.CharField(max_length=200, blank=True, null=True)
     
@@ -161,6 +162,7 @@ class UserProfile(models.Model):
     address = models.CharField(max_length=255, blank=True)
     preferred_language = models.CharField(max_length=10, default='en')
     preferred_currency = models.CharField(max_length=3, default='ETB')
+    # GIN-indexed on PostgreSQL; filter with travel_interests__array_contains.
     travel_interests = models.JSONField(default=list)
     accommodation_types = models.JSONField(default=list)
     budget_range = models.CharField(max_length=20, choices=BUDGET_RANGE_CHOICES, default='Mid-range')
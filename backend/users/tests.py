@@ -1,3 +1,122 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+from io import StringIO
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.core import mail
+from django.core.management import call_command
+from django.test import AsyncRequestFactory, TestCase, override_settings
+
+from . import async_views
+from .models import BusinessOwnerProfile, User, UserProfile
+
+
+class PasswordHasherProfileTests(TestCase):
+    def test_test_runner_uses_fast_profile(self):
+        self.assertEqual(settings.PASSWORD_HASHER_PROFILE, 'fast')
+        self.assertTrue(make_password('testpass123').startswith('md5$'))
+
+    @override_settings(
+        PASSWORD_HASHERS=['users.hashers.TunedPBKDF2PasswordHasher'],
+        PBKDF2_ITERATIONS=1000,
+    )
+    def test_pbkdf2_iterations_come_from_settings(self):
+        encoded = make_password('testpass123')
+        self.assertTrue(encoded.startswith('pbkdf2_sha256$1000$'))
+
+    @override_settings(
+        PASSWORD_HASHERS=['users.hashers.TunedPBKDF2PasswordHasher'],
+        PBKDF2_ITERATIONS=1000,
+    )
+    def test_hash_with_old_iterations_must_update(self):
+        hasher = get_hasher('default')
+        encoded = hasher.encode('testpass123', hasher.salt(), iterations=500)
+        self.assertTrue(hasher.must_update(encoded))
+
+    def test_benchmark_command_reports_rate(self):
+        out = StringIO()
+        call_command(
+            'benchmark_hashers', '--duration', '0.05',
+            '--hasher', 'django.contrib.auth.hashers.MD5PasswordHasher',
+            stdout=out,
+        )
+        self.assertIn('hashes/s per core', out.getvalue())
+
+
+class BulkImportUsersTests(TestCase):
+    def write_file(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_imports_users_with_profiles(self):
+        path = self.write_file('.csv', (
+            'email,username,password,first_name,last_name,role,profile_city,business_name\n'
+            'abebe@example.com,abebe,secret123,Abebe,Kebede,user,Gondar,\n'
+            'hotel@example.com,hotel,secret123,Hotel,Owner,business_owner,,Hotel Addis\n'
+        ))
+        call_command('bulk_import_users', path, stdout=StringIO())
+
+        self.assertEqual(User.objects.count(), 2)
+        abebe = User.objects.get(username='abebe')
+        self.assertTrue(abebe.check_password('secret123'))
+        self.assertEqual(abebe.profile.city, 'Gondar')
+        self.assertEqual(UserProfile.objects.count(), 2)
+        self.assertEqual(
+            BusinessOwnerProfile.objects.get().business_name, 'Hotel Addis'
+        )
+
+    def test_skips_existing_and_duplicate_rows(self):
+        User.objects.create_user(
+            email='taken@example.com', username='taken', password='secret123'
+        )
+        path = self.write_file('.jsonl', (
+            '{"email": "taken@example.com", "username": "other"}\n'
+            '{"email": "new@example.com", "username": "new", "interests": ["hiking"]}\n'
+            '{"email": "new@example.com", "username": "new2"}\n'
+        ))
+        out = StringIO()
+        call_command('bulk_import_users', path, '--batch-size', '2', stdout=out)
+
+        self.assertEqual(User.objects.count(), 2)
+        self.assertEqual(User.objects.get(username='new').interests, ['hiking'])
+        self.assertIn('Imported 1 users (2 skipped)', out.getvalue())
+
+
+class AsyncEmailViewTests(TestCase):
+    """The ASYNC_VIEWS versions answer like the UserViewSet actions."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='async@example.com', username='async', password='secret123')
+
+    async def post(self, view, data):
+        request = AsyncRequestFactory().post('/', json.dumps(data), content_type='application/json')
+        response = await view(request)
+        return response.status_code, json.loads(response.content)
+
+    async def test_forgot_password_issues_reset_token(self):
+        status, data = await self.post(async_views.forgot_password, {'email': 'async@example.com'})
+        self.assertEqual(status, 200)
+        self.assertEqual(data['status'], 'success')
+        self.assertNotIn('reset_token', data)
+        user = await sync_to_async(User.objects.get)(pk=self.user.pk)
+        self.assertTrue(user.reset_password_token)
+
+    async def test_unknown_email_gets_the_same_answer(self):
+        status, data = await self.post(async_views.forgot_password, {'email': 'nobody@example.com'})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(mail.outbox), 0)
+
+    async def test_resend_verification(self):
+        status, data = await self.post(async_views.resend_verification, {'email': 'async@example.com'})
+        self.assertEqual((status, data['message']), (200, 'New verification code sent'))
+        self.assertIn('Verify Your Email', mail.outbox[0].subject)
+
+        status, data = await self.post(async_views.resend_verification, {'email': 'not-an-email'})
+        self.assertEqual(status, 400)
+        self.assertIn('email', data)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
@@ -47,6 +48,19 @@ urlpatterns = [
     ])),
 ]
 
+if settings.ASYNC_VIEWS:
+    from . import async_views
+
+    # Ahead of the router, which serves the same actions at underscored paths.
+    urlpatterns[:0] = [
+        path(route, view, name=name)
+        for routes, view, name in [
+            (('forgot-password/', 'forgot_password/'), async_views.forgot_password, 'user-forgot-password'),
+            (('resend_verification/',), async_views.resend_verification, 'user-resend-verification'),
+        ]
+        for route in routes
+    ]
+
 """
 API Endpoints Documentation:
 
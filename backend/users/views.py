@@ -27,10 +27,56 @@ from django.utils.html import strip_tags
 from django.contrib.auth import authenticate
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from core.listing import SparseFieldsMixin
 
 logger = logging.getLogger(__name__)
 
-class UserViewSet(viewsets.ModelViewSet):
+
+def verification_email(user):
+    """Give user a new verification code and build the email carrying it."""
+    verification_code = user.generate_verification_code()
+
+    # Create email subject and message
+    subject = 'Welcome to EthioTravel - Verify Your Email'
+    html_message = render_to_string('emails/verification_code.html', {
+        'verification_code': verification_code,
+        'user': user
+    })
+
+    # Send email using EmailMessage for better control
+    email = EmailMessage(
+        subject=subject,
+        body=html_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+        reply_to=[settings.DEFAULT_FROM_EMAIL],
+    )
+    email.content_subtype = "html"  # Main content is now text/html
+    return email
+
+
+def reset_password_email(user):
+    """Give user a new password reset token and build the email carrying it."""
+    reset_token = user.generate_reset_password_token()
+
+    # Create email subject and message
+    subject = 'Reset Your Password - EthioTravel'
+    html_message = render_to_string('emails/reset_password.html', {
+        'reset_token': reset_token,
+        'user': user
+    })
+
+    email = EmailMessage(
+        subject=subject,
+        body=html_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+        reply_to=[settings.DEFAULT_FROM_EMAIL],
+    )
+    email.content_subtype = "html"  # Main content is now text/html
+    return email
+
+class UserViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]  # Default to authenticated
@@ -69,26 +115,7 @@ class UserViewSet(viewsets.ModelViewSet):
 
     def send_verification_email(self, user):
         try:
-            verification_code = user.generate_verification_code()
-            
-            # Create email subject and message
-            subject = 'Welcome to EthioTravel - Verify Your Email'
-            html_message = render_to_string('emails/verification_code.html', {
-                'verification_code': verification_code,
-                'user': user
-            })
-            
-            # Send email using EmailMessage for better control
-            email = EmailMessage(
-                subject=subject,
-                body=html_message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[user.email],
-                reply_to=[settings.DEFAULT_FROM_EMAIL],
-            )
-            email.content_subtype = "html"  # Main content is now text/html
-            email.send(fail_silently=False)
-            
+            verification_email(user).send(fail_silently=False)
             logger.info(f"Verification code sent to {user.email}")
             return True
         except Exception as e:
@@ -289,26 +316,7 @@ class UserViewSet(viewsets.ModelViewSet):
 
     def send_reset_password_email(self, user):
         try:
-            reset_token = user.generate_reset_password_token()
-            
-            # Create email subject and message
-            subject = 'Reset Your Password - EthioTravel'
-            html_message = render_to_string('emails/reset_password.html', {
-                'reset_token': reset_token,
-                'user': user
-            })
-            
-            # Send email using EmailMessage for better control
-            email = EmailMessage(
-                subject=subject,
-                body=html_message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[user.email],
-                reply_to=[settings.DEFAULT_FROM_EMAIL],
-            )
-            email.content_subtype = "html"  # Main content is now text/html
-            email.send(fail_silently=False)
-            
+            reset_password_email(user).send(fail_silently=False)
             logger.info(f"Password reset email sent to {user.email}")
             return True
         except Exception as e:
@@ -746,7 +754,7 @@ class UserViewSet(viewsets.ModelViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-class ProfileViewSet(viewsets.ModelViewSet):
+class ProfileViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = UserProfile.objects.all()
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
@@ -797,7 +805,7 @@ class ProfileViewSet(viewsets.ModelViewSet):
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
-class BusinessProfileViewSet(viewsets.ModelViewSet):
+class BusinessProfileViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = BusinessOwnerProfile.objects.all()
     serializer_class = BusinessProfileSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]